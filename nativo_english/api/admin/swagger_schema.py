@@ -11,7 +11,7 @@ GET_USER_LIST_SCHEMA = {
     'tags': ['Admin'],
     'operation_id': 'get_users_list',
     'summary': 'Get All users (Can be accessed by user with admin role only)',
-    'description': 'Lists all users (if filter is applied for role/suspend)',
+    'description': 'Lists all users, newest first (if filter is applied for role/suspend). Pass `cursor` (empty for the first page) to use keyset pagination instead of page numbers, then the `next_cursor` of a page to get the next one.',
     'parameters': [
         OpenApiParameter(
             name='role',
@@ -34,6 +34,27 @@ GET_USER_LIST_SCHEMA = {
             required=False,
             type=OpenApiTypes.INT,
         ),
+        OpenApiParameter(
+            name='page_size',
+            location=OpenApiParameter.QUERY,
+            description='Number of users per page, at most 100 (default 10)',
+            required=False,
+            type=OpenApiTypes.INT,
+        ),
+        OpenApiParameter(
+            name='estimate_total',
+            location=OpenApiParameter.QUERY,
+            description="Estimated total - Return the planner's estimate of count instead of an exact count, cheaper on large user tables",
+            required=False,
+            type=OpenApiTypes.BOOL,
+        ),
+        OpenApiParameter(
+            name='cursor',
+            location=OpenApiParameter.QUERY,
+            description='Keyset pagination - next_cursor of the previous page, empty for the first page (page and estimate_total are ignored)',
+            required=False,
+            type=OpenApiTypes.STR,
+        ),
     ],
     'responses': {
         200: OpenApiResponse(
@@ -42,8 +63,10 @@ GET_USER_LIST_SCHEMA = {
                 'type': 'object',
                 'properties': {
                     'count': {'type': 'integer'},
+                    'is_total_estimated': {'type': 'boolean'},
                     'num_pages': {'type': 'integer'},
                     'current_page': {'type': 'integer'},
+                    'next_cursor': {'type': 'string', 'nullable': True, 'description': 'Keyset pagination mode only'},
                     'results': {
                         'type': 'array',
                         'items': {
@@ -54,6 +77,7 @@ GET_USER_LIST_SCHEMA = {
                                 'email': {'type': 'string'},
                                 'first_name': {'type': 'string'},
                                 'last_name': {'type': 'string'},
+                                'role': {'type': 'string'},
                                 'is_active': {'type': 'boolean'},
                             },
                         },
@@ -258,6 +282,244 @@ UPDATE_USER_STATUS_SCHEMA = {
         401: SWAGGER_ERROR_SAMPLE_RESPONSES_ADMIN_ROLE['401'],
     },
 }
+
+POST_ADMIN_USERS_BULK_ROLE_SCHEMA = {
+    'tags': ['Admin'],
+    'summary': 'Change the role of many users at once (Admin access only)',
+    'operation_id': 'bulk_update_users_role',
+    'description': 'Sets the role of the users selected by ids and / or filter in a single update, and revokes the tokens they were issued before. Users already holding the role and the admin running the operation are left untouched.',
+    'request': {
+        'application/json': {
+            'type': 'object',
+            'properties': {
+                'role': {'type': 'string', 'enum': ['admin', 'teacher', 'student'], 'example': 'teacher'},
+                'ids': {'type': 'array', 'items': {'type': 'integer'}, 'example': [12, 15, 18], 'description': 'Users to change (at most 10000)'},
+                'filter': {
+                    'type': 'object',
+                    'description': 'Change the users matching these values, combined with ids when both are given',
+                    'properties': {
+                        'role': {'type': 'string', 'enum': ['admin', 'teacher', 'student']},
+                        'is_active': {'type': 'boolean'},
+                    },
+                },
+            },
+            'required': ['role'],
+        },
+    },
+    'responses': {
+        200: OpenApiResponse(
+            description='Role of the selected users updated',
+            response={
+                'type': 'object',
+                'properties': {
+                    'status': {'type': 'integer', 'example': 200},
+                    'data': {
+                        'type': 'object',
+                        'properties': {
+                            'updated_count': {'type': 'integer', 'example': 250},
+                        },
+                    },
+                },
+            },
+        ),
+        400: SWAGGER_ERROR_SAMPLE_RESPONSES_ADMIN_ROLE['400'],
+        401: SWAGGER_ERROR_SAMPLE_RESPONSES_ADMIN_ROLE['401'],
+    },
+}
+
+POST_ADMIN_USERS_BULK_STATUS_SCHEMA = {
+    'tags': ['Admin'],
+    'summary': 'Activate or suspend many users at once (Admin access only)',
+    'operation_id': 'bulk_update_users_status',
+    'description': 'Activates or suspends the users selected by ids and / or filter in a single update. Suspended users have the tokens issued before revoked right away. Users already in that status and the admin running the operation are left untouched.',
+    'parameters': [
+        OpenApiParameter(
+            name='action',
+            location='path',
+            description='activate or suspend',
+            required=True,
+            type=OpenApiTypes.STR,
+            enum=['activate', 'suspend'],
+        ),
+    ],
+    'request': {
+        'application/json': {
+            'type': 'object',
+            'properties': {
+                'ids': {'type': 'array', 'items': {'type': 'integer'}, 'example': [12, 15, 18], 'description': 'Users to change (at most 10000)'},
+                'filter': {
+                    'type': 'object',
+                    'description': 'Change the users matching these values, combined with ids when both are given',
+                    'properties': {
+                        'role': {'type': 'string', 'enum': ['admin', 'teacher', 'student']},
+                        'is_active': {'type': 'boolean'},
+                    },
+                },
+            },
+        },
+    },
+    'responses': {
+        200: OpenApiResponse(
+            description='Status of the selected users updated',
+            response={
+                'type': 'object',
+                'properties': {
+                    'status': {'type': 'integer', 'example': 200},
+                    'data': {
+                        'type': 'object',
+                        'properties': {
+                            'updated_count': {'type': 'integer', 'example': 250},
+                        },
+                    },
+                },
+            },
+        ),
+        400: SWAGGER_ERROR_SAMPLE_RESPONSES_ADMIN_ROLE['400'],
+        401: SWAGGER_ERROR_SAMPLE_RESPONSES_ADMIN_ROLE['401'],
+    },
+}
+
+POST_ADMIN_USER_IMPORT_SCHEMA = {
+    'tags': ['Admin'],
+    'summary': 'Bulk import users from a CSV / JSONL file (Admin access only)',
+    'operation_id': 'import_users',
+    'description': 'Uploads a CSV (with a header row) or JSON Lines file of users (username, email, and optionally password, first_name, last_name, role (default student), preferred_lang) and imports it in the background. Poll the returned job for its progress, then get the rows that could not be imported from its errors. Users without a password get an unusable one and set it through forgot password.',
+    'request': {
+        'multipart/form-data': {
+            'type': 'object',
+            'properties': {
+                'file': {'type': 'string', 'format': 'binary', 'description': 'CSV or JSONL file of users'},
+                'format': {'type': 'string', 'enum': ['csv', 'jsonl'], 'description': 'Format of the file, told by its extension when omitted'},
+            },
+            'required': ['file'],
+        },
+    },
+    'responses': {
+        202: OpenApiResponse(
+            description='Import job created',
+            response={
+                'type': 'object',
+                'properties': {
+                    'status': {'type': 'integer', 'example': 202},
+                    'data': {
+                        'type': 'object',
+                        'properties': {
+                            'id': {'type': 'integer', 'example': 12},
+                            'file_name': {'type': 'string', 'example': 'school-students.csv'},
+                            'file_format': {'type': 'string', 'example': 'csv'},
+                            'status': {'type': 'string', 'enum': ['pending', 'running', 'completed', 'failed'], 'example': 'running'},
+                            'total_rows': {'type': 'integer', 'nullable': True, 'example': 50000},
+                            'processed_rows': {'type': 'integer', 'example': 21000},
+                            'created_count': {'type': 'integer', 'example': 20950},
+                            'error_count': {'type': 'integer', 'example': 50},
+                            'progress': {'type': 'number', 'example': 42.0},
+                            'failure_reason': {'type': 'string', 'example': ''},
+                            'created_at': {'type': 'string', 'format': 'date-time'},
+                            'started_at': {'type': 'string', 'format': 'date-time', 'nullable': True},
+                            'finished_at': {'type': 'string', 'format': 'date-time', 'nullable': True},
+                        },
+                    },
+                },
+            },
+        ),
+        400: SWAGGER_ERROR_SAMPLE_RESPONSES_ADMIN_ROLE['400'],
+        401: SWAGGER_ERROR_SAMPLE_RESPONSES_ADMIN_ROLE['401'],
+    },
+}
+
+GET_ADMIN_USER_IMPORT_JOB_SCHEMA = {
+    'tags': ['Admin'],
+    'summary': 'Get the progress of a user import job (Admin access only)',
+    'operation_id': 'get_user_import_job',
+    'description': 'Returns the status of a bulk user import job and how many rows were processed, created and rejected so far',
+    'responses': {
+        200: OpenApiResponse(
+            description='Import job successfully retrieved',
+            response={
+                'type': 'object',
+                'properties': {
+                    'status': {'type': 'integer', 'example': 200},
+                    'data': {
+                        'type': 'object',
+                        'properties': {
+                            'id': {'type': 'integer', 'example': 12},
+                            'file_name': {'type': 'string', 'example': 'school-students.csv'},
+                            'file_format': {'type': 'string', 'example': 'csv'},
+                            'status': {'type': 'string', 'enum': ['pending', 'running', 'completed', 'failed'], 'example': 'running'},
+                            'total_rows': {'type': 'integer', 'nullable': True, 'example': 50000},
+                            'processed_rows': {'type': 'integer', 'example': 21000},
+                            'created_count': {'type': 'integer', 'example': 20950},
+                            'error_count': {'type': 'integer', 'example': 50},
+                            'progress': {'type': 'number', 'example': 42.0},
+                            'failure_reason': {'type': 'string', 'example': ''},
+                            'created_at': {'type': 'string', 'format': 'date-time'},
+                            'started_at': {'type': 'string', 'format': 'date-time', 'nullable': True},
+                            'finished_at': {'type': 'string', 'format': 'date-time', 'nullable': True},
+                        },
+                    },
+                },
+            },
+        ),
+        401: SWAGGER_ERROR_SAMPLE_RESPONSES_ADMIN_ROLE['401'],
+        404: SWAGGER_ERROR_SAMPLE_RESPONSES_ADMIN_ROLE['404'],
+    },
+}
+
+GET_ADMIN_USER_IMPORT_ERRORS_SCHEMA = {
+    'tags': ['Admin'],
+    'summary': 'Get the error report of a user import job (Admin access only)',
+    'operation_id': 'get_user_import_errors',
+    'description': 'Lists the rows of the file that could not be imported, in file order, with the reason per field. Pass the `next_cursor` of a page as `cursor` to get the next one.',
+    'parameters': [
+        OpenApiParameter(
+            name='cursor',
+            location=OpenApiParameter.QUERY,
+            description='Opaque cursor returned as next_cursor by the previous page (optional)',
+            required=False,
+            type=OpenApiTypes.STR,
+        ),
+        OpenApiParameter(
+            name='page_size',
+            location=OpenApiParameter.QUERY,
+            description='Number of rows per page, at most 1000 (default 100)',
+            required=False,
+            type=OpenApiTypes.INT,
+        ),
+    ],
+    'responses': {
+        200: OpenApiResponse(
+            description='Import errors successfully retrieved',
+            response={
+                'type': 'object',
+                'properties': {
+                    'status': {'type': 'integer', 'example': 200},
+                    'data': {
+                        'type': 'object',
+                        'properties': {
+                            'errors': {
+                                'type': 'array',
+                                'items': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'row_number': {'type': 'integer', 'example': 42},
+                                        'username': {'type': 'string', 'example': 'jane.doe'},
+                                        'email': {'type': 'string', 'example': 'jane@example'},
+                                        'errors': {'type': 'object', 'example': {'email': 'Enter a valid email address'}},
+                                    },
+                                },
+                            },
+                            'next_cursor': {'type': 'string', 'nullable': True},
+                            'page_size': {'type': 'integer', 'example': 100},
+                        },
+                    },
+                },
+            },
+        ),
+        400: SWAGGER_ERROR_SAMPLE_RESPONSES_ADMIN_ROLE['400'],
+        401: SWAGGER_ERROR_SAMPLE_RESPONSES_ADMIN_ROLE['401'],
+        404: SWAGGER_ERROR_SAMPLE_RESPONSES_ADMIN_ROLE['404'],
+    },
+}
 # --------------------------------------------
 
 
@@ -277,6 +539,13 @@ GET_ADMIN_COURSE_LIST_SCHEMA = {
             required=False,
             type=OpenApiTypes.INT,
         ),
+        OpenApiParameter(
+            name="cursor",
+            location=OpenApiParameter.QUERY,
+            description="Cursor pagination - Pass an empty value for the first page, then the next_cursor of the previous page. page_num is ignored and no total count is returned in this mode",
+            required=False,
+            type=OpenApiTypes.STR,
+        ),
         OpenApiParameter(
             name="page_size",
             location=OpenApiParameter.QUERY,
@@ -326,7 +595,7 @@ GET_ADMIN_COURSE_LIST_SCHEMA = {
         OpenApiParameter(
             name="search",
             location=OpenApiParameter.QUERY,
-            description="Search - Search for courses this will be helpful to integrate with search bar",
+            description="Search - Search for courses this will be helpful to integrate with search bar, matches title and description (full text and partial words), use sort_by=relevance to rank the matches",
             required=False,
             type=OpenApiTypes.STR,  # You should use STR since it's a textual value
         ),
@@ -336,7 +605,7 @@ GET_ADMIN_COURSE_LIST_SCHEMA = {
             description="Sort By - Sort by fields",
             required=False,
             type=OpenApiTypes.STR,  # You should use STR since it's a textual value
-            enum=['course_id', 'title', 'mode', 'avg_rating', 'price', 'enrollment_count', 'created_at', 'updated_at']
+            enum=['course_id', 'title', 'mode', 'avg_rating', 'price', 'enrollment_count', 'created_at', 'updated_at', 'relevance']
         ),
         OpenApiParameter(
             name="sort_order",
@@ -352,6 +621,13 @@ GET_ADMIN_COURSE_LIST_SCHEMA = {
             description="Course Owner - Will return the courses of specific owner / teacher",
             required=False,
             type=OpenApiTypes.INT,
+        ),
+        OpenApiParameter(
+            name="estimate_total",
+            location=OpenApiParameter.QUERY,
+            description="Estimated total - Return the planner's estimate of total_count instead of an exact count, cheaper on large catalogs",
+            required=False,
+            type=OpenApiTypes.BOOL,
         )
     ],
     'responses': {
@@ -383,6 +659,7 @@ GET_ADMIN_COURSE_LIST_SCHEMA = {
                                 }
                             ],
                         "total_count": 1,
+                        "is_total_estimated": 'false',
                         "total_pages": 1,
                         "current_page": 1,
                         "page_size": 10  
@@ -648,4 +925,392 @@ GET_ADMIN_COURSE_ALL_LESSON_CONTENT_SCHEMA = {
     'summary': 'Get All Lesson content (Admin access only)',
     'operation_id': 'get_lesson_content_list',
     'description': 'Lists all lesson content'
-}
\ No newline at end of file
+}# --------------------------------------------
+
+
+# --------------------------------------------
+# Get course detail cache stats by Admin Schema
+# --------------------------------------------
+GET_ADMIN_COURSE_CACHE_STATS_SCHEMA = {
+    'tags': ['AdminCourse'],
+    'summary': 'Get course detail cache stats (Admin access only)',
+    'operation_id': 'get_course_cache_stats',
+    'description': 'Returns the hit / miss counters of the course detail cache shared by the admin and teacher course detail endpoints',
+    'responses': {
+        200: OpenApiResponse(
+            description='Course detail cache stats successfully retrieved',
+            response={
+                'type': 'object',
+                'properties': {
+                    'status': {'type': 'integer', 'example': 200},
+                    'data': {
+                        'type': 'object',
+                        'properties': {
+                            'hits': {'type': 'integer', 'example': 950},
+                            'misses': {'type': 'integer', 'example': 50},
+                            'hit_ratio': {'type': 'number', 'example': 0.95},
+                        },
+                    },
+                },
+            },
+        ),
+    },
+}
+# --------------------------------------------
+
+
+# --------------------------------------------
+# Get course tree by admin Schema
+# --------------------------------------------
+GET_ADMIN_COURSE_TREE_SCHEMA = {
+    'tags': ['AdminCourse'],
+    'summary': 'Retrieve the whole course tree by course ID (Admin access only)',
+    'operation_id': 'get_course_tree_by_id',
+    'description': 'Retrieves a course with its sections, active lessons (ordered by lesson_position) and their active content (ordered by lesson_content_position) in one request. Content is returned in the requested language, lessons without content in it fall back to English.',
+    'parameters': [
+        OpenApiParameter(
+            name="id",
+            location=OpenApiParameter.PATH,
+            description="Course ID",
+            required=True,
+            type=OpenApiTypes.INT
+        ),
+        OpenApiParameter(
+            name="language",
+            location=OpenApiParameter.QUERY,
+            description="Language of the lesson content, defaults to the Accept-Language header",
+            required=False,
+            type=OpenApiTypes.STR,
+            enum=['en', 'fr', 'es']
+        ),
+    ],
+    'responses': {
+        200: OpenApiResponse(
+            description='Course tree successfully retrieved',
+            response={
+                'type': 'object',
+                'properties': {
+                    'status': {'type': 'integer', 'example': 200},
+                    'data': {
+                        'type': 'object',
+                        'example': {
+                            'course_id': 1,
+                            'title': 'Advanced Python Programming',
+                            'language': 'en',
+                            'sections': [
+                                {
+                                    'section_id': 1,
+                                    'section_title': 'Getting started',
+                                    'section_description': 'Setup and basics',
+                                    'lessons': [
+                                        {
+                                            'lesson_id': 1,
+                                            'lesson_title': 'Installing Python',
+                                            'lesson_description': None,
+                                            'lesson_position': 1,
+                                            'language': 'en',
+                                            'contents': [
+                                                {
+                                                    'content_id': 1,
+                                                    'content_title': 'Introduction',
+                                                    'lesson_content_position': 1,
+                                                    'content_type': 'text',
+                                                    'content_text': 'Welcome to the course',
+                                                    'content_video_url': None,
+                                                    'content_audio_url': None,
+                                                    'content_image_url': None,
+                                                },
+                                            ],
+                                        },
+                                    ],
+                                },
+                            ],
+                        },
+                    },
+                },
+            },
+        ),
+        400: SWAGGER_ERROR_SAMPLE_RESPONSES_ADMIN_ROLE ['400'],
+        404: SWAGGER_ERROR_SAMPLE_RESPONSES_ADMIN_ROLE ['404'],
+    },
+}
+
+
+# --------------------------------------------
+# Get refresh token blacklist filter stats by admin Schema
+# --------------------------------------------
+GET_ADMIN_TOKEN_BLACKLIST_STATS_SCHEMA = {
+    'tags': ['Admin'],
+    'summary': 'Get refresh token blacklist filter stats (Admin access only)',
+    'operation_id': 'get_token_blacklist_stats',
+    'description': 'Returns the sizing and the counters of the Bloom filter checking refresh tokens against the blacklist, for the worker serving the request',
+    'responses': {
+        200: OpenApiResponse(
+            description='Token blacklist filter stats successfully retrieved',
+            response={
+                'type': 'object',
+                'properties': {
+                    'status': {'type': 'integer', 'example': 200},
+                    'data': {
+                        'type': 'object',
+                        'properties': {
+                            'checks': {'type': 'integer', 'example': 10000},
+                            'negatives': {'type': 'integer', 'example': 9985},
+                            'hits': {'type': 'integer', 'example': 14},
+                            'false_positives': {'type': 'integer', 'example': 1},
+                            'observed_error_rate': {'type': 'number', 'example': 0.0001},
+                            'pulls': {'type': 'integer', 'example': 12},
+                            'rebuilds': {'type': 'integer', 'example': 1},
+                            'synced_at': {'type': 'string', 'format': 'date-time', 'example': '2024-11-01T09:30:15Z'},
+                            'capacity': {'type': 'integer', 'example': 100000},
+                            'items': {'type': 'integer', 'example': 2500},
+                            'size_bits': {'type': 'integer', 'example': 1437759},
+                            'size_bytes': {'type': 'integer', 'example': 179720},
+                            'hash_count': {'type': 'integer', 'example': 10},
+                            'target_error_rate': {'type': 'number', 'example': 0.001},
+                            'estimated_error_rate': {'type': 'number', 'example': 0.0000001},
+                        },
+                    },
+                },
+            },
+        ),
+    },
+}
+
+GET_ADMIN_TASK_QUEUE_LATENCY_SCHEMA = {
+    'tags': ['Admin'],
+    'summary': 'Get Celery task queue latency stats (Admin access only)',
+    'operation_id': 'get_task_queue_latency',
+    'description': 'Returns, per task queue (priority, default, bulk), the percentiles of the time tasks waited for a worker (wait) and took to complete from publish (total) over the last minutes, and the share of the tasks completed within the target of the queue',
+    'parameters': [
+        OpenApiParameter(
+            name='minutes',
+            location=OpenApiParameter.QUERY,
+            description='Number of past minutes to aggregate, 1 to 60 (default 5)',
+            required=False,
+            type=OpenApiTypes.INT,
+        ),
+    ],
+    'responses': {
+        200: OpenApiResponse(
+            description='Task queue latency stats successfully retrieved',
+            response={
+                'type': 'object',
+                'properties': {
+                    'status': {'type': 'integer', 'example': 200},
+                    'data': {
+                        'type': 'object',
+                        'properties': {
+                            'minutes': {'type': 'integer', 'example': 5},
+                            'queues': {
+                                'type': 'object',
+                                'additionalProperties': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'target_seconds': {'type': 'number', 'example': 5.0},
+                                        'wait': {
+                                            'type': 'object',
+                                            'properties': {
+                                                'count': {'type': 'integer', 'example': 1200},
+                                                'p50': {'type': 'number', 'nullable': True, 'example': 0.25},
+                                                'p95': {'type': 'number', 'nullable': True, 'example': 1},
+                                                'p99': {'type': 'number', 'nullable': True, 'example': 2},
+                                            },
+                                        },
+                                        'total': {
+                                            'type': 'object',
+                                            'properties': {
+                                                'count': {'type': 'integer', 'example': 1200},
+                                                'p50': {'type': 'number', 'nullable': True, 'example': 0.25},
+                                                'p95': {'type': 'number', 'nullable': True, 'example': 1},
+                                                'p99': {'type': 'number', 'nullable': True, 'example': 2},
+                                                'within_target': {'type': 'number', 'nullable': True, 'example': 0.99},
+                                            },
+                                        },
+                                    },
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+        ),
+    },
+}
+
+GET_ADMIN_EMAIL_OUTBOX_STATS_SCHEMA = {
+    'tags': ['Admin'],
+    'summary': 'Get email outbox stats (Admin access only)',
+    'operation_id': 'get_email_outbox_stats',
+    'description': 'Returns the backlog (pending, due and failed emails, age of the oldest pending one) and the throughput (emails sent over the last minute and hour) of the email outbox',
+    'responses': {
+        200: OpenApiResponse(
+            description='Email outbox stats successfully retrieved',
+            response={
+                'type': 'object',
+                'properties': {
+                    'status': {'type': 'integer', 'example': 200},
+                    'data': {
+                        'type': 'object',
+                        'properties': {
+                            'pending': {'type': 'integer', 'example': 120},
+                            'due': {'type': 'integer', 'example': 100},
+                            'oldest_pending_seconds': {'type': 'number', 'nullable': True, 'example': 4.2},
+                            'failed': {'type': 'integer', 'example': 3},
+                            'sent_last_minute': {'type': 'integer', 'example': 850},
+                            'sent_last_hour': {'type': 'integer', 'example': 24000},
+                        },
+                    },
+                },
+            },
+        ),
+    },
+}
+# --------------------------------------------
+
+
+# --------------------------------------------
+# Export users, courses and enrollments by admin Schema
+# --------------------------------------------
+EXPORT_JOB_RESPONSE = {
+    'type': 'object',
+    'properties': {
+        'status': {'type': 'integer', 'example': 200},
+        'data': {
+            'type': 'object',
+            'properties': {
+                'job_id': {'type': 'string', 'example': '6f1c2d0e-8a4b-4c5e-9f1a-2b3c4d5e6f70'},
+                'status': {'type': 'string', 'enum': ['pending', 'running', 'completed', 'failed'], 'example': 'running'},
+                'rows': {'type': 'integer', 'nullable': True, 'example': 420000},
+                'file_name': {'type': 'string', 'nullable': True, 'example': None},
+                'size': {'type': 'integer', 'nullable': True, 'example': None},
+                'failure_reason': {'type': 'string', 'example': ''},
+            },
+        },
+    },
+}
+
+GET_ADMIN_EXPORT_SCHEMA = {
+    'tags': ['Admin'],
+    'summary': 'Stream an export of users, courses or enrollments (Admin access only)',
+    'operation_id': 'export_dataset',
+    'description': 'Downloads the users, courses or enrollments matching the filters as a CSV or JSON Lines file, streamed while it is read from the database. Exports estimated above EXPORT_SYNC_MAX_ROWS rows are refused, start an export job for them instead.',
+    'parameters': [
+        OpenApiParameter(
+            name='dataset',
+            location=OpenApiParameter.PATH,
+            description='Data to export: users, courses or enrollments',
+            required=True,
+            type=OpenApiTypes.STR,
+            enum=['users', 'courses', 'enrollments'],
+        ),
+        OpenApiParameter(
+            name='file_format',
+            location=OpenApiParameter.QUERY,
+            description='csv (default) or jsonl',
+            required=False,
+            type=OpenApiTypes.STR,
+            enum=['csv', 'jsonl'],
+        ),
+        OpenApiParameter(
+            name='gzip',
+            location=OpenApiParameter.QUERY,
+            description='Gzip the file, true or false (optional)',
+            required=False,
+            type=OpenApiTypes.BOOL,
+        ),
+        OpenApiParameter(
+            name='role',
+            location=OpenApiParameter.QUERY,
+            description='Users only, role of the users to export (optional)',
+            required=False,
+            type=OpenApiTypes.STR,
+        ),
+        OpenApiParameter(
+            name='is_active',
+            location=OpenApiParameter.QUERY,
+            description='Filter by active status, true or false (optional)',
+            required=False,
+            type=OpenApiTypes.BOOL,
+        ),
+        OpenApiParameter(
+            name='course_id',
+            location=OpenApiParameter.QUERY,
+            description='Enrollments only, course of the enrollments to export (optional)',
+            required=False,
+            type=OpenApiTypes.INT,
+        ),
+    ],
+    'responses': {
+        (200, 'text/csv'): OpenApiResponse(response=OpenApiTypes.BINARY, description='CSV file (header row first), or gzip when gzip is true'),
+        (200, 'application/x-ndjson'): OpenApiResponse(response=OpenApiTypes.BINARY, description='JSON Lines file, one object per row'),
+        400: SWAGGER_ERROR_SAMPLE_RESPONSES_ADMIN_ROLE['400'],
+        401: SWAGGER_ERROR_SAMPLE_RESPONSES_ADMIN_ROLE['401'],
+    },
+}
+
+POST_ADMIN_EXPORT_JOB_SCHEMA = {
+    'tags': ['Admin'],
+    'summary': 'Start an export job of users, courses or enrollments (Admin access only)',
+    'operation_id': 'start_export_job',
+    'description': 'Writes the users, courses or enrollments matching the filter to a CSV or JSON Lines file in the background, for exports too large to stream. Poll the returned job, then download its file once completed. Files are kept EXPORT_RETENTION_HOURS hours.',
+    'parameters': [
+        OpenApiParameter(
+            name='dataset',
+            location=OpenApiParameter.PATH,
+            description='Data to export: users, courses or enrollments',
+            required=True,
+            type=OpenApiTypes.STR,
+            enum=['users', 'courses', 'enrollments'],
+        ),
+    ],
+    'request': {
+        'application/json': {
+            'type': 'object',
+            'properties': {
+                'file_format': {'type': 'string', 'enum': ['csv', 'jsonl'], 'example': 'csv'},
+                'gzip': {'type': 'boolean', 'example': True},
+                'filter': {
+                    'type': 'object',
+                    'description': 'role (users), is_active, course_id (enrollments)',
+                    'properties': {
+                        'role': {'type': 'string', 'example': 'student'},
+                        'is_active': {'type': 'boolean', 'example': True},
+                        'course_id': {'type': 'integer', 'example': 4},
+                    },
+                },
+            },
+        },
+    },
+    'responses': {
+        202: OpenApiResponse(description='Export job started', response=EXPORT_JOB_RESPONSE),
+        400: SWAGGER_ERROR_SAMPLE_RESPONSES_ADMIN_ROLE['400'],
+        401: SWAGGER_ERROR_SAMPLE_RESPONSES_ADMIN_ROLE['401'],
+    },
+}
+
+GET_ADMIN_EXPORT_JOB_SCHEMA = {
+    'tags': ['Admin'],
+    'summary': 'Get the progress of an export job (Admin access only)',
+    'operation_id': 'get_export_job',
+    'description': 'Returns the status of an export job and the rows written so far, and the file name and size once completed. Unknown or expired job ids answer 404.',
+    'responses': {
+        200: OpenApiResponse(description='Export job successfully retrieved', response=EXPORT_JOB_RESPONSE),
+        401: SWAGGER_ERROR_SAMPLE_RESPONSES_ADMIN_ROLE['401'],
+        404: SWAGGER_ERROR_SAMPLE_RESPONSES_ADMIN_ROLE['404'],
+    },
+}
+
+GET_ADMIN_EXPORT_DOWNLOAD_SCHEMA = {
+    'tags': ['Admin'],
+    'summary': 'Download the file of an export job (Admin access only)',
+    'operation_id': 'download_export',
+    'description': 'Downloads the file written by a completed export job',
+    'responses': {
+        (200, 'application/octet-stream'): OpenApiResponse(response=OpenApiTypes.BINARY, description='Export file'),
+        400: SWAGGER_ERROR_SAMPLE_RESPONSES_ADMIN_ROLE['400'],
+        401: SWAGGER_ERROR_SAMPLE_RESPONSES_ADMIN_ROLE['401'],
+        404: SWAGGER_ERROR_SAMPLE_RESPONSES_ADMIN_ROLE['404'],
+    },
+}
+# --------------------------------------------
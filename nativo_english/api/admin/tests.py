@@ -1,3 +1,143 @@
-from django.test import TestCase
+import csv
+import gzip
+import io
+import json
+from unittest import mock
+from django.test import SimpleTestCase, TestCase, override_settings
+from rest_framework.test import APIClient
+from nativo_english.api.shared.auth.views import generate_jwt_tokens
+from nativo_english.api.shared.course.models import Course, CourseSection, CourseLesson
+from nativo_english.api.shared.db_helper import estimate_queryset_count, iter_plpgsql_function
+from nativo_english.api.shared.user.models import User
 
-# Create your tests here.
+
+class AdminAPITestCase(TestCase):
+    """
+    Calls the admin endpoints as an admin user, authenticated with a real access token.
+    """
+
+    def setUp(self):
+        self.admin = User.objects.create_user(username='admin', email='admin@example.com', password='Passw0rd!', role='admin')
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {generate_jwt_tokens(self.admin)['access']}")
+
+
+class AdminCourseCursorTests(AdminAPITestCase):
+
+    def test_relevance_without_search_pages_by_creation_date(self):
+        for number in range(3):
+            Course.objects.create(
+                title=f'Course {number}', description='A course', mode='self', level='beginner',
+                is_active=True, owner=self.admin,
+            )
+
+        params = {'cursor': '', 'sort_by': 'relevance', 'page_size': 2}
+        first_page = self.client.get('/api/admin/course/', params)
+        self.assertEqual(first_page.status_code, 200)
+        self.assertEqual(len(first_page.data['data']['courses']), 2)
+        self.assertIsNotNone(first_page.data['data']['next_cursor'])
+
+        second_page = self.client.get('/api/admin/course/', {**params, 'cursor': first_page.data['data']['next_cursor']})
+        self.assertEqual(second_page.status_code, 200)
+        self.assertEqual(len(second_page.data['data']['courses']), 1)
+        self.assertIsNone(second_page.data['data']['next_cursor'])
+
+        listed = [course['course_id'] for page in (first_page, second_page) for course in page.data['data']['courses']]
+        self.assertCountEqual(listed, Course.objects.values_list('id', flat=True))
+
+
+class AdminCourseLessonListTests(AdminAPITestCase):
+
+    def setUp(self):
+        super().setUp()
+        course = Course.objects.create(title='Course', description='A course', mode='self', level='beginner', owner=self.admin)
+        self.section = CourseSection.objects.create(section_title='Section', fk_course_id=course)
+        self.lessons = [
+            CourseLesson.objects.create(
+                lesson_title=f'Lesson {position}', lesson_position=position, fk_section_id=self.section,
+                is_active=position != 2,
+            )
+            for position in range(1, 6)
+        ]
+
+    def test_streamed_rows_are_fetched_lazily_in_batches(self):
+        rows = iter_plpgsql_function('course_lesson_by_course_or_section_id_get', None, self.section.id, fetch_size=2)
+
+        first = next(rows)
+        self.assertEqual(set(first), {
+            'lesson_id', 'lesson_title', 'lesson_description', 'lesson_position', 'section_id', 'course_id', 'is_active',
+        })
+        self.assertCountEqual([first['lesson_id'], *(row['lesson_id'] for row in rows)], [lesson.id for lesson in self.lessons])
+
+    def test_lists_the_active_lessons_of_a_section(self):
+        response = self.client.get(f'/api/admin/course/section/{self.section.id}/lesson')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertCountEqual(
+            [lesson['lesson_id'] for lesson in response.data['data']['results']],
+            [lesson.id for lesson in self.lessons if lesson.is_active],
+        )
+
+
+class EstimateQuerysetCountTests(SimpleTestCase):
+
+    def test_reads_the_plan_rows(self):
+        queryset = mock.Mock()
+        # QuerySet.explain(format='json') on PostgreSQL: the plan object, not the list holding it
+        queryset.explain.return_value = json.dumps({'Plan': {'Node Type': 'Seq Scan', 'Plan Rows': 42}})
+
+        self.assertEqual(estimate_queryset_count(queryset), 42)
+
+
+class AdminUserListTests(AdminAPITestCase):
+
+    def setUp(self):
+        super().setUp()
+        for number in range(3):
+            User.objects.create_user(username=f'student{number}', email=f'student{number}@example.com', role='student')
+
+    def test_estimated_total(self):
+        response = self.client.get('/api/admin/users/', {'estimate_total': 'true', 'page_size': 2})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.data['data']['is_total_estimated'])
+        self.assertEqual(len(response.data['data']['results']), 2)
+        # Never lower than what has been listed
+        self.assertGreaterEqual(response.data['data']['count'], 2)
+
+
+class AdminUsersBulkStatusTests(AdminAPITestCase):
+
+    def test_rejects_ids_out_of_the_bigint_range(self):
+        for user_id in (0, -1, 2 ** 63):
+            response = self.client.post('/api/admin/users/bulk/suspend/', {'ids': [user_id]}, format='json')
+            self.assertEqual(response.status_code, 400, user_id)
+
+
+class AdminExportTests(AdminAPITestCase):
+
+    def setUp(self):
+        super().setUp()
+        for number in range(3):
+            User.objects.create_user(username=f'student{number}', email=f'student{number}@example.com', role='student')
+
+    def test_streams_a_csv_export(self):
+        response = self.client.get('/api/admin/export/users/', {'file_format': 'csv', 'role': 'student'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        rows = list(csv.DictReader(io.StringIO(b''.join(response.streaming_content).decode('utf-8'))))
+        self.assertEqual([row['username'] for row in rows], ['student0', 'student1', 'student2'])
+
+    def test_streams_a_gzipped_jsonl_export(self):
+        response = self.client.get('/api/admin/export/users/', {'file_format': 'jsonl', 'gzip': 'true'})
+
+        self.assertEqual(response.status_code, 200)
+        lines = gzip.decompress(b''.join(response.streaming_content)).decode('utf-8').splitlines()
+        self.assertCountEqual([json.loads(line)['username'] for line in lines], ['admin', 'student0', 'student1', 'student2'])
+
+    @override_settings(EXPORT_SYNC_MAX_ROWS=-1)
+    def test_refuses_exports_too_large_to_stream(self):
+        response = self.client.get('/api/admin/export/users/')
+
+        self.assertEqual(response.status_code, 400)
@@ -1,14 +1,23 @@
 from django.urls import path, include
 from .views import (
     AdminUserListCreateView, AdminUserRetrieveUpdateView, AdminUserRoleUpdateView, AdminUserActivateSuspendUpdateView, 
-    AdminCourseListCreateView, AdminCourseRetrieveUpdateView, 
+    AdminCourseListCreateView, AdminCourseRetrieveUpdateView, AdminCourseTreeRetrieveView, 
     AdminCourseSectionListCreateView, AdminCourseSectionRetrieveUpdateView, 
     AdminCourseLessonListCreateView, AdminCourseLessonRetrieveUpdateView,
-    AdminCourseLessonContentListCreateView)
+    AdminCourseLessonContentListCreateView, AdminCourseCacheStatsView, AdminTokenBlacklistStatsView,
+    AdminTaskQueueLatencyView, AdminEmailOutboxStatsView,
+    AdminUserImportView, AdminUserImportJobView, AdminUserImportErrorListView,
+    AdminUsersBulkRoleUpdateView, AdminUsersBulkActivateSuspendView,
+    AdminExportView, AdminExportJobCreateView, AdminExportJobView, AdminExportDownloadView)
 
 urlpatterns = [
     path('users/', AdminUserListCreateView.as_view(), name='user-create-list'),
     path('users/<int:id>/', AdminUserRetrieveUpdateView.as_view(), name='user-detail'),
+    path('users/bulk/role/', AdminUsersBulkRoleUpdateView.as_view(), name='users-bulk-role-update'),
+    path('users/bulk/<str:action>/', AdminUsersBulkActivateSuspendView.as_view(), name='users-bulk-activate-suspend'),
+    path('users/import/', AdminUserImportView.as_view(), name='user-import'),
+    path('users/import/<int:job_id>/', AdminUserImportJobView.as_view(), name='user-import-job'),
+    path('users/import/<int:job_id>/errors/', AdminUserImportErrorListView.as_view(), name='user-import-errors'),
 
     path('users/<int:id>/role', AdminUserRoleUpdateView.as_view(), name='user-role-update'),
     path('users/<int:id>/<str:action>/', AdminUserActivateSuspendUpdateView.as_view(), name='activate-suspend-user'),
@@ -16,6 +25,15 @@ urlpatterns = [
 
     path('course/', AdminCourseListCreateView.as_view(), name='course-create-list'),
     path('course/<int:id>/', AdminCourseRetrieveUpdateView.as_view(), name='course-detail'),
+    path('course/<int:id>/tree/', AdminCourseTreeRetrieveView.as_view(), name='course-tree'),
+    path('course/cache-stats/', AdminCourseCacheStatsView.as_view(), name='course-cache-stats'),
+    path('token-blacklist/stats/', AdminTokenBlacklistStatsView.as_view(), name='token-blacklist-stats'),
+    path('task-queues/latency/', AdminTaskQueueLatencyView.as_view(), name='task-queue-latency'),
+    path('email-outbox/stats/', AdminEmailOutboxStatsView.as_view(), name='email-outbox-stats'),
+    path('export/jobs/<str:job_id>/', AdminExportJobView.as_view(), name='export-job'),
+    path('export/jobs/<str:job_id>/download/', AdminExportDownloadView.as_view(), name='export-download'),
+    path('export/<str:dataset>/', AdminExportView.as_view(), name='export'),
+    path('export/<str:dataset>/jobs/', AdminExportJobCreateView.as_view(), name='export-job-create'),
 
     path('course/<int:course_id>/section/', AdminCourseSectionListCreateView.as_view(), name='course-section-create-list'),
     path('course/<int:course_id>/section/<int:course_section_id>/', AdminCourseSectionRetrieveUpdateView.as_view(), name='course-section-detail'),
@@ -2,6 +2,7 @@
 from nativo_english.api.shared import messages
 
 # api/admin/views.py
+from django.conf import settings
 from drf_spectacular.utils import extend_schema
 from rest_framework import status
 from rest_framework.views import APIView
@@ -10,15 +11,24 @@ from rest_framework.pagination import PageNumberPagination
 from .serializer import AdminUserSerializer
 from nativo_english.api.shared.course.serializer import CourseSerializer, CourseSectionSerializer, CourseLessonSerializer
 from nativo_english.api.shared.user.models import User
+from nativo_english.api.shared.user.views import get_users_with_pagination, get_users_with_cursor, get_user_import_job, get_user_import_errors, get_bulk_user_selection, bulk_update_users
+from nativo_english.api.shared.user.imports import IMPORT_FORMATS, save_import_file
+from nativo_english.api.shared.user.tasks import import_users_task
 from .permissions import IsAdminUserRole
 from django.shortcuts import get_object_or_404
 from rest_framework.exceptions import NotFound
 from nativo_english.api.shared.utils import api_response
 from nativo_english.api.shared.course.views import (
-    get_all_courses, create_course, update_course, get_course_by_id, get_all_courses_with_pagination, get_course_detail_by_id, 
+    get_all_courses, create_course, update_course, get_course_by_id, get_all_courses_with_pagination, get_all_courses_with_cursor, get_course_detail_by_id, 
+    get_course_tree_by_id, get_request_language, 
     get_all_course_sections, get_course_section_by_id, update_course_section, create_course_section, 
     create_course_lesson, get_all_course_lessons, get_course_lesson_by_id, update_course_lesson)
 from nativo_english.api.shared.utils import api_response
+from nativo_english.api.shared.conditional import conditional_get
+from nativo_english.api.shared.pagination import get_int_param
+from nativo_english.api.shared.course.etags import (
+    course_detail_validator, course_tree_validator, course_section_list_validator,
+    course_section_validator, course_lesson_list_validator, course_lesson_validator)
 from .swagger_schema import (
     GET_USER_LIST_SCHEMA, POST_USER_SCHEMA , 
     GET_USER_BY_ID_SCHEMA , UPDATE_USER_BY_ID_SCHEMA, 
@@ -29,7 +39,23 @@ from .swagger_schema import (
     GET_ADMIN_ALL_COURSE_LESSON_RETRIEVE_SCHEMA, POST_ADMIN_COURSE_LESSON_CREATE_SCHEMA, 
     GET_ADMIN_COURSE_ALL_SECTION_SCHEMA, POST_ADMIN_COURSE_SECTION_CREATE_SCHEMA, 
     GET_ADMIN_COURSE_SECTION_DETAIL_BY_ID_SCHEMA, UPDATE_ADMIN_COURSE_SECTION_BY_ID_SCHEMA,
-    GET_ADMIN_COURSE_ALL_LESSON_CONTENT_SCHEMA)
+    GET_ADMIN_COURSE_ALL_LESSON_CONTENT_SCHEMA, GET_ADMIN_COURSE_CACHE_STATS_SCHEMA, GET_ADMIN_COURSE_TREE_SCHEMA,
+    GET_ADMIN_TOKEN_BLACKLIST_STATS_SCHEMA, GET_ADMIN_TASK_QUEUE_LATENCY_SCHEMA, GET_ADMIN_EMAIL_OUTBOX_STATS_SCHEMA,
+    POST_ADMIN_USER_IMPORT_SCHEMA, GET_ADMIN_USER_IMPORT_JOB_SCHEMA, GET_ADMIN_USER_IMPORT_ERRORS_SCHEMA,
+    POST_ADMIN_USERS_BULK_ROLE_SCHEMA, POST_ADMIN_USERS_BULK_STATUS_SCHEMA,
+    GET_ADMIN_EXPORT_SCHEMA, POST_ADMIN_EXPORT_JOB_SCHEMA, GET_ADMIN_EXPORT_JOB_SCHEMA, GET_ADMIN_EXPORT_DOWNLOAD_SCHEMA)
+from nativo_english.api.shared.course.cache import get_course_detail_cache_stats
+from nativo_english.api.shared.auth.revocation import revoke_user_tokens
+from nativo_english.api.shared.auth.blacklist import token_blacklist_filter
+from nativo_english.api.shared.task_metrics import get_queue_latency_stats
+from nativo_english.api.shared.notifications.outbox import get_email_outbox_stats
+from nativo_english.api.shared.db_helper import estimate_queryset_count
+from nativo_english.api.shared.exports import (
+    EXPORT_FORMATS, get_export_filters, get_export_queryset, streaming_export_response, record_export_job, get_export_job,
+    get_export_file)
+from nativo_english.api.shared.tasks import export_dataset_task
+from django.http import FileResponse, HttpResponse
+from urllib.parse import quote
 
 # -----------------------------------------
 class AdminUserPagination(PageNumberPagination):
@@ -59,38 +85,28 @@ class AdminUserListCreateView(APIView):
         # Get query parameters for filtering
         role = request.query_params.get('role')
         is_active = request.query_params.get('is_active')
-
-        # Get all users first
-        queryset = User.objects.only("id", "username", "email", "first_name", "last_name", "is_active")
-        
-        if role:
-            queryset = queryset.filter(role=role)
-
         if is_active is not None:
             is_active = is_active.lower() == 'true'
-            queryset = queryset.filter(is_active=is_active)
-        
-        if not queryset.exists():
-            return api_response(status.HTTP_404_NOT_FOUND, messages.NO_USER_FOUND)
 
-        paginator = self.pagination_class()
-        page = paginator.paginate_queryset(queryset, request)
+        page_num = get_int_param(request.query_params, 'page', 1)
+        page_size = get_int_param(request.query_params, 'page_size', self.pagination_class.page_size, max_value=self.pagination_class.max_page_size)
+        estimate_total = str(request.query_params.get('estimate_total', False)).lower() == 'true'
+        cursor = request.query_params.get('cursor', None)
+
+        # Keyset pagination mode, the client passes back the next_cursor of the previous page
+        if cursor is not None:
+            response_data = get_users_with_cursor(cursor, page_size, role, is_active)
+            if not response_data['results'] and not cursor:
+                return api_response(status.HTTP_404_NOT_FOUND, messages.NO_USER_FOUND)
 
-        serializer = self.serializer_class(page, many=True)
-        
-        if page is not None:
-            # using custom response helper to structure the response
-            response_data = {
-                "count": paginator.page.paginator.count,
-                "num_pages": paginator.page.paginator.num_pages,
-                "current_page": paginator.page.number,
-                "results": serializer.data,
-            }
             return api_response(status.HTTP_200_OK, messages.USERS_LIST_RETRIEVED_SUCCESS_MESSAGE, response_data)
 
-        serializer = self.serializer_class(queryset, many=True)
-        
-        return api_response(status.HTTP_200_OK, messages.USERS_LIST_RETRIEVED_SUCCESS_MESSAGE, serializer.data)
+        # One query for the page and its total
+        response_data = get_users_with_pagination(page_num, page_size, role, is_active, estimate_total)
+        if not response_data['count']:
+            return api_response(status.HTTP_404_NOT_FOUND, messages.NO_USER_FOUND)
+
+        return api_response(status.HTTP_200_OK, messages.USERS_LIST_RETRIEVED_SUCCESS_MESSAGE, response_data)
         
     # ------------------------------------
     
@@ -142,6 +158,11 @@ class AdminUserRetrieveUpdateView(APIView):
 
         if serializer.is_valid():
             serializer.save()
+
+            # Tokens issued before carry the previous role, status or identity claims
+            if {'role', 'is_active', 'username', 'email'} & serializer.validated_data.keys():
+                revoke_user_tokens(user.id)
+
             return api_response(status.HTTP_200_OK, messages.USER_UPDATED_SUCCESS_MESSAGE)
 
         return api_response(status.HTTP_400_BAD_REQUEST, serializer.errors)
@@ -166,7 +187,10 @@ class AdminUserRoleUpdateView(APIView):
 
         if updated_role:
             user.role = updated_role
-            user.save()
+            user.save(update_fields=['role'])
+
+            # Tokens issued before carry the previous role
+            revoke_user_tokens(user.id)
 
             # Serialize response
             response_serializer = self.serializer_class(user)
@@ -196,18 +220,132 @@ class AdminUserActivateSuspendUpdateView(APIView):
         # Update user status based on the action
         if action == "activate":
             user.is_active = True
-            user.save()
+            user.save(update_fields=['is_active'])
             response_serializer = self.serializer_class(user)
             
             return api_response(status.HTTP_200_OK, f'{messages.USER_UPDATED_SUCCESS_MESSAGE} for {id}', response_serializer.data)
 
         elif action == "suspend":
             user.is_active = False
-            user.save()
+            user.save(update_fields=['is_active'])
+
+            # Block the tokens already issued to the user right away
+            revoke_user_tokens(user.id)
             response_serializer = self.serializer_class(user)
             return api_response(status.HTTP_200_OK, f'{messages.USER_SUSPENDED_SUCCESS_MESSAGE} for {id}', response_serializer.data)
 # -----------------------------------------
 
+
+# -----------------------------------------
+# This view corresponds to following endpoints
+# 1. Change the role of many users at once (can only be access by Admin user role --> POST /api/admin/users/bulk/role/)
+# -----------------------------------------
+class AdminUsersBulkRoleUpdateView(APIView):
+    permission_classes = [IsAuthenticated, IsAdminUserRole]
+
+    @extend_schema(**POST_ADMIN_USERS_BULK_ROLE_SCHEMA)
+    def post(self, request, *args, **kwargs):
+        updated_role = request.data.get('role')
+        if not updated_role:
+            return api_response(status.HTTP_400_BAD_REQUEST, messages.NO_USER_ROLE_PROVIDED)
+        if updated_role not in dict(User.ROLE_CHOICES):
+            return api_response(status.HTTP_400_BAD_REQUEST, messages.INVALID_USER_ROLE_MESSAGE)
+
+        ids, filters = get_bulk_user_selection(request.data)
+
+        # The admin running the operation is never changed, so they cannot lock themselves out
+        updated_ids = bulk_update_users({'role': updated_role}, ids, filters, exclude_id=request.user.id)
+
+        # Tokens issued before carry the previous role
+        revoke_user_tokens(*updated_ids)
+
+        return api_response(status.HTTP_200_OK, messages.USERS_BULK_ROLE_UPDATED_SUCCESS_MESSAGE, {'updated_count': len(updated_ids)})
+# -----------------------------------------
+
+
+# -----------------------------------------
+# This view corresponds to following endpoints
+# 1. Activate or suspend many users at once (can only be access by Admin user role --> POST /api/admin/users/bulk/{activate|suspend}/)
+# -----------------------------------------
+class AdminUsersBulkActivateSuspendView(APIView):
+    permission_classes = [IsAuthenticated, IsAdminUserRole]
+
+    @extend_schema(**POST_ADMIN_USERS_BULK_STATUS_SCHEMA)
+    def post(self, request, action=None, *args, **kwargs):
+        if action not in ['activate', 'suspend']:
+            return api_response(status.HTTP_400_BAD_REQUEST, messages.INVALID_ACTION_MESSAGE)
+
+        ids, filters = get_bulk_user_selection(request.data)
+
+        # The admin running the operation is never changed, so they cannot lock themselves out
+        updated_ids = bulk_update_users({'is_active': action == 'activate'}, ids, filters, exclude_id=request.user.id)
+
+        # Block the tokens already issued to the suspended users right away
+        if action == 'suspend':
+            revoke_user_tokens(*updated_ids)
+
+        return api_response(status.HTTP_200_OK, messages.USERS_BULK_STATUS_UPDATED_SUCCESS_MESSAGE, {'updated_count': len(updated_ids)})
+# -----------------------------------------
+
+
+# -----------------------------------------
+# This view corresponds to following endpoints
+# 1. Bulk import users from a CSV / JSONL file, as a background job (can only be access by Admin user role --> POST /api/admin/users/import/)
+# -----------------------------------------
+class AdminUserImportView(APIView):
+    permission_classes = [IsAuthenticated, IsAdminUserRole]
+
+    @extend_schema(**POST_ADMIN_USER_IMPORT_SCHEMA)
+    def post(self, request, *args, **kwargs):
+        uploaded_file = request.FILES.get('file')
+        if uploaded_file is None:
+            return api_response(status.HTTP_400_BAD_REQUEST, messages.USER_IMPORT_FILE_REQUIRED_MESSAGE)
+
+        # Format given explicitly, or told by the file extension
+        file_format = str(request.data.get('format') or uploaded_file.name.rsplit('.', 1)[-1]).lower()
+        if file_format not in IMPORT_FORMATS:
+            return api_response(status.HTTP_400_BAD_REQUEST, messages.USER_IMPORT_INVALID_FORMAT_MESSAGE)
+
+        if uploaded_file.size > settings.USER_IMPORT_MAX_FILE_SIZE:
+            return api_response(status.HTTP_400_BAD_REQUEST, messages.USER_IMPORT_FILE_TOO_LARGE_MESSAGE)
+
+        job = save_import_file(uploaded_file, file_format, created_by_id=request.user.id)
+        import_users_task.delay(job.id)
+
+        return api_response(status.HTTP_202_ACCEPTED, messages.USER_IMPORT_STARTED_SUCCESS_MESSAGE, get_user_import_job(job.id))
+# -----------------------------------------
+
+
+# -----------------------------------------
+# This view corresponds to following endpoints
+# 1. Get the progress of a user import job (can only be access by Admin user role --> GET /api/admin/users/import/{job_id}/)
+# -----------------------------------------
+class AdminUserImportJobView(APIView):
+    permission_classes = [IsAuthenticated, IsAdminUserRole]
+
+    @extend_schema(**GET_ADMIN_USER_IMPORT_JOB_SCHEMA)
+    def get(self, request, job_id, *args, **kwargs):
+        return api_response(status.HTTP_200_OK, messages.USER_IMPORT_JOB_RETRIEVED_SUCCESS_MESSAGE, get_user_import_job(job_id))
+# -----------------------------------------
+
+
+# -----------------------------------------
+# This view corresponds to following endpoints
+# 1. Get the rows a user import job could not create, with the reasons (can only be access by Admin user role --> GET /api/admin/users/import/{job_id}/errors/)
+# -----------------------------------------
+class AdminUserImportErrorListView(APIView):
+    permission_classes = [IsAuthenticated, IsAdminUserRole]
+
+    @extend_schema(**GET_ADMIN_USER_IMPORT_ERRORS_SCHEMA)
+    def get(self, request, job_id, *args, **kwargs):
+        get_user_import_job(job_id)
+
+        page_size = get_int_param(request.query_params, 'page_size', 100, max_value=1000)
+        cursor = request.query_params.get('cursor', None)
+
+        return api_response(status.HTTP_200_OK, messages.USER_IMPORT_ERRORS_RETRIEVED_SUCCESS_MESSAGE, get_user_import_errors(job_id, cursor, page_size))
+# -----------------------------------------
+
       
 # -----------------------------------------
 # This view corresponds to following endpoints
@@ -224,8 +362,8 @@ class AdminCourseListCreateView(APIView):
 
     @extend_schema(**GET_ADMIN_COURSE_LIST_SCHEMA)
     def get(self, request, *args, **kwargs):
-        page_num = int(request.query_params.get('page_num', 1))
-        page_size = int(request.query_params.get('page_size', 10))
+        page_num = get_int_param(request.query_params, 'page_num', 1)
+        page_size = get_int_param(request.query_params, 'page_size', 10)
         filter_title = request.query_params.get('title', None)
         filter_mode = request.query_params.get('mode', None)
         filter_is_paid = request.query_params.get('is_paid', None)
@@ -235,6 +373,25 @@ class AdminCourseListCreateView(APIView):
         sort_order = request.query_params.get('sort_order', None)
         filter_owner_id = request.query_params.get('filter_owner_id', None)
         filter_level = request.query_params.get('level', None)
+        estimate_total = str(request.query_params.get('estimate_total', False)).lower() == 'true'
+
+        cursor = request.query_params.get('cursor', None)
+
+        # Keyset pagination mode, the client passes back the next_cursor of the previous page
+        if cursor is not None:
+            queryset = get_all_courses_with_cursor(cursor,
+                                                   page_size,
+                                                   filter_title,
+                                                   filter_mode,
+                                                   filter_is_paid,
+                                                   filter_is_active,
+                                                   search_query,
+                                                   sort_field,
+                                                   sort_order,
+                                                   filter_owner_id,
+                                                   filter_level)
+
+            return api_response(status.HTTP_200_OK, messages.COURSE_LIST_RETRIEVED_SUCCESS_MESSAGE, queryset)
 
         queryset = get_all_courses_with_pagination(page_num, 
                                                    page_size, 
@@ -246,7 +403,8 @@ class AdminCourseListCreateView(APIView):
                                                    sort_field, 
                                                    sort_order,
                                                    filter_owner_id,
-                                                   filter_level)
+                                                   filter_level,
+                                                   estimate_total)
 
         return api_response(status.HTTP_200_OK, messages.COURSE_LIST_RETRIEVED_SUCCESS_MESSAGE, queryset)
 
@@ -282,6 +440,7 @@ class AdminCourseRetrieveUpdateView(APIView):
     pagination_class = PageNumberPagination
 
     @extend_schema(**GET_ADMIN_COURSE_RETRIEVE_SCHEMA)
+    @conditional_get(course_detail_validator)
     def get(self, request, id, *args, **kwargs):
         course_data = get_course_detail_by_id(id)
         return api_response(status.HTTP_200_OK, messages.COURSE_RETRIEVED_SUCCESS_MESSAGE, course_data)
@@ -300,6 +459,25 @@ class AdminCourseRetrieveUpdateView(APIView):
 # -----------------------------------------
 
 
+# -----------------------------------------
+# This view corresponds to following endpoints
+# 1. Retreive the whole Course tree (sections, lessons, content) by ID (can only be access by Admin user role --> GET /api/admin/course/{id}/tree/)
+# -----------------------------------------
+class AdminCourseTreeRetrieveView(APIView):
+    permission_classes = [IsAuthenticated, IsAdminUserRole]
+
+    @extend_schema(**GET_ADMIN_COURSE_TREE_SCHEMA)
+    @conditional_get(course_tree_validator)
+    def get(self, request, id, *args, **kwargs):
+        course_tree = get_course_tree_by_id(id, get_request_language(request))
+
+        if not course_tree:
+            return api_response(status.HTTP_404_NOT_FOUND, messages.COURSE_NOT_FOUND_MESSAGE)
+
+        return api_response(status.HTTP_200_OK, messages.COURSE_TREE_RETRIEVED_SUCCESS_MESSAGE, course_tree)
+# -----------------------------------------
+
+
 # -----------------------------------------
 # This view corresponds to following endpoints
 # 1. Get all Courses Section(can only be access by Admin user rol --> GET /api/admin/course/section)
@@ -314,6 +492,7 @@ class AdminCourseSectionListCreateView(APIView):
     pagination_class = AdminUserPagination
 
     @extend_schema(**GET_ADMIN_COURSE_ALL_SECTION_SCHEMA)
+    @conditional_get(course_section_list_validator)
     def get(self, request, course_id, *args, **kwargs):
         title = request.query_params.get('title')
 
@@ -369,6 +548,7 @@ class AdminCourseSectionRetrieveUpdateView(APIView):
     pagination_class = PageNumberPagination
 
     @extend_schema(**GET_ADMIN_COURSE_SECTION_DETAIL_BY_ID_SCHEMA)
+    @conditional_get(course_section_validator)
     def get(self, request, course_id, course_section_id,*args, **kwargs):
         course_data = get_course_section_by_id(request, course_section_id, course_id)
         return api_response(status.HTTP_200_OK, messages.COURSE_SECTION_RETRIEVED_SUCCESS_MESSAGE, course_data)
@@ -405,6 +585,7 @@ class AdminCourseLessonListCreateView(APIView):
     pagination_class = AdminUserPagination
 
     @extend_schema(**GET_ADMIN_ALL_COURSE_LESSON_RETRIEVE_SCHEMA)
+    @conditional_get(course_lesson_list_validator)
     def get(self, request, course_section_id, *args, **kwargs):
         title = request.query_params.get('title')
         
@@ -454,6 +635,7 @@ class AdminCourseLessonRetrieveUpdateView(APIView):
     pagination_class = PageNumberPagination
 
     @extend_schema(**GET_ADMIN_COURSE_LESSON_RETRIEVE_SCHEMA)
+    @conditional_get(course_lesson_validator)
     def get(self, request, course_section_id, course_lesson_id, *args, **kwargs):
         course_data = get_course_lesson_by_id(course_lesson_id)
         return api_response(status.HTTP_200_OK, messages.COURSE_LESSON_RETRIEVED_SUCCESS_MESSAGE, course_data)
@@ -486,3 +668,144 @@ class AdminCourseLessonContentListCreateView(APIView):
         return
     
 
+# -----------------------------------------
+
+
+# -----------------------------------------
+# This view corresponds to following endpoints
+# 1. Get course detail cache stats (can only be access by Admin user role --> GET /api/admin/course/cache-stats/)
+# -----------------------------------------
+class AdminCourseCacheStatsView(APIView):
+    permission_classes = [IsAuthenticated, IsAdminUserRole]
+
+    @extend_schema(**GET_ADMIN_COURSE_CACHE_STATS_SCHEMA)
+    def get(self, request, *args, **kwargs):
+        return api_response(status.HTTP_200_OK, messages.COURSE_CACHE_STATS_RETRIEVED_SUCCESS_MESSAGE, get_course_detail_cache_stats())
+# -----------------------------------------
+
+
+# -----------------------------------------
+# This view corresponds to following endpoints
+# 1. Get refresh token blacklist filter stats of the serving worker (can only be access by Admin user role --> GET /api/admin/token-blacklist/stats/)
+# -----------------------------------------
+class AdminTokenBlacklistStatsView(APIView):
+    permission_classes = [IsAuthenticated, IsAdminUserRole]
+
+    @extend_schema(**GET_ADMIN_TOKEN_BLACKLIST_STATS_SCHEMA)
+    def get(self, request, *args, **kwargs):
+        return api_response(status.HTTP_200_OK, messages.TOKEN_BLACKLIST_STATS_RETRIEVED_SUCCESS_MESSAGE, token_blacklist_filter.get_stats())
+# -----------------------------------------
+
+
+# -----------------------------------------
+# This view corresponds to following endpoints
+# 1. Get latency percentiles of the Celery task queues (can only be access by Admin user role --> GET /api/admin/task-queues/latency/)
+# -----------------------------------------
+class AdminTaskQueueLatencyView(APIView):
+    permission_classes = [IsAuthenticated, IsAdminUserRole]
+
+    @extend_schema(**GET_ADMIN_TASK_QUEUE_LATENCY_SCHEMA)
+    def get(self, request, *args, **kwargs):
+        minutes = get_int_param(request.query_params, 'minutes', 5, max_value=60)
+        return api_response(status.HTTP_200_OK, messages.TASK_QUEUE_LATENCY_RETRIEVED_SUCCESS_MESSAGE, get_queue_latency_stats(minutes))
+# -----------------------------------------
+
+
+# -----------------------------------------
+# This view corresponds to following endpoints
+# 1. Get backlog and throughput of the email outbox (can only be access by Admin user role --> GET /api/admin/email-outbox/stats/)
+# -----------------------------------------
+class AdminEmailOutboxStatsView(APIView):
+    permission_classes = [IsAuthenticated, IsAdminUserRole]
+
+    @extend_schema(**GET_ADMIN_EMAIL_OUTBOX_STATS_SCHEMA)
+    def get(self, request, *args, **kwargs):
+        return api_response(status.HTTP_200_OK, messages.EMAIL_OUTBOX_STATS_RETRIEVED_SUCCESS_MESSAGE, get_email_outbox_stats())
+# -----------------------------------------
+
+
+# -----------------------------------------
+# This view corresponds to following endpoints
+# 1. Stream an export of users, courses or enrollments as CSV / JSONL (can only be access by Admin user role --> GET /api/admin/export/{dataset}/)
+# -----------------------------------------
+class AdminExportView(APIView):
+    permission_classes = [IsAuthenticated, IsAdminUserRole]
+
+    @extend_schema(**GET_ADMIN_EXPORT_SCHEMA)
+    def get(self, request, dataset, *args, **kwargs):
+        file_format = str(request.query_params.get('file_format', 'csv')).lower()
+        if file_format not in EXPORT_FORMATS:
+            return api_response(status.HTTP_400_BAD_REQUEST, messages.INVALID_EXPORT_FORMAT_MESSAGE)
+
+        filters = get_export_filters(dataset, request.query_params)
+        compress = str(request.query_params.get('gzip', False)).lower() == 'true'
+
+        # Large exports would hold this worker for minutes, they run as a job instead
+        rows = estimate_queryset_count(get_export_queryset(dataset, filters))
+        if rows > settings.EXPORT_SYNC_MAX_ROWS:
+            return api_response(status.HTTP_400_BAD_REQUEST, messages.EXPORT_TOO_LARGE_MESSAGE.format(rows=rows))
+
+        return streaming_export_response(dataset, file_format, filters, compress)
+# -----------------------------------------
+
+
+# -----------------------------------------
+# This view corresponds to following endpoints
+# 1. Start an export job writing users, courses or enrollments to a file (can only be access by Admin user role --> POST /api/admin/export/{dataset}/jobs/)
+# -----------------------------------------
+class AdminExportJobCreateView(APIView):
+    permission_classes = [IsAuthenticated, IsAdminUserRole]
+
+    @extend_schema(**POST_ADMIN_EXPORT_JOB_SCHEMA)
+    def post(self, request, dataset, *args, **kwargs):
+        file_format = str(request.data.get('file_format', 'csv')).lower()
+        if file_format not in EXPORT_FORMATS:
+            return api_response(status.HTTP_400_BAD_REQUEST, messages.INVALID_EXPORT_FORMAT_MESSAGE)
+
+        filter_data = request.data.get('filter') or {}
+        if not isinstance(filter_data, dict):
+            return api_response(status.HTTP_400_BAD_REQUEST, messages.INVALID_EXPORT_FILTER_MESSAGE)
+
+        filters = get_export_filters(dataset, filter_data)
+        compress = str(request.data.get('gzip', False)).lower() == 'true'
+
+        result = export_dataset_task.delay(dataset, file_format, filters, compress)
+        record_export_job(result.id)
+
+        return api_response(status.HTTP_202_ACCEPTED, messages.EXPORT_STARTED_SUCCESS_MESSAGE, get_export_job(result.id))
+# -----------------------------------------
+
+
+# -----------------------------------------
+# This view corresponds to following endpoints
+# 1. Get the progress of an export job (can only be access by Admin user role --> GET /api/admin/export/jobs/{job_id}/)
+# -----------------------------------------
+class AdminExportJobView(APIView):
+    permission_classes = [IsAuthenticated, IsAdminUserRole]
+
+    @extend_schema(**GET_ADMIN_EXPORT_JOB_SCHEMA)
+    def get(self, request, job_id, *args, **kwargs):
+        return api_response(status.HTTP_200_OK, messages.EXPORT_JOB_RETRIEVED_SUCCESS_MESSAGE, get_export_job(job_id))
+# -----------------------------------------
+
+
+# -----------------------------------------
+# This view corresponds to following endpoints
+# 1. Download the file of a completed export job (can only be access by Admin user role --> GET /api/admin/export/jobs/{job_id}/download/)
+# -----------------------------------------
+class AdminExportDownloadView(APIView):
+    permission_classes = [IsAuthenticated, IsAdminUserRole]
+
+    @extend_schema(**GET_ADMIN_EXPORT_DOWNLOAD_SCHEMA)
+    def get(self, request, job_id, *args, **kwargs):
+        file_path = get_export_file(job_id)
+
+        # nginx sends the file itself, the worker is released as soon as the headers are written
+        if settings.EXPORT_ACCEL_REDIRECT_PREFIX:
+            response = HttpResponse(content_type='application/octet-stream')
+            response['X-Accel-Redirect'] = f"{settings.EXPORT_ACCEL_REDIRECT_PREFIX.rstrip('/')}/{quote(file_path.name)}"
+            response['Content-Disposition'] = f'attachment; filename="{file_path.name}"'
+            return response
+
+        return FileResponse(open(file_path, 'rb'), as_attachment=True, filename=file_path.name)
+# -----------------------------------------
@@ -0,0 +1,115 @@
+from functools import partial
+from django.utils.functional import SimpleLazyObject
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from .revocation import is_token_revoked
+
+# Attribute of the underlying HttpRequest holding the token validated for the request
+VALIDATED_TOKEN_ATTR = '_validated_jwt'
+
+# User fields generate_jwt_tokens puts in the access token
+USER_CLAIMS = ('role', 'email', 'username')
+
+# Cached for requests without a bearer token, so the header is only parsed once too
+NO_TOKEN = object()
+
+
+def _http_request(request):
+    # DRF's Request wraps the HttpRequest, cache on the latter so every wrapper of the request shares it
+    return getattr(request, '_request', request)
+
+
+def get_validated_token(request):
+    """
+    Returns the access token of the request, verified and decoded once per request.
+
+    The first call (normally `RequestCachedJWTAuthentication.authenticate`) validates the bearer token
+    and caches it on the request, any later call (role permissions, views) reads the cached claims
+    without verifying the signature again. Returns None when the request carries no bearer token,
+    an invalid token raises `InvalidToken` like `JWTAuthentication` does.
+    """
+    http_request = _http_request(request)
+    validated_token = getattr(http_request, VALIDATED_TOKEN_ATTR, None)
+
+    if validated_token is None:
+        jwt_auth = RequestCachedJWTAuthentication()
+        header = jwt_auth.get_header(http_request)
+        raw_token = jwt_auth.get_raw_token(header) if header is not None else None
+
+        validated_token = NO_TOKEN if raw_token is None else jwt_auth.get_validated_token(raw_token)
+        setattr(http_request, VALIDATED_TOKEN_ATTR, validated_token)
+
+    return None if validated_token is NO_TOKEN else validated_token
+
+
+class RequestCachedJWTAuthentication(JWTAuthentication):
+    """
+    `JWTAuthentication` sharing the token it validates with the rest of the request through
+    `get_validated_token`, so the role permissions check the claims without decoding the token again.
+    """
+
+    def authenticate(self, request):
+        validated_token = get_validated_token(request)
+        if validated_token is None:
+            return None
+
+        return self.get_user(validated_token), validated_token
+
+
+class ClaimsUser(SimpleLazyObject):
+    """
+    User of a request authenticated by `ClaimsUserJWTAuthentication`.
+
+    The id and the fields carried by the token (`USER_CLAIMS`) are served from the verified claims,
+    touching any other field (or passing the user to a foreign key) loads the `User` row once and
+    proxies to it from then on.
+    """
+
+    def __init__(self, claims, load_user):
+        self.__dict__['_claims'] = claims
+        super().__init__(load_user)
+
+    def __getattr__(self, name):
+        claims = self.__dict__.get('_claims', {})
+        if name in claims:
+            return claims[name]
+
+        return super().__getattr__(name)
+
+
+class ClaimsUserJWTAuthentication(RequestCachedJWTAuthentication):
+    """
+    Opt-in (`JWT_CLAIMS_USER` setting) authentication that trusts the verified claims instead of
+    loading the user of every request from the database.
+
+    Since the user row is no longer read, a suspended user or a user whose role changed is blocked
+    through the revocation entry `revoke_user_tokens` leaves in the cache (one cache read per request).
+    When the cache is unavailable the user is loaded and checked from the database, as with
+    `JWTAuthentication`.
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken("Token contained no recognizable user identification")
+
+        revoked = is_token_revoked(validated_token, user_id)
+        if revoked is None:
+            return super().get_user(validated_token)
+
+        if revoked:
+            raise AuthenticationFailed("Token has been revoked, please log in again.", code='token_revoked')
+
+        claims = {
+            api_settings.USER_ID_FIELD: user_id,
+            'pk': user_id,
+            'is_active': True,
+            'is_authenticated': True,
+            'is_anonymous': False,
+        }
+        claims.update({claim: validated_token[claim] for claim in USER_CLAIMS if claim in validated_token})
+
+        return ClaimsUser(claims, partial(super().get_user, validated_token))
@@ -0,0 +1,198 @@
+import hashlib
+import logging
+import math
+import threading
+import uuid
+from collections import Counter
+from datetime import timedelta
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+from rest_framework_simplejwt.tokens import RefreshToken
+
+logger = logging.getLogger(__name__)
+
+# Changed (to a random value) on every blacklisting, workers pull the new entries when it differs from theirs
+BLACKLIST_VERSION_KEY = 'token_blacklist:version'
+
+# Overlap of the delta pulls, covers blacklistings committed after rows blacklisted later
+BLACKLIST_PULL_MARGIN = timedelta(minutes=1)
+
+
+class BloomFilter:
+    """
+    Fixed size Bloom filter of strings.
+
+    Sized for `capacity` items at a `error_rate` false positive probability, membership tests
+    never return false negatives.
+    """
+
+    def __init__(self, capacity, error_rate):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item):
+        # Double hashing (Kirsch-Mitzenmacher) of a single 128 bit digest
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def add(self, item):
+        if item in self:
+            return
+
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def estimated_error_rate(self):
+        return (1 - math.exp(-self.hash_count * self.count / self.size)) ** self.hash_count
+
+
+class TokenBlacklistFilter:
+    """
+    Per worker Bloom filter of the blacklisted refresh token ids, in front of `BlacklistedToken`.
+
+    A token id the filter does not contain was never blacklisted, so the check costs one cache read
+    (the blacklist version) and no query. Only possible hits are confirmed against the database.
+    When the version in the cache differs from the one the worker synced, the entries blacklisted
+    since the previous pull are added first; a full rebuild (dropping expired tokens) happens once
+    the filter holds more than its capacity, which is at least twice the tokens it was built with.
+    Without the cache every check goes to the database.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.bloom = None
+        self.version = None
+        self.synced_at = None
+        self.stats = Counter()
+
+    def _unexpired(self):
+        return BlacklistedToken.objects.filter(token__expires_at__gt=timezone.now())
+
+    def _pull(self, since=None):
+        blacklisted = self._unexpired()
+        if since is not None:
+            blacklisted = blacklisted.filter(blacklisted_at__gte=since - BLACKLIST_PULL_MARGIN)
+
+        for jti in blacklisted.values_list('token__jti', flat=True).iterator(chunk_size=5000):
+            self.bloom.add(jti)
+
+    def _sync(self):
+        """
+        Brings the filter up to date, returns False when the cache cannot tell whether it is.
+        """
+        try:
+            version = cache.get(BLACKLIST_VERSION_KEY)
+        except Exception as ex:
+            logger.warning('Could not read the token blacklist version: %s', ex)
+            return False
+
+        with self.lock:
+            started_at = timezone.now()
+            if self.bloom is None or self.bloom.count > self.bloom.capacity:
+                # Room for as many tokens again as are blacklisted now, so the next rebuild only comes once
+                # the blacklist doubled (a filter built at its capacity would rebuild on every check)
+                capacity = max(settings.TOKEN_BLACKLIST_FILTER_CAPACITY, 2 * self._unexpired().count())
+                self.bloom = BloomFilter(capacity, settings.TOKEN_BLACKLIST_FILTER_ERROR_RATE)
+                self._pull()
+                self.stats['rebuilds'] += 1
+            elif version != self.version:
+                self._pull(since=self.synced_at)
+                self.stats['pulls'] += 1
+            else:
+                return True
+
+            self.version = version
+            self.synced_at = started_at
+
+        return True
+
+    def is_blacklisted(self, jti):
+        """
+        Returns whether the refresh token `jti` is blacklisted.
+        """
+        self.stats['checks'] += 1
+        if self._sync() and jti not in self.bloom:
+            self.stats['negatives'] += 1
+            return False
+
+        blacklisted = BlacklistedToken.objects.filter(token__jti=jti).exists()
+        self.stats['hits' if blacklisted else 'false_positives'] += 1
+        return blacklisted
+
+    def add(self, jti):
+        """
+        Records a token the worker just blacklisted and tells the other workers to pull it.
+        """
+        with self.lock:
+            if self.bloom is not None:
+                self.bloom.add(jti)
+
+        try:
+            cache.set(BLACKLIST_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+        except Exception as ex:
+            logger.warning('Could not publish the token blacklist version: %s', ex)
+
+    def get_stats(self):
+        """
+        Sizing and hit counters of the filter of this worker.
+        """
+        stats = {
+            'checks': self.stats['checks'],
+            'negatives': self.stats['negatives'],
+            'hits': self.stats['hits'],
+            'false_positives': self.stats['false_positives'],
+            'observed_error_rate': (
+                self.stats['false_positives'] / (self.stats['false_positives'] + self.stats['negatives'])
+                if self.stats['false_positives'] + self.stats['negatives'] else 0.0
+            ),
+            'pulls': self.stats['pulls'],
+            'rebuilds': self.stats['rebuilds'],
+            'synced_at': self.synced_at,
+        }
+
+        bloom = self.bloom
+        if bloom is not None:
+            stats.update({
+                'capacity': bloom.capacity,
+                'items': bloom.count,
+                'size_bits': bloom.size,
+                'size_bytes': len(bloom.bits),
+                'hash_count': bloom.hash_count,
+                'target_error_rate': bloom.error_rate,
+                'estimated_error_rate': bloom.estimated_error_rate(),
+            })
+
+        return stats
+
+
+token_blacklist_filter = TokenBlacklistFilter()
+
+
+class FilteredRefreshToken(RefreshToken):
+    """
+    `RefreshToken` checking the blacklist through `token_blacklist_filter`.
+    """
+
+    def check_blacklist(self):
+        if token_blacklist_filter.is_blacklisted(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError(_("Token is blacklisted"))
+
+    def blacklist(self):
+        blacklisted = super().blacklist()
+        token_blacklist_filter.add(self.payload[api_settings.JTI_CLAIM])
+        return blacklisted
@@ -0,0 +1,62 @@
+import timeit
+from django.core.management.base import BaseCommand
+from django.test import RequestFactory
+from rest_framework.request import Request
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.tokens import AccessToken
+from nativo_english.api.admin.permissions import IsAdminUserRole
+from nativo_english.api.shared.auth.authentication import get_validated_token
+from nativo_english.api.shared.auth.views import is_token_present_in_header
+
+
+class Command(BaseCommand):
+    help = (
+        'Measures the token work of authentication plus the admin role permission per request, '
+        'decoding the token in both (previous behaviour) against decoding it once per request'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--number', type=int, default=5000, help='Requests per measurement (default: 5000)')
+        parser.add_argument('--repeat', type=int, default=5, help='Measurements, the best one is reported (default: 5)')
+
+    def handle(self, *args, **options):
+        number, repeat = options['number'], options['repeat']
+
+        token = AccessToken()
+        token['user_id'] = 1
+        token['role'] = 'admin'
+        factory = RequestFactory()
+
+        def new_request():
+            return Request(factory.get('/api/admin/course/', HTTP_AUTHORIZATION=f'Bearer {token}'))
+
+        permission = IsAdminUserRole()
+
+        def decode_twice():
+            request = new_request()
+            jwt_auth = JWTAuthentication()
+
+            # Authentication (the user lookup is left out, it is the same query in both paths)
+            validated_token = jwt_auth.get_validated_token(jwt_auth.get_raw_token(jwt_auth.get_header(request)))
+
+            # The role permission extracted the header and verified the token again
+            validated_token = JWTAuthentication().get_validated_token(is_token_present_in_header(request))
+            return validated_token.get('role') == 'admin'
+
+        def decode_once():
+            request = new_request()
+            get_validated_token(request)
+            return permission.has_permission(request, None)
+
+        self.stdout.write(f'Authenticating an admin request, best of {repeat} x {number} requests')
+        results = {}
+        for name, check in [('decode per check', decode_twice), ('decode per request', decode_once)]:
+            best = min(timeit.repeat(check, number=number, repeat=repeat))
+            results[name] = best / number
+            self.stdout.write(f'{name:<20} {results[name] * 1e6:8.1f} us/request')
+
+        saved = results['decode per check'] - results['decode per request']
+        self.stdout.write(self.style.SUCCESS(
+            f'Decoding once saves {saved * 1e6:.1f} us per request '
+            f'({saved / results["decode per check"]:.0%} of the token work)'
+        ))
@@ -0,0 +1,179 @@
+import secrets
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import timedelta
+import redis
+from django.conf import settings
+from django.utils import timezone
+from django.utils.module_loading import import_string
+from nativo_english.api.shared.user.models import OTP
+from nativo_english.api.shared.notifications.outbox import enqueue_email
+
+# How long an OTP can be used, and how many wrong codes void it
+OTP_VALIDITY = timedelta(minutes=5)
+OTP_MAX_ATTEMPTS = 5
+
+OTP_BACKENDS = {
+    'redis': 'nativo_english.api.shared.auth.otp.RedisOTPBackend',
+    'orm': 'nativo_english.api.shared.auth.otp.ORMOTPBackend',
+    'locmem': 'nativo_english.api.shared.auth.otp.LocMemOTPBackend',
+}
+
+
+def generate_otp_code():
+    return f'{secrets.randbelow(10 ** 6):06d}'
+
+
+class BaseOTPBackend(ABC):
+    """
+    Stores the one time passwords of the 2FA login.
+
+    `issue` replaces any unused OTP of the user with a new one and emails it, `verify` consumes it:
+    a code verifies at most once, expires after `OTP_VALIDITY`, and `OTP_MAX_ATTEMPTS` wrong codes void it.
+    A backend missing `store` or `verify` fails when it is instantiated.
+    """
+
+    def issue(self, user):
+        """
+        Issues a new OTP for `user`, invalidating the previous ones, and emails it. Returns the code.
+        """
+        otp = generate_otp_code()
+        self.store(user.id, otp)
+        enqueue_email("otp_email", user.email, {
+            "user_name": user.email,
+            "otp": otp,
+            "otp_validity_minutes": int(OTP_VALIDITY.total_seconds() // 60),
+        })
+
+        return otp
+
+    @abstractmethod
+    def store(self, user_id, otp):
+        """
+        Saves `otp` as the only valid OTP of the user.
+        """
+
+    @abstractmethod
+    def verify(self, user_id, otp):
+        """
+        Returns whether `otp` is the current OTP of the user, consuming it if so.
+        """
+
+
+class RedisOTPBackend(BaseOTPBackend):
+    """
+    OTPs kept in Redis hashes expiring on their own (no table to purge).
+
+    Issuing is one pipelined write and verifying one script call, the script compares, counts the
+    attempt and deletes the code atomically so concurrent verifications cannot use it twice.
+    """
+    VERIFY_SCRIPT = """
+        local otp = redis.call('HGET', KEYS[1], 'otp')
+        if not otp then
+            return 0
+        end
+        if otp == ARGV[1] then
+            redis.call('DEL', KEYS[1])
+            return 1
+        end
+        if redis.call('HINCRBY', KEYS[1], 'attempts', 1) >= tonumber(ARGV[2]) then
+            redis.call('DEL', KEYS[1])
+        end
+        return 0
+    """
+
+    def __init__(self):
+        self.client = redis.Redis.from_url(settings.OTP_REDIS_URL)
+        self.verify_script = self.client.register_script(self.VERIFY_SCRIPT)
+
+    @staticmethod
+    def key(user_id):
+        return f'ne:otp:{user_id}'
+
+    def store(self, user_id, otp):
+        key = self.key(user_id)
+        with self.client.pipeline() as pipe:
+            pipe.hset(key, mapping={'otp': otp, 'attempts': 0})
+            pipe.expire(key, OTP_VALIDITY)
+            pipe.execute()
+
+    def verify(self, user_id, otp):
+        if not otp:
+            return False
+
+        return bool(self.verify_script(keys=[self.key(user_id)], args=[str(otp), OTP_MAX_ATTEMPTS]))
+
+
+class LocMemOTPBackend(BaseOTPBackend):
+    """
+    Per-process in-memory stand-in of `RedisOTPBackend`, for tests and local development.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.otps = {}
+
+    def store(self, user_id, otp):
+        with self.lock:
+            self.otps[user_id] = [otp, 0, time.monotonic() + OTP_VALIDITY.total_seconds()]
+
+    def verify(self, user_id, otp):
+        with self.lock:
+            entry = self.otps.get(user_id)
+            if entry is None or not otp:
+                return False
+
+            code, attempts, expires_at = entry
+            if time.monotonic() > expires_at:
+                del self.otps[user_id]
+                return False
+
+            if code == str(otp):
+                del self.otps[user_id]
+                return True
+
+            entry[1] = attempts + 1
+            if entry[1] >= OTP_MAX_ATTEMPTS:
+                del self.otps[user_id]
+            return False
+
+
+class ORMOTPBackend(BaseOTPBackend):
+    """
+    OTPs kept in the `OTP` table, the fallback when Redis is not available.
+
+    The email goes out through the `OTP` post_save signal. Wrong attempts are not counted.
+    """
+
+    def issue(self, user):
+        otp = generate_otp_code()
+        self.store(user.id, otp)
+
+        return otp
+
+    def store(self, user_id, otp):
+        OTP.objects.filter(user_id=user_id, is_used=False).update(is_used=True)
+        OTP.objects.create(user_id=user_id, otp=otp, expires_at=timezone.now() + OTP_VALIDITY)
+
+    def verify(self, user_id, otp):
+        # The conditional update consumes the code at most once under concurrent verifications
+        return bool(
+            OTP.objects
+            .filter(user_id=user_id, otp=otp, is_used=False, expires_at__gte=timezone.now())
+            .update(is_used=True)
+        )
+
+
+_otp_backend = None
+
+
+def get_otp_backend():
+    """
+    Returns the OTP backend selected by the `OTP_BACKEND` setting (redis | orm | locmem).
+    """
+    global _otp_backend
+    if _otp_backend is None:
+        _otp_backend = import_string(OTP_BACKENDS[settings.OTP_BACKEND])()
+
+    return _otp_backend
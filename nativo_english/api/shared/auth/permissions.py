@@ -0,0 +1,27 @@
+from rest_framework import permissions
+from rest_framework.exceptions import PermissionDenied, AuthenticationFailed
+from nativo_english.api.shared import messages
+from .authentication import get_validated_token
+
+
+class HasRoleClaim(permissions.BasePermission):
+    """
+    Base permission allowing access to users whose access token carries the `role` claim of the subclass.
+
+    The claims come from the token validated during authentication (see `get_validated_token`),
+    the check itself does no crypto work nor database query.
+    """
+    role = None
+
+    def has_permission(self, request, view):
+        validated_token = get_validated_token(request)
+
+        if validated_token is None:
+            raise AuthenticationFailed("Authorization token is missing.")
+
+        # Extract 'role' from JWT payload
+        if validated_token.get('role') == self.role:
+            return True
+
+        # Raise a permission denied exception with a custom message
+        raise PermissionDenied(detail=messages.PERMISSION_DENIED_MESSAGE)
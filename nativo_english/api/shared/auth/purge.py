@@ -0,0 +1,100 @@
+import logging
+import time
+from collections import Counter
+from datetime import timedelta
+from django.conf import settings
+from django.db import OperationalError, connection, transaction
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+from nativo_english.api.shared.user.models import OTP, TempToken, PasswordResetRequest
+
+logger = logging.getLogger(__name__)
+
+# Retries of a batch that could not get its row locks in time, the pause doubles on every retry
+MAX_LOCK_RETRIES = 5
+
+
+def purge_in_batches(queryset, batch_size=None, pause=None):
+    """
+    Deletes the rows of `queryset` in small primary key ordered (keyset) batches.
+
+    Every batch is its own short transaction running with a `lock_timeout`, so the purge never holds
+    locks for long nor queues behind a busy row: a batch that times out is retried after a growing
+    pause. The job sleeps `pause` seconds between batches to leave room to the regular traffic.
+
+    Args:
+        queryset (QuerySet): Rows to delete.
+        batch_size (int, optional): Rows per batch. Defaults to `AUTH_PURGE_BATCH_SIZE`.
+        pause (float, optional): Seconds between batches. Defaults to `AUTH_PURGE_BATCH_PAUSE`.
+
+    Returns:
+        Counter: Rows deleted per table (cascaded deletes included), keyed by model label.
+    """
+    batch_size = batch_size or settings.AUTH_PURGE_BATCH_SIZE
+    pause = settings.AUTH_PURGE_BATCH_PAUSE if pause is None else pause
+
+    purged = Counter()
+    last_pk = 0
+    retries = 0
+
+    while True:
+        pks = list(
+            queryset.filter(pk__gt=last_pk).order_by('pk').values_list('pk', flat=True)[:batch_size]
+        )
+        if not pks:
+            return purged
+
+        try:
+            with transaction.atomic():
+                with connection.cursor() as cursor:
+                    cursor.execute("SET LOCAL lock_timeout = %s", [settings.AUTH_PURGE_LOCK_TIMEOUT])
+
+                # Filtered again, a row may have been updated since it was selected
+                _, deleted = queryset.filter(pk__in=pks).delete()
+        except OperationalError as ex:
+            retries += 1
+            if retries > MAX_LOCK_RETRIES:
+                raise
+
+            logger.warning('Purge of %s backing off after: %s', queryset.model._meta.label, ex)
+            time.sleep(pause * 2 ** retries)
+            continue
+
+        purged.update(deleted)
+        last_pk = pks[-1]
+        retries = 0
+
+        if len(pks) < batch_size:
+            return purged
+
+        time.sleep(pause)
+
+
+def purge_expired_auth_rows():
+    """
+    Purges the authentication rows nobody can use anymore: expired OTPs (and their temp tokens),
+    expired temp tokens, password reset requests older than `PASSWORD_RESET_TIMEOUT` and the
+    outstanding (and blacklisted) refresh tokens past their expiry.
+
+    Returns:
+        dict: Rows deleted per table.
+    """
+    now = timezone.now()
+    purges = [
+        OTP.objects.filter(expires_at__lt=now),
+        TempToken.objects.filter(expires_at__lt=now),
+        PasswordResetRequest.objects.filter(
+            requested_at__lt=now - timedelta(seconds=settings.PASSWORD_RESET_TIMEOUT)
+        ),
+        # Deleting an outstanding token cascades to its blacklist entry
+        OutstandingToken.objects.filter(expires_at__lt=now),
+    ]
+
+    purged = Counter()
+    for queryset in purges:
+        purged.update(purge_in_batches(queryset))
+
+    for label, count in sorted(purged.items()):
+        logger.info('Purged %s expired %s rows', count, label)
+
+    return dict(purged)
@@ -2,7 +2,8 @@ from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
 from django.contrib.auth import authenticate
 from nativo_english.api.shared.user.models import User, UserPrefs, OTP, TempToken
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+from .blacklist import FilteredRefreshToken
 
 # Register Serializer
 class RegisterSerializer(serializers.ModelSerializer):
@@ -56,6 +57,11 @@ class ResendOtpRequestSerializer(serializers.Serializer):
 # Serializer for logout
 class LogoutSerializer(serializers.Serializer):
     refresh_token = serializers.CharField()
+
+# Refresh Serializer, checks the blacklist through the per worker filter
+class FilteredTokenRefreshSerializer(TokenRefreshSerializer):
+    token_class = FilteredRefreshToken
+
 class ForgotPasswordSerializer(serializers.Serializer):
     email = serializers.EmailField()
 
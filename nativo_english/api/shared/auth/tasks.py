@@ -0,0 +1,12 @@
+# auth/tasks.py
+from celery import shared_task
+from .purge import purge_expired_auth_rows
+
+
+@shared_task
+def purge_expired_auth_rows_task():
+    """
+    Periodic purge of the expired OTP, temp token, password reset and refresh token rows,
+    scheduled by celery beat (see `CELERY_BEAT_SCHEDULE`). Returns the rows purged per table.
+    """
+    return purge_expired_auth_rows()
@@ -4,7 +4,12 @@ from rest_framework_simplejwt.views import TokenObtainPairView
 from .serializers import RegisterSerializer, LoginSerializer, TwoFactorSerializer, VerifyOTPSerializer, ResendOtpRequestSerializer, LogoutSerializer, ForgotPasswordSerializer
 from nativo_english.api.shared.utils import api_response
 from rest_framework.views import APIView
-from nativo_english.api.shared.user.models import UserPrefs, OTP, User
+from nativo_english.api.shared.user.models import UserPrefs, User, PasswordResetRequest
+from nativo_english.api.shared.notifications.outbox import enqueue_email
+from django.conf import settings
+from django.db import transaction
+from .otp import get_otp_backend
+from .blacklist import FilteredRefreshToken
 from rest_framework_simplejwt.tokens import RefreshToken, AccessToken
 from datetime import timedelta
 from rest_framework.permissions import IsAuthenticated
@@ -53,11 +58,8 @@ class LoginView(TokenObtainPairView):
         user_prefs = UserPrefs.objects.filter(fk_user_id=user).first()
         if user_prefs and user_prefs.enable_2fa:
             
-            OTP.objects.filter(user=user, is_used=False).update(is_used=True)
-
-           
-            otp_obj = OTP(user=user)
-            otp_obj.generate_otp()
+            # Replaces any unused OTP of the user and emails the new one
+            get_otp_backend().issue(user)
 
             # Create a temporary token
             temp_token = RefreshToken.for_user(user).access_token
@@ -134,18 +136,13 @@ class VerifyOtpView(APIView):
         validated_token = jwt_auth.get_validated_token(temp_token_value)
         user_id = validated_token.get("user_id")
 
-        # Fetch OTP and validate
-        otp_obj = OTP.objects.filter(user_id=user_id, otp=otp_input, is_used=False).first()
-        if not otp_obj or not otp_obj.is_valid():
+        # Validate the OTP and mark it as used
+        if not get_otp_backend().verify(user_id, otp_input):
             return api_response(
                 status.HTTP_400_BAD_REQUEST,
                 "Invalid or expired OTP."
             )
 
-        # Mark OTP as used
-        otp_obj.is_used = True
-        otp_obj.save()
-
         # Get user object
         user = User.objects.get(id=user_id)
 
@@ -213,15 +210,8 @@ class ResendOtpView(APIView):
                     message="User does not have 2FA enabled."
                 )
 
-            # Mark previous OTPs as used
-            previous_otps = OTP.objects.filter(user=user, is_used=False)
-            previous_otps.update(is_used=True)
-
-            # Generate OTP
-            # otp_obj = OTP.objects.create(user=user)
-            # otp_obj.generate_otp()
-            otp_obj = OTP(user=user)
-            otp_obj.generate_otp()
+            # Replace the previous OTPs with a new one
+            get_otp_backend().issue(user)
 
             # Include role in response
             role = user.role  # Directly access the role field
@@ -253,7 +243,7 @@ class LogoutView(APIView):
             return api_response(status.HTTP_400_BAD_REQUEST, message="Refresh token is required")
             
         # Blacklist the refresh token
-        token = RefreshToken(refresh_token)
+        token = FilteredRefreshToken(refresh_token)
         token.blacklist()
 
         return api_response(status.HTTP_200_OK, message="Logout successful")
@@ -276,8 +266,17 @@ class ForgotPasswordView(APIView):
 
         user = User.objects.get(email=email)  # Safe because of exists() check
 
-        # Create the PasswordResetRequest 
-        PasswordResetRequestTokenGenerator.objects.create(user=user)
+        uid = urlsafe_base64_encode(force_bytes(user.pk))
+        token = default_token_generator.make_token(user)
+
+        # Record the request and queue its email in the same transaction, the email goes out once committed
+        with transaction.atomic():
+            PasswordResetRequest.objects.create(user=user)
+            enqueue_email("reset_password", user.email, {
+                "user_name": user.username,
+                "reset_url": f"{settings.PASSWORD_RESET_URL}?uid={uid}&token={token}",
+                "link_validity_minutes": settings.PASSWORD_RESET_TIMEOUT // 60,
+            })
 
         return api_response(status.HTTP_200_OK, message="Password reset link sent to your email")
     
@@ -0,0 +1,60 @@
+import hashlib
+from functools import wraps
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+
+def make_etag(request, *parts):
+    """
+    Builds a strong ETag from the validator parts of a resource.
+
+    The path (query string included, e.g. pagination and filters) and the negotiated media type are
+    part of the tag, so different representations of the same rows never share it.
+    """
+    raw = '|'.join(str(part) for part in (request.get_full_path(), request.accepted_media_type, *parts))
+    return quote_etag(hashlib.md5(raw.encode('utf-8')).hexdigest())
+
+
+def conditional_get(validator, owned=False):
+    """
+    Adds conditional request support (If-None-Match / If-Modified-Since) to an APIView `get` method.
+
+    `validator(request, owner_id=None, **view_kwargs)` must be much cheaper than the view itself, it
+    returns `(etag, last_modified)` (either may be None) or None when the resource does not exist, in
+    which case the view runs as usual. When the client already has the current representation a 304
+    is returned without running the view, otherwise the validators are set on the 200 response.
+
+    Args:
+        validator (callable): Validator lookup of the resource.
+        owned (bool): Scope the lookup to the courses of the requesting user (teacher role).
+    """
+    def decorator(view_method):
+        @wraps(view_method)
+        def wrapper(view, request, *args, **kwargs):
+            owner_id = request.user.id if owned else None
+            etag, last_modified = validator(request, owner_id=owner_id, **kwargs) or (None, None)
+            last_modified = int(last_modified.timestamp()) if last_modified else None
+
+            if etag or last_modified:
+                not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+                if not_modified is not None:
+                    return _set_validators(not_modified, etag, last_modified)
+
+            response = view_method(view, request, *args, **kwargs)
+
+            if response.status_code == 200:
+                _set_validators(response, etag, last_modified)
+
+            return response
+        return wrapper
+    return decorator
+
+
+def _set_validators(response, etag, last_modified):
+    if etag:
+        response.headers['ETag'] = etag
+    if last_modified:
+        response.headers['Last-Modified'] = http_date(last_modified)
+    # Always revalidate, the validators make that cheap
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response
@@ -6,3 +6,6 @@ class CourseConfig(AppConfig):
     name = 'nativo_english.api.shared.course'
     label = 'course'  # Unique label for this app
     verbose_name = "Course/Lesson/Content app"  # Optional
+
+    def ready(self):
+        import nativo_english.api.shared.course.signals  # Import the signals module
@@ -0,0 +1,110 @@
+import logging
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+COURSE_DETAIL_HITS_KEY = 'course_detail:stats:hits'
+COURSE_DETAIL_MISSES_KEY = 'course_detail:stats:misses'
+
+
+def _course_detail_version_key(course_id):
+    return f'course_detail:{course_id}:version'
+
+
+def course_detail_cache_key(course_id, version, owner_id=None):
+    """
+    Builds the cache key of a course detail.
+
+    Admin (unscoped) and teacher (owner scoped) lookups never share a key, and every key embeds the
+    course version so bumping it invalidates all scopes of the course at once.
+    """
+    scope = f'owner:{owner_id}' if owner_id is not None else 'admin'
+    return f'course_detail:{course_id}:v{version}:{scope}'
+
+
+def _incr(key):
+    """
+    Increments a counter key, creating it on first use (never expires).
+    """
+    if not cache.add(key, 1, timeout=None):
+        try:
+            cache.incr(key)
+        except ValueError:
+            # Evicted between add and incr
+            cache.set(key, 1, timeout=None)
+
+
+def _record(counter_key):
+    """
+    Bumps a hit / miss counter, losing a sample is fine but failing the request is not.
+    """
+    try:
+        _incr(counter_key)
+    except Exception as ex:
+        logger.warning('Could not record course detail cache stats: %s', ex)
+
+
+def get_cached_course_detail(course_id, owner_id, loader):
+    """
+    Read-through cache of the course detail.
+
+    Args:
+        course_id (int): The unique identifier of the course.
+        owner_id (int, optional): Owner the lookup is restricted to (teacher role).
+        loader (callable): Called on a miss, returns the course detail dict (empty if not found).
+
+    Returns:
+        dict: The course detail, from the cache when possible.
+    """
+    try:
+        version = cache.get(_course_detail_version_key(course_id), 0)
+        key = course_detail_cache_key(course_id, version, owner_id)
+        course_data = cache.get(key)
+    except Exception as ex:
+        # The cache is an optimization, serve from the database while Redis is unavailable
+        logger.warning('Course detail cache unavailable: %s', ex)
+        return loader()
+
+    if course_data is not None:
+        _record(COURSE_DETAIL_HITS_KEY)
+        return course_data
+
+    _record(COURSE_DETAIL_MISSES_KEY)
+    course_data = loader()
+
+    # Not found / not owned results are not cached, they are cheap and would only fill the cache
+    if course_data:
+        try:
+            cache.set(key, course_data, timeout=settings.COURSE_DETAIL_CACHE_TIMEOUT)
+        except Exception as ex:
+            logger.warning('Course detail cache unavailable: %s', ex)
+
+    return course_data
+
+
+def invalidate_course_detail(course_id):
+    """
+    Invalidates every cached detail (admin and all owner scopes) of a course.
+    """
+    try:
+        _incr(_course_detail_version_key(course_id))
+    except Exception as ex:
+        # Entries expire after COURSE_DETAIL_CACHE_TIMEOUT anyway
+        logger.warning('Could not invalidate the cached detail of course %s: %s', course_id, ex)
+
+
+def get_course_detail_cache_stats():
+    """
+    Returns the hit / miss counters of the course detail cache.
+    """
+    counters = cache.get_many([COURSE_DETAIL_HITS_KEY, COURSE_DETAIL_MISSES_KEY])
+    hits = counters.get(COURSE_DETAIL_HITS_KEY, 0)
+    misses = counters.get(COURSE_DETAIL_MISSES_KEY, 0)
+    lookups = hits + misses
+
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_ratio': round(hits / lookups, 4) if lookups else None,
+    }
@@ -0,0 +1,86 @@
+# Validator lookups of the course, section and lesson reads, see `conditional_get`.
+# Each one reads only updated_at / counters (served by the covering indexes on the child tables)
+# instead of running the full query of the view. Collections also hash their row count, so a deleted
+# row changes the ETag although it leaves max(updated_at) untouched; Last-Modified is only sent for
+# single rows, where max(updated_at) is exact.
+from django.db.models import Count, Max
+from nativo_english.api.shared.conditional import make_etag
+from nativo_english.api.shared.db_helper import call_plpgsql_function
+from .models import Course, CourseSection, CourseLesson
+from .views import get_request_language
+
+
+def course_detail_validator(request, id, owner_id=None, **kwargs):
+    courses = Course.objects.filter(pk=id)
+    if owner_id is not None:
+        courses = courses.filter(owner=owner_id)
+
+    # enrollment_count and the rating aggregate are maintained by triggers without touching updated_at,
+    # and the owner / creator / last editor names shown by the detail live in the user table
+    course = courses.values_list(
+        'updated_at', 'enrollment_count', 'rating_count', 'rating_sum',
+        'owner__first_name', 'owner__last_name', 'created_by__first_name', 'created_by__last_name',
+        'modified_by__first_name', 'modified_by__last_name',
+    ).first()
+    if course is None:
+        return None
+
+    return make_etag(request, *course), None
+
+
+def course_tree_validator(request, id, owner_id=None, **kwargs):
+    version = call_plpgsql_function('course_tree_version_get', id, owner_id)
+    if not version:
+        return None
+
+    return make_etag(request, get_request_language(request), *version[0].values()), None
+
+
+def course_section_list_validator(request, course_id, owner_id=None, **kwargs):
+    sections = CourseSection.objects.filter(fk_course_id=course_id)
+    if owner_id is not None:
+        sections = sections.filter(fk_course_id__owner=owner_id)
+
+    version = sections.aggregate(last_modified=Max('updated_at'), total=Count('id'))
+    if not version['total']:
+        return None
+
+    return make_etag(request, version['last_modified'], version['total']), None
+
+
+def course_section_validator(request, course_id, course_section_id, **kwargs):
+    updated_at = (
+        CourseSection.objects
+        .filter(pk=course_section_id, fk_course_id=course_id)
+        .values_list('updated_at', flat=True)
+        .first()
+    )
+    if updated_at is None:
+        return None
+
+    return make_etag(request, updated_at), updated_at
+
+
+def course_lesson_list_validator(request, course_section_id, **kwargs):
+    version = (
+        CourseLesson.objects
+        .filter(fk_section_id=course_section_id, is_active=True)
+        .aggregate(last_modified=Max('updated_at'), total=Count('id'))
+    )
+    if not version['total']:
+        return None
+
+    return make_etag(request, version['last_modified'], version['total']), None
+
+
+def course_lesson_validator(request, course_lesson_id, **kwargs):
+    updated_at = (
+        CourseLesson.objects
+        .filter(pk=course_lesson_id, is_active=True)
+        .values_list('updated_at', flat=True)
+        .first()
+    )
+    if updated_at is None:
+        return None
+
+    return make_etag(request, updated_at), updated_at
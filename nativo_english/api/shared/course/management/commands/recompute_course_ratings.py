@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Count, F, FloatField, IntegerField, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+from nativo_english.api.shared.course.models import Course, CourseRating
+
+
+class Command(BaseCommand):
+    help = 'Recomputes rating_sum, rating_count and avg_rating of courses from their ratings'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--course-id', type=int, action='append', dest='course_ids',
+                            help='Only recompute this course (can be repeated)')
+
+    def handle(self, *args, **options):
+        ratings = (
+            CourseRating.objects
+            .filter(fk_course_id=OuterRef('pk'))
+            .order_by()
+            .values('fk_course_id')
+        )
+        rating_sum = Coalesce(
+            Subquery(ratings.annotate(total=Sum('rating')).values('total'), output_field=FloatField()),
+            Value(0.0),
+        )
+        rating_count = Coalesce(
+            Subquery(ratings.annotate(total=Count('id')).values('total'), output_field=IntegerField()),
+            Value(0),
+        )
+
+        courses = Course.objects.all()
+        if options['course_ids']:
+            courses = courses.filter(pk__in=options['course_ids'])
+
+        with transaction.atomic():
+            # Block rating writes while recomputing so the course_rating_aggregate_trigger
+            # cannot apply a change the recomputed aggregate already includes (reads are not blocked)
+            with connection.cursor() as cursor:
+                cursor.execute(f'LOCK TABLE {CourseRating._meta.db_table} IN SHARE MODE')
+
+            updated = courses.update(rating_sum=rating_sum, rating_count=rating_count)
+            # Derived in a second statement, the SET expressions of one UPDATE all see the old row
+            courses.filter(rating_count__gt=0).update(avg_rating=F('rating_sum') / F('rating_count'))
+            courses.filter(rating_count=0).update(avg_rating=0.0)
+
+        self.stdout.write(self.style.SUCCESS(f'Recomputed the rating aggregate of {updated} course(s)'))
@@ -0,0 +1,56 @@
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from nativo_english.api.shared.course.models import Course, CourseEnrollment
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the enrollment_count counter of courses from their active enrollments'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--course-id', type=int, action='append', dest='course_ids',
+                            help='Only reconcile this course (can be repeated)')
+        parser.add_argument('--dry-run', action='store_true',
+                            help='Report the drifted courses without fixing them')
+
+    def handle(self, *args, **options):
+        active_enrollments = (
+            CourseEnrollment.objects
+            .filter(fk_course_id=OuterRef('pk'), is_active=True)
+            .order_by()
+            .values('fk_course_id')
+            .annotate(total=Count('id'))
+            .values('total')
+        )
+        actual_count = Coalesce(Subquery(active_enrollments, output_field=IntegerField()), Value(0))
+
+        courses = Course.objects.all()
+        if options['course_ids']:
+            courses = courses.filter(pk__in=options['course_ids'])
+
+        with transaction.atomic():
+            if not options['dry_run']:
+                # Block enrollment writes while counting so the course_enrollment_count_trigger
+                # cannot apply a change the rebuilt counter already includes (reads are not blocked)
+                with connection.cursor() as cursor:
+                    cursor.execute(f'LOCK TABLE {CourseEnrollment._meta.db_table} IN SHARE MODE')
+
+            drifted = list(
+                courses
+                .annotate(actual_count=actual_count)
+                .exclude(enrollment_count=F('actual_count'))
+                .values_list('pk', 'enrollment_count', 'actual_count')
+            )
+            for course_id, stored, actual in drifted:
+                self.stdout.write(f"Course {course_id}: enrollment_count {stored} -> {actual}")
+
+            if drifted and not options['dry_run']:
+                Course.objects.filter(pk__in=[course_id for course_id, _, _ in drifted]).update(enrollment_count=actual_count)
+
+        if not drifted:
+            self.stdout.write(self.style.SUCCESS('Enrollment counters are in sync'))
+        elif options['dry_run']:
+            self.stdout.write(self.style.WARNING(f'{len(drifted)} course(s) have a drifted enrollment counter'))
+        else:
+            self.stdout.write(self.style.SUCCESS(f'Reconciled the enrollment counter of {len(drifted)} course(s)'))
@@ -0,0 +1,40 @@
+# Generated by Django 5.1.2 on 2026-10-18 10:01
+
+import django.db.models.functions.comparison
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('course', '0007_alter_lessoncontent_language'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='course',
+            index=models.Index(fields=['is_active', 'id'], name='course_active_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='course',
+            index=models.Index(fields=['is_active', 'title', 'id'], name='course_active_title_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='course',
+            index=models.Index(models.F('is_active'), django.db.models.functions.comparison.Coalesce('price', models.Value(0.0)), models.F('id'), name='course_active_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='course',
+            index=models.Index(fields=['is_active', 'avg_rating', 'id'], name='course_active_rating_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='course',
+            index=models.Index(fields=['is_active', 'created_at', 'id'], name='course_active_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='course',
+            index=models.Index(fields=['is_active', 'updated_at', 'id'], name='course_active_updated_idx'),
+        ),
+    ]
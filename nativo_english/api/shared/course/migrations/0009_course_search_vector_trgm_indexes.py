@@ -0,0 +1,92 @@
+# Generated by Django 5.1.2 on 2026-10-18 10:03
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+# Search document of a course (title weighted A, description B) in the catalog languages, the
+# query side ORs the same languages. The trigger keeps search_vector in sync and lives with the
+# column rather than in db_scripts, which run before this migration on a fresh database.
+COURSE_SEARCH_SQL = """
+CREATE OR REPLACE FUNCTION course_search_vector_build(p_title TEXT, p_description TEXT)
+RETURNS TSVECTOR AS
+$$
+    SELECT
+        setweight(to_tsvector('english'::REGCONFIG, COALESCE(p_title, '')), 'A') ||
+        setweight(to_tsvector('french'::REGCONFIG, COALESCE(p_title, '')), 'A') ||
+        setweight(to_tsvector('spanish'::REGCONFIG, COALESCE(p_title, '')), 'A') ||
+        setweight(to_tsvector('english'::REGCONFIG, COALESCE(p_description, '')), 'B') ||
+        setweight(to_tsvector('french'::REGCONFIG, COALESCE(p_description, '')), 'B') ||
+        setweight(to_tsvector('spanish'::REGCONFIG, COALESCE(p_description, '')), 'B');
+$$ LANGUAGE sql IMMUTABLE;
+
+-- Search query matching a document built by course_search_vector_build in any of the languages
+CREATE OR REPLACE FUNCTION course_search_tsquery(p_search_query TEXT)
+RETURNS TSQUERY AS
+$$
+    SELECT
+        websearch_to_tsquery('english'::REGCONFIG, COALESCE(p_search_query, '')) ||
+        websearch_to_tsquery('french'::REGCONFIG, COALESCE(p_search_query, '')) ||
+        websearch_to_tsquery('spanish'::REGCONFIG, COALESCE(p_search_query, ''));
+$$ LANGUAGE sql IMMUTABLE;
+
+-- Trigger function maintaining the search document
+CREATE OR REPLACE FUNCTION course_search_vector_set()
+RETURNS TRIGGER AS
+$$
+BEGIN
+    NEW.search_vector := course_search_vector_build(NEW.title, NEW.description);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER course_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF title, description ON course_course
+    FOR EACH ROW
+    EXECUTE FUNCTION course_search_vector_set();
+
+-- Backfill existing courses
+UPDATE course_course
+SET search_vector = course_search_vector_build(title, description)
+WHERE search_vector IS NULL;
+"""
+
+COURSE_SEARCH_ROLLBACK_SQL = """
+DROP TRIGGER IF EXISTS course_search_vector_trigger ON course_course;
+DROP FUNCTION IF EXISTS course_search_vector_set();
+DROP FUNCTION IF EXISTS course_search_vector_build(TEXT, TEXT);
+DROP FUNCTION IF EXISTS course_search_tsquery(TEXT);
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('course', '0008_course_keyset_pagination_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name='course',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='course',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='course_search_vector_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='course',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass('title', name='gin_trgm_ops'), name='course_title_trgm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='course',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass('description', name='gin_trgm_ops'), name='course_description_trgm_idx'),
+        ),
+        migrations.RunSQL(COURSE_SEARCH_SQL, reverse_sql=COURSE_SEARCH_ROLLBACK_SQL),
+    ]
@@ -0,0 +1,76 @@
+# Generated by Django 5.1.2 on 2026-10-18 10:06
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+# Keeps course_course.enrollment_count equal to the number of active enrollments of the course.
+# It runs in the transaction of the enrollment write, so the counter can never drift from a
+# committed enrollment; reconcile_enrollment_counts rebuilds it after bulk loads or TRUNCATEs.
+ENROLLMENT_COUNT_SQL = """
+CREATE OR REPLACE FUNCTION course_enrollment_count_set()
+RETURNS TRIGGER AS
+$$
+BEGIN
+    -- Nothing to do when neither the course nor the active flag changed
+    IF TG_OP = 'UPDATE'
+        AND OLD.fk_course_id = NEW.fk_course_id
+        AND OLD.is_active IS NOT DISTINCT FROM NEW.is_active THEN
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.is_active THEN
+        UPDATE course_course
+        SET enrollment_count = GREATEST(enrollment_count - 1, 0)
+        WHERE id = OLD.fk_course_id;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.is_active THEN
+        UPDATE course_course
+        SET enrollment_count = enrollment_count + 1
+        WHERE id = NEW.fk_course_id;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER course_enrollment_count_trigger
+    AFTER INSERT OR UPDATE OR DELETE ON course_courseenrollment
+    FOR EACH ROW
+    EXECUTE FUNCTION course_enrollment_count_set();
+
+-- Backfill existing courses
+UPDATE course_course c
+SET enrollment_count = (
+    SELECT COUNT(*)
+    FROM course_courseenrollment ce
+    WHERE ce.fk_course_id = c.id AND ce.is_active = TRUE
+);
+"""
+
+ENROLLMENT_COUNT_ROLLBACK_SQL = """
+DROP TRIGGER IF EXISTS course_enrollment_count_trigger ON course_courseenrollment;
+DROP FUNCTION IF EXISTS course_enrollment_count_set();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('course', '0009_course_search_vector_trgm_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='course',
+            name='enrollment_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='course',
+            index=models.Index(fields=['is_active', 'enrollment_count', 'id'], name='course_active_enrollments_idx'),
+        ),
+        migrations.RunSQL(ENROLLMENT_COUNT_SQL, reverse_sql=ENROLLMENT_COUNT_ROLLBACK_SQL),
+    ]
@@ -0,0 +1,84 @@
+# Generated by Django 5.1.2 on 2026-10-18 10:07
+
+from django.db import migrations, models
+
+
+# Keeps the running rating_sum / rating_count of course_course and avg_rating derived from them
+# in step with course_courserating, O(1) per rating write and in the transaction of the write.
+# recompute_course_ratings rebuilds the aggregate from the ratings.
+RATING_AGGREGATE_SQL = """
+CREATE OR REPLACE FUNCTION course_rating_aggregate_set()
+RETURNS TRIGGER AS
+$$
+BEGIN
+    -- Nothing to do when neither the course nor the rating changed
+    IF TG_OP = 'UPDATE'
+        AND OLD.fk_course_id = NEW.fk_course_id
+        AND OLD.rating = NEW.rating THEN
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE course_course
+        SET rating_sum = CASE WHEN rating_count > 1 THEN rating_sum - OLD.rating ELSE 0 END,
+            rating_count = GREATEST(rating_count - 1, 0),
+            avg_rating = CASE WHEN rating_count > 1 THEN (rating_sum - OLD.rating) / (rating_count - 1) ELSE 0 END
+        WHERE id = OLD.fk_course_id;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        UPDATE course_course
+        SET rating_sum = rating_sum + NEW.rating,
+            rating_count = rating_count + 1,
+            avg_rating = (rating_sum + NEW.rating) / (rating_count + 1)
+        WHERE id = NEW.fk_course_id;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER course_rating_aggregate_trigger
+    AFTER INSERT OR UPDATE OR DELETE ON course_courserating
+    FOR EACH ROW
+    EXECUTE FUNCTION course_rating_aggregate_set();
+
+-- Backfill existing courses
+UPDATE course_course c
+SET rating_sum = COALESCE(ratings.rating_sum, 0),
+    rating_count = COALESCE(ratings.rating_count, 0),
+    avg_rating = COALESCE(ratings.rating_sum / ratings.rating_count, 0)
+FROM course_course cc
+LEFT JOIN (
+    SELECT cr.fk_course_id, SUM(cr.rating) AS rating_sum, COUNT(*) AS rating_count
+    FROM course_courserating cr
+    GROUP BY cr.fk_course_id
+) ratings ON ratings.fk_course_id = cc.id
+WHERE cc.id = c.id;
+"""
+
+RATING_AGGREGATE_ROLLBACK_SQL = """
+DROP TRIGGER IF EXISTS course_rating_aggregate_trigger ON course_courserating;
+DROP FUNCTION IF EXISTS course_rating_aggregate_set();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('course', '0010_course_enrollment_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='course',
+            name='rating_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='course',
+            name='rating_sum',
+            field=models.FloatField(default=0.0, editable=False),
+        ),
+        migrations.RunSQL(RATING_AGGREGATE_SQL, reverse_sql=RATING_AGGREGATE_ROLLBACK_SQL),
+    ]
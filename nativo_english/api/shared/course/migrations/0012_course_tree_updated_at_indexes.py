@@ -0,0 +1,27 @@
+# Generated by Django 5.1.2 on 2026-10-18 10:11
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('course', '0011_course_rating_aggregate'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='courselesson',
+            index=models.Index(fields=['fk_section_id', 'is_active', 'updated_at'], name='lesson_section_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='coursesection',
+            index=models.Index(fields=['fk_course_id', 'updated_at'], name='section_course_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lessoncontent',
+            index=models.Index(fields=['fk_course_lesson_id', 'is_active', 'updated_at'], name='content_lesson_updated_idx'),
+        ),
+    ]
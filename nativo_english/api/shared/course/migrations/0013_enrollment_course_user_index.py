@@ -0,0 +1,19 @@
+# Generated by Django 5.1.2 on 2026-10-18 10:25
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('course', '0012_course_tree_updated_at_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='courseenrollment',
+            index=models.Index(fields=['fk_course_id', 'is_active', 'fk_user_id'], name='enrollment_course_user_idx'),
+        ),
+    ]
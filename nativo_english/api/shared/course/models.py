@@ -1,4 +1,8 @@
 from django.db import models
+from django.db.models import Avg, F, Value
+from django.db.models.functions import Coalesce
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
 from django.conf import settings
 from nativo_english.api.shared.user.models import User
 
@@ -24,24 +28,49 @@ class Course(models.Model):
     mode = models.CharField(choices=MODE_CHOICES, null=False)
     level = models.CharField(choices=COURSE_LEVEL, null=False)
     avg_rating = models.FloatField(max_length=5, default=0.0)    
+    # Running aggregate of the course ratings, maintained with avg_rating by the course_rating_aggregate_trigger
+    rating_sum = models.FloatField(default=0.0, editable=False)
+    rating_count = models.PositiveIntegerField(default=0, editable=False)
     is_active = models.BooleanField(default=False)
     owner = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, db_column='fk_owner_id')
 
+    # Number of active enrollments, maintained by the course_enrollment_count_trigger (see reconcile_enrollment_counts)
+    enrollment_count = models.PositiveIntegerField(default=0, editable=False)
+
+    # Full text search document of title and description, maintained by the course_search_vector_trigger
+    search_vector = SearchVectorField(null=True, editable=False)
+
     # Default Metadata fields
     created_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='course_created', db_column='created_by')
     modified_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='course_modified', db_column='modified_by')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        # Serve the keyset (cursor) pagination of courses_list_with_cursor_get, one index per sort field
+        indexes = [
+            models.Index(fields=['is_active', 'id'], name='course_active_id_idx'),
+            models.Index(fields=['is_active', 'title', 'id'], name='course_active_title_idx'),
+            models.Index(F('is_active'), Coalesce('price', Value(0.0)), F('id'), name='course_active_price_idx'),
+            models.Index(fields=['is_active', 'avg_rating', 'id'], name='course_active_rating_idx'),
+            models.Index(fields=['is_active', 'created_at', 'id'], name='course_active_created_idx'),
+            models.Index(fields=['is_active', 'updated_at', 'id'], name='course_active_updated_idx'),
+            models.Index(fields=['is_active', 'enrollment_count', 'id'], name='course_active_enrollments_idx'),
+
+            # Serve the catalog search: full text match on search_vector, ILIKE '%...%' on title / description
+            GinIndex(fields=['search_vector'], name='course_search_vector_idx'),
+            GinIndex(OpClass('title', name='gin_trgm_ops'), name='course_title_trgm_idx'),
+            GinIndex(OpClass('description', name='gin_trgm_ops'), name='course_description_trgm_idx'),
+        ]
+
     def calculate_avg_rating(self):
         """
-        Calculate and return the average rating for this course
+        Calculate and return the average rating for this course from all of its ratings.
+        avg_rating already holds this value, use this to verify or rebuild it (see recompute_course_ratings)
         """
         ratings = self.courserating_set.all()  # Related name is 'courserating_set' by default
-        if ratings.exists():
-            avg_rating = ratings.aggregate(Avg('rating'))['rating__avg']
-            return avg_rating
-        return 0.0  # Default to 0.0 if no ratings exist
+        avg_rating = ratings.aggregate(Avg('rating'))['rating__avg']
+        return avg_rating if avg_rating is not None else 0.0  # Default to 0.0 if no ratings exist
 
 # Course Section Model
 class CourseSection(models.Model):
@@ -55,6 +84,12 @@ class CourseSection(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        # Covers the validator lookups (max updated_at) of the conditional GETs, see etags.py
+        indexes = [
+            models.Index(fields=['fk_course_id', 'updated_at'], name='section_course_updated_idx'),
+        ]
+
 
 # Lesson Model of Course
 class CourseLesson(models.Model):
@@ -72,6 +107,10 @@ class CourseLesson(models.Model):
 
     class Meta:
         ordering = ['lesson_position']  # This makes sure the lessons are ordered by the 'lesson_position' field
+        # Covers the validator lookups (max updated_at) of the conditional GETs, see etags.py
+        indexes = [
+            models.Index(fields=['fk_section_id', 'is_active', 'updated_at'], name='lesson_section_updated_idx'),
+        ]
 
 
 # Content Model of Lesson of a course
@@ -102,6 +141,10 @@ class LessonContent(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     class Meta:
         ordering = ['lesson_content_position']  # This makes sure the lessons are ordered by the 'lesson_content_position' field
+        # Covers the validator lookups (max updated_at) of the conditional GETs, see etags.py
+        indexes = [
+            models.Index(fields=['fk_course_lesson_id', 'is_active', 'updated_at'], name='content_lesson_updated_idx'),
+        ]
 
 # # Content Translation
 # class ContentTranslation(models.Model):
@@ -126,6 +169,12 @@ class CourseEnrollment(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # Active students of a course in user id order (notification fan-out)
+            models.Index(fields=['fk_course_id', 'is_active', 'fk_user_id'], name='enrollment_course_user_idx'),
+        ]
+
 
 # Course Ratings
 class CourseRating(models.Model):
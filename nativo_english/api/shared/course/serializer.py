@@ -6,7 +6,18 @@ class CourseSerializer(serializers.ModelSerializer):
         model = Course
         fields = [
             'id', 'title', 'description', 'is_paid', 'price', 'mode', 'level', 'avg_rating', 'is_active', 'owner']
-        
+        # Maintained from the course ratings by the course_rating_aggregate_trigger
+        read_only_fields = ['avg_rating']
+
+    def update(self, instance, validated_data):
+        for field, value in validated_data.items():
+            setattr(instance, field, value)
+
+        # Only write the fields sent: saving the whole row would put back the rating and enrollment
+        # aggregates as they were loaded, undoing the trigger updates made meanwhile
+        instance.save(update_fields=[*validated_data, 'updated_at'])
+        return instance
+
 class CourseSectionSerializer(serializers.ModelSerializer):
     class Meta:
         model = CourseSection
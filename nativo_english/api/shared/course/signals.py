@@ -0,0 +1,42 @@
+# nativo_english/api/shared/course/signals.py
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from nativo_english.api.shared.course.cache import invalidate_course_detail
+from nativo_english.api.shared.course.models import Course, CourseEnrollment, CourseRating
+from nativo_english.api.shared.user.models import User
+
+
+@receiver(post_save, sender=Course)
+@receiver(post_delete, sender=Course)
+def course_changed(sender, instance, **kwargs):
+    transaction.on_commit(lambda: invalidate_course_detail(instance.pk))
+
+
+@receiver(post_save, sender=CourseEnrollment)
+@receiver(post_delete, sender=CourseEnrollment)
+@receiver(post_save, sender=CourseRating)
+@receiver(post_delete, sender=CourseRating)
+def course_counters_changed(sender, instance, **kwargs):
+    # enrollment_count / avg_rating of the course were updated by the database triggers,
+    # invalidate once the write is committed so a concurrent read cannot re-cache the old values
+    course_id = instance.fk_course_id_id
+    transaction.on_commit(lambda: invalidate_course_detail(course_id))
+
+
+@receiver(post_save, sender=User)
+def course_user_changed(sender, instance, update_fields=None, **kwargs):
+    # The course detail shows the names of its owner, creator and last editor
+    if update_fields is not None and not {'first_name', 'last_name'} & set(update_fields):
+        return
+
+    def invalidate():
+        course_ids = Course.objects.filter(
+            Q(owner=instance.pk) | Q(created_by=instance.pk) | Q(modified_by=instance.pk)
+        ).values_list('id', flat=True)
+        for course_id in course_ids.iterator():
+            invalidate_course_detail(course_id)
+
+    transaction.on_commit(invalidate)
@@ -1,11 +1,37 @@
 # shared/course/views.py
+import re
+from django.conf import settings
 from django.shortcuts import get_object_or_404
+from django.utils.dateparse import parse_datetime
+from django.utils.translation import get_language_from_request
 from .models import Course,CourseSection, CourseLesson
 from .serializer import CourseSerializer, CourseSectionSerializer, CourseLessonSerializer
 from .models import Course,CourseSection, CourseLesson
 from .serializer import CourseSerializer, CourseSectionSerializer, CourseLessonSerializer
-from rest_framework.exceptions import NotFound
-from nativo_english.api.shared.db_helper import call_plpgsql_function
+from rest_framework.exceptions import NotFound, ValidationError
+from nativo_english.api.shared import messages
+from nativo_english.api.shared.db_helper import call_plpgsql_function, iter_plpgsql_function
+from nativo_english.api.shared.pagination import encode_cursor, decode_cursor
+from .cache import get_cached_course_detail
+
+# Sort fields supported by the keyset (cursor) pagination mode of the course list
+CURSOR_SORT_FIELDS = ('course_id', 'title', 'price', 'avg_rating', 'enrollment_count', 'created_at', 'updated_at', 'relevance')
+
+# Checks of the cursor value of every sort field: the value must cast back to the type
+# courses_list_with_cursor_get compares it as (BIGINT, INTEGER, FLOAT, TIMESTAMPTZ or text)
+BIGINT_CURSOR_VALUE = re.compile(r'-?\d{1,18}')
+INTEGER_CURSOR_VALUE = re.compile(r'-?\d{1,9}')
+FLOAT_CURSOR_VALUE = re.compile(r'-?(\d+(\.\d*)?|\.\d+)([eE][-+]?\d{1,2})?')
+CURSOR_VALUE_CHECKS = {
+    'course_id': BIGINT_CURSOR_VALUE.fullmatch,
+    'title': lambda value: True,
+    'price': FLOAT_CURSOR_VALUE.fullmatch,
+    'avg_rating': FLOAT_CURSOR_VALUE.fullmatch,
+    'enrollment_count': INTEGER_CURSOR_VALUE.fullmatch,
+    'created_at': parse_datetime,
+    'updated_at': parse_datetime,
+    'relevance': FLOAT_CURSOR_VALUE.fullmatch,
+}
 
 #--------- COURSE --------------
 
@@ -115,7 +141,7 @@ def update_course(course_id, request, owner_id = None):
 
         serializer = CourseSerializer(course, data=request.data, partial=True)
         if serializer.is_valid():
-            serializer.save(modified_by=request.user)
+            serializer.save(modified_by=request.user)  # Invalidates the cached detail (see signals.py)
             return serializer.data
         return serializer.errors 
     
@@ -123,7 +149,20 @@ def update_course(course_id, request, owner_id = None):
         raise ex
 
 
-def get_all_courses_with_pagination(page_num, page_size, title, mode, is_paid, is_active, search_query, sort_field, sort_order, owner_id, level):
+def course_list_item(row):
+    """
+    Shapes a row returned by the course listing functions into the course list response item.
+
+    The row dict is reused in place instead of copied field by field: only the bookkeeping columns
+    (`total_count`, `sort_value`) are dropped and `updated_by_name` is renamed to `modified_by`.
+    """
+    row.pop('total_count', None)
+    row.pop('sort_value', None)
+    row['modified_by'] = row.pop('updated_by_name')
+    return row
+
+
+def get_all_courses_with_pagination(page_num, page_size, title, mode, is_paid, is_active, search_query, sort_field, sort_order, owner_id, level, estimate_total=False):
     """
     Retrieves a list of Course instances, optionally filtered by name or payment status.
 
@@ -134,47 +173,46 @@ def get_all_courses_with_pagination(page_num, page_size, title, mode, is_paid, i
     - if `sort_field` is provided, sort the data based on that field
     - if `sort_direction` is provided, sort the data base on the filed and provided direction
 
+    The page and the exact total are computed by the database in a single pass. With `estimate_total`
+    the exact count is skipped and the total comes from the planner statistics instead
+    (`courses_count_estimate_get`), which keeps large admin listings cheap.
+
     Args:
         filter_title (str, optional): A string to filter courses by title. Defaults to None.
         filter_is_paid (bool, optional): A boolean to filter courses by payment status (e.g., free or paid).
                                          Defaults to None.
+        estimate_total (bool, optional): Return an estimated instead of an exact total count. Defaults to False.
 
     Returns:
         list: A list of serialized course data. Each item in the list represents a course and its details.
     """
+    page_num, page_size = max(page_num, 1), max(page_size, 1)
     try:
         all_courses_results = call_plpgsql_function('courses_list_with_pagination_get', 
-            page_num, page_size, title, mode, is_paid, is_active, search_query, sort_field, sort_order, owner_id, level
+            page_num, page_size, title, mode, is_paid, is_active, search_query, sort_field, sort_order, owner_id, level,
+            not estimate_total
         )
 
-        # Prepare the response
-        courses_data = [
-            {
-                'course_id': row['course_id'],
-                'title': row['title'],
-                'description': row['description'],
-                'is_paid': row['is_paid'],
-                'price': row['price'],
-                'mode': row['mode'],
-                'level': row['level'],
-                'avg_rating': row['avg_rating'],
-                'is_active': row['is_active'],
-                'owner_name': row['owner_name'],
-                'owner': row['owner'],
-                'enrollment_count': row['enrollment_count'],
-                'created_at': row['created_at'],
-                'updated_at': row['updated_at'],
-                'modified_by': row['updated_by_name'],
+        # Extract the total count from the last column before the rows are shaped into list items
+        total_count = all_courses_results[-1]['total_count'] if all_courses_results else 0
 
-            }
-            for row in all_courses_results
-        ]     
+        # Prepare the response
+        courses_data = [course_list_item(row) for row in all_courses_results]
         
-        total_count = all_courses_results[-1]['total_count'] if all_courses_results else 0  # Extract the total count from the last column
+        if estimate_total:
+            estimate_results = call_plpgsql_function('courses_count_estimate_get',
+                title, mode, is_paid, is_active, search_query, owner_id, level
+            )
+            total_count = estimate_results[0]['courses_count_estimate_get'] if estimate_results else 0
+
+            # The estimate can never be lower than what has already been listed
+            total_count = max(total_count or 0, (page_num - 1) * page_size + len(courses_data))
+
         total_pages = (total_count + page_size - 1) // page_size  # Calculate total pages
         response_data = {
             'courses': courses_data,
             'total_count': total_count,
+            'is_total_estimated': estimate_total,
             'total_pages': total_pages,
             'current_page': page_num,
             'page_size': page_size
@@ -187,20 +225,117 @@ def get_all_courses_with_pagination(page_num, page_size, title, mode, is_paid, i
         raise ex
 
 
+def is_valid_cursor_value(sort_field, value):
+    """
+    Tells whether `value` (the sort value of a cursor, as text) can be cast to the type of `sort_field`.
+    A NULL sort value (e.g. an unrated course sorted by rating) is kept as is.
+    """
+    if value is None:
+        return True
+    if not isinstance(value, str) or '\x00' in value:
+        return False
+
+    try:
+        return bool(CURSOR_VALUE_CHECKS[sort_field](value))
+    except ValueError:
+        # parse_datetime: well formatted but out of range values
+        return False
+
+
+def get_all_courses_with_cursor(cursor, page_size, title, mode, is_paid, is_active, search_query, sort_field, sort_order, owner_id, level):
+    """
+    Retrieves one page of courses using keyset (cursor) pagination.
+
+    Unlike `get_all_courses_with_pagination`, the database seeks directly past the last row of the
+    previous page instead of skipping `(page_num - 1) * page_size` rows, so every page costs the same
+    no matter how deep the client has scrolled. No total count is computed in this mode.
+
+    Args:
+        cursor (str): `next_cursor` from the previous page, or an empty string for the first page.
+        page_size (int): Number of courses to return.
+        sort_field (str, optional): One of `CURSOR_SORT_FIELDS`. Defaults to `created_at`.
+        sort_order (str, optional): `ASC` or `DESC`. Defaults to `DESC`.
+        The remaining filters behave as in `get_all_courses_with_pagination`.
+
+    Returns:
+        dict: The courses of the page, the `next_cursor` (None on the last page) and the page size.
+
+    Raises:
+        ValidationError: If the sort field is not supported or the cursor does not match the sorting.
+    """
+    sort_field = sort_field or 'created_at'
+    sort_order = 'ASC' if str(sort_order).upper() == 'ASC' else 'DESC'
+    page_size = max(page_size, 1)
+
+    # Same fallback as courses_list_with_cursor_get: without a search query the rows are sorted (and
+    # their cursor values taken) by created_at
+    if sort_field == 'relevance' and not search_query:
+        sort_field = 'created_at'
+
+    if sort_field not in CURSOR_SORT_FIELDS:
+        raise ValidationError({'detail': messages.INVALID_CURSOR_SORT_FIELD_MESSAGE})
+
+    cursor_value, cursor_id = None, None
+    if cursor:
+        position = decode_cursor(cursor)
+
+        # A cursor only makes sense for the ordering it was produced with
+        if position.get('sort_by') != sort_field or position.get('sort_order') != sort_order:
+            raise ValidationError({'detail': messages.INVALID_CURSOR_MESSAGE})
+
+        cursor_value, cursor_id = position.get('value'), position.get('id')
+        if (
+            not isinstance(cursor_id, int) or isinstance(cursor_id, bool) or not 0 < cursor_id < 2 ** 63
+            or not is_valid_cursor_value(sort_field, cursor_value)
+        ):
+            raise ValidationError({'detail': messages.INVALID_CURSOR_MESSAGE})
+
+    # Fetch one extra row to know whether there is a next page without counting
+    courses_results = call_plpgsql_function('courses_list_with_cursor_get',
+        page_size + 1, title, mode, is_paid, is_active, search_query, sort_field, sort_order, owner_id, level,
+        cursor_value, cursor_id
+    )
+
+    page_rows = courses_results[:page_size]
+    next_cursor = None
+    if len(courses_results) > page_size:
+        last_row = page_rows[-1]
+        next_cursor = encode_cursor({
+            'sort_by': sort_field,
+            'sort_order': sort_order,
+            'value': last_row['sort_value'],
+            'id': last_row['course_id'],
+        })
+
+    return {
+        'courses': [course_list_item(row) for row in page_rows],
+        'next_cursor': next_cursor,
+        'page_size': page_size
+    }
+
+
 def get_course_detail_by_id(course_id, owner_id=None):
     """
     Retrieves a Course instance by its ID.
 
-    Fetches a single Course instance matching the provided course ID.
-    Raises a 404 error if the course does not exist.
+    Fetches a single Course instance matching the provided course ID, read through the course detail
+    cache (see `cache.py`). Returns an empty dict if the course does not exist (or is not owned by `owner_id`).
 
     Args:
         course_id (int): The unique identifier of the course.
+        owner_id (int, optional): Restricts the lookup to the courses of this owner (teacher role).
 
     Returns:
         dict: Serialized course data if the course exists.
 
     """
+    return get_cached_course_detail(course_id, owner_id, lambda: load_course_detail_by_id(course_id, owner_id))
+
+
+def load_course_detail_by_id(course_id, owner_id=None):
+    """
+    Loads the course detail from the database (`course_detail_by_id_get`), bypassing the cache.
+    """
     
     try:
         course_details = call_plpgsql_function('course_detail_by_id_get', course_id, owner_id)
@@ -232,6 +367,37 @@ def get_course_detail_by_id(course_id, owner_id=None):
         raise ex
 
 
+def get_course_tree_by_id(course_id, language=None, owner_id=None):
+    """
+    Retrieves the whole tree of a course (sections, their active lessons and the active content of
+    each lesson) as one nested document, built by `course_tree_by_id_get` in a single query.
+
+    Args:
+        course_id (int): The unique identifier of the course.
+        language (str, optional): Language of the lesson content, one of `settings.LANGUAGES`.
+                                  Lessons without content in it fall back to the default language.
+        owner_id (int, optional): Restricts the lookup to the courses of this owner (teacher role).
+
+    Returns:
+        dict: The course tree, empty if the course does not exist (or is not owned by `owner_id`).
+    """
+    fallback_language = settings.PARLER_DEFAULT_LANGUAGE_CODE
+    if language not in dict(settings.LANGUAGES):
+        raise ValidationError({'detail': messages.INVALID_LANGUAGE_MESSAGE})
+
+    course_tree = call_plpgsql_function('course_tree_by_id_get', course_id, language, fallback_language, owner_id)
+
+    return course_tree[0]['course_tree_by_id_get'] or {}
+
+
+def get_request_language(request):
+    """
+    Returns the content language asked for by the caller: the `language` query param if given,
+    else the best match of the Accept-Language header among `settings.LANGUAGES`.
+    """
+    return request.query_params.get('language') or get_language_from_request(request)
+
+
 #--------- COURSE SECTION  --------------
 
 def create_course_section(request):
@@ -368,9 +534,12 @@ def get_all_course_lessons(filter_title=None, section_id=None, course_id=None):
     Fetch course lessons by PL/pgSQL function or Django ORM based on the input filters.
     """
     if section_id:
-        # Call the PL/pgSQL function to fetch lessons by course_id or section_id
-        lessons = call_plpgsql_function('course_lesson_by_course_or_section_id_get', course_id, section_id)
-        lessons = [lesson for lesson in lessons if lesson['is_active']]
+        # Call the PL/pgSQL function to fetch lessons by course_id or section_id, streamed so the
+        # inactive lessons are dropped as they are read instead of after loading them all
+        lessons = [
+            lesson for lesson in iter_plpgsql_function('course_lesson_by_course_or_section_id_get', course_id, section_id)
+            if lesson['is_active']
+        ]
         if not lessons:
             raise NotFound("No active course lessons found for the given course ID or section ID.")
     else:
@@ -1,5 +1,12 @@
+import json
+import uuid
 from django.db import connection
 
+# Rows fetched per round trip when streaming a large read through a server-side cursor
+# (iter_plpgsql_function, exports.py)
+STREAM_FETCH_SIZE = 2000
+
+
 def call_plpgsql_function(function_name, *params):
     """
     Helper function to call a PL/pgSQL function and fetch its results.
@@ -15,11 +22,9 @@ def call_plpgsql_function(function_name, *params):
         # Prepare the parameter placeholders
         param_placeholders = ', '.join(['%s'] * len(params))
 
-        print(param_placeholders)
-
         # Construct the SQL query
         query = f"SELECT * FROM {function_name}({param_placeholders})"
-        
+
         # Execute the query
         cursor.execute(query, params)
         rows = cursor.fetchall()
@@ -29,3 +34,54 @@ def call_plpgsql_function(function_name, *params):
 
     # Map rows to dictionaries
     return [dict(zip(column_names, row)) for row in rows]
+
+
+def iter_plpgsql_function(function_name, *params, fetch_size=STREAM_FETCH_SIZE):
+    """
+    Streaming variant of `call_plpgsql_function` for large result sets (unpaginated lists).
+
+    The function runs behind a named (server-side) cursor and rows are fetched `fetch_size` at a time,
+    so only one batch is held in memory no matter how many rows the function returns.
+
+    Args:
+        function_name (str): Name of the PL/pgSQL function to call.
+        *params: Parameters to pass to the function.
+        fetch_size (int, optional): Rows fetched per round trip. Defaults to `STREAM_FETCH_SIZE`.
+
+    Yields:
+        dict: One dictionary per row, keyed by the column names.
+    """
+    param_placeholders = ', '.join(['%s'] * len(params))
+    query = f"SELECT * FROM {function_name}({param_placeholders})"
+
+    connection.ensure_connection()
+    # Outside a transaction the cursor must be declared WITH HOLD to survive the autocommit of its
+    # DECLARE, as Django does for QuerySet.iterator()
+    with connection.connection.cursor(
+        name=f'plpgsql_stream_{uuid.uuid4().hex}', withhold=connection.get_autocommit()
+    ) as cursor:
+        cursor.itersize = fetch_size
+        cursor.execute(query, params)
+
+        column_names = None
+        for row in cursor:
+            if column_names is None:
+                # Only known after the first fetch on a server-side cursor, shared by every row
+                column_names = tuple(desc[0] for desc in cursor.description)
+            yield dict(zip(column_names, row))
+
+
+def estimate_queryset_count(queryset):
+    """
+    Returns the planner's estimate of the number of rows of `queryset`, read from EXPLAIN instead of
+    counting them (the ORM counterpart of `courses_count_estimate_get`).
+
+    Its cost does not grow with the size of the table, at the price of being approximate (it is as
+    fresh as the table statistics).
+    """
+    # Django flattens the one element plan list of EXPLAIN (FORMAT JSON) into the JSON of that element
+    query_plan = json.loads(queryset.explain(format='json'))
+    if isinstance(query_plan, list):
+        query_plan = query_plan[0]
+
+    return int(query_plan['Plan']['Plan Rows'])
@@ -0,0 +1,336 @@
+import csv
+import io
+import os
+import time
+import zlib
+from pathlib import Path
+import orjson
+from celery.result import AsyncResult
+from django.conf import settings
+from django.core.cache import cache
+from django.http import Http404, StreamingHttpResponse
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+from nativo_english.api.shared import messages
+from nativo_english.api.shared.course.models import Course, CourseEnrollment
+from nativo_english.api.shared.db_helper import STREAM_FETCH_SIZE
+from nativo_english.api.shared.user.models import User
+
+# Format -> (content type, file extension)
+EXPORT_FORMATS = {
+    'csv': ('text/csv', 'csv'),
+    'jsonl': ('application/x-ndjson', 'jsonl'),
+}
+
+# Bytes of encoded rows gathered before a chunk is handed to the response / file, so a 1M row export
+# is a few thousand writes instead of a million
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+# Rows between two progress reports of an export job
+EXPORT_PROGRESS_EVERY = 10000
+
+# Celery state of an export job -> its status, the same as the user import jobs
+EXPORT_JOB_STATUSES = {
+    'PENDING': 'pending',
+    'PROGRESS': 'running',
+    'SUCCESS': 'completed',
+    'FAILURE': 'failed',
+}
+
+
+def _users_queryset(filters):
+    queryset = User.objects.all()
+    if 'role' in filters:
+        queryset = queryset.filter(role=filters['role'])
+    if 'is_active' in filters:
+        queryset = queryset.filter(is_active=filters['is_active'])
+    return queryset
+
+
+def _courses_queryset(filters):
+    queryset = Course.objects.all()
+    if 'is_active' in filters:
+        queryset = queryset.filter(is_active=filters['is_active'])
+    return queryset
+
+
+def _enrollments_queryset(filters):
+    queryset = CourseEnrollment.objects.all()
+    if 'course_id' in filters:
+        queryset = queryset.filter(fk_course_id=filters['course_id'])
+    if 'is_active' in filters:
+        queryset = queryset.filter(is_active=filters['is_active'])
+    return queryset
+
+
+# Dataset -> (queryset builder, filters it accepts, (column, field) pairs exported)
+EXPORT_DATASETS = {
+    'users': (_users_queryset, ('role', 'is_active'), (
+        ('id', 'id'), ('username', 'username'), ('email', 'email'), ('first_name', 'first_name'),
+        ('last_name', 'last_name'), ('role', 'role'), ('is_active', 'is_active'),
+        ('date_joined', 'date_joined'), ('last_login', 'last_login'),
+    )),
+    'courses': (_courses_queryset, ('is_active',), (
+        ('id', 'id'), ('title', 'title'), ('is_paid', 'is_paid'), ('price', 'price'), ('mode', 'mode'),
+        ('level', 'level'), ('avg_rating', 'avg_rating'), ('rating_count', 'rating_count'),
+        ('enrollment_count', 'enrollment_count'), ('is_active', 'is_active'), ('owner_id', 'owner_id'),
+        ('created_at', 'created_at'), ('updated_at', 'updated_at'),
+    )),
+    'enrollments': (_enrollments_queryset, ('course_id', 'is_active'), (
+        ('id', 'id'), ('user_id', 'fk_user_id'), ('course_id', 'fk_course_id'),
+        ('enrolled_date', 'enrolled_date'), ('is_active', 'is_active'), ('created_at', 'created_at'),
+    )),
+}
+
+
+def get_export_filters(dataset, params):
+    """
+    Validates the filters of an export (query parameters or a JSON object) into JSON serializable
+    values, so they can be handed to an export job as they are.
+
+    Raises:
+        ValidationError: If the dataset is unknown or a filter is invalid.
+    """
+    if dataset not in EXPORT_DATASETS:
+        raise ValidationError({'detail': messages.INVALID_EXPORT_DATASET_MESSAGE})
+
+    filters = {}
+    for name in EXPORT_DATASETS[dataset][1]:
+        value = params.get(name)
+        if value is None or value == '':
+            continue
+
+        if name == 'is_active':
+            if str(value).lower() not in ('true', 'false'):
+                raise ValidationError({'detail': messages.INVALID_EXPORT_FILTER_MESSAGE})
+            filters[name] = str(value).lower() == 'true'
+        elif name == 'course_id':
+            try:
+                filters[name] = int(value)
+            except (TypeError, ValueError):
+                raise ValidationError({'detail': messages.INVALID_EXPORT_FILTER_MESSAGE})
+        elif name == 'role':
+            if value not in dict(User.ROLE_CHOICES):
+                raise ValidationError({'detail': messages.INVALID_USER_ROLE_MESSAGE})
+            filters[name] = value
+
+    return filters
+
+
+def get_export_queryset(dataset, filters):
+    """
+    Rows of the dataset matching `filters`, in id order.
+    """
+    build_queryset = EXPORT_DATASETS[dataset][0]
+    return build_queryset(filters).order_by('id')
+
+
+def iter_export_rows(dataset, filters, fetch_size=STREAM_FETCH_SIZE):
+    """
+    Column names of the dataset and an iterator over its rows as tuples.
+
+    Rows come from a server-side cursor (`QuerySet.iterator()`), `fetch_size` at a time, and are
+    never turned into model instances.
+    """
+    columns = EXPORT_DATASETS[dataset][2]
+    rows = (
+        get_export_queryset(dataset, filters)
+        .values_list(*(field for _, field in columns))
+        .iterator(chunk_size=fetch_size)
+    )
+    return [column for column, _ in columns], rows
+
+
+def iter_csv(columns, rows):
+    """
+    Encodes rows as CSV (header first), yielding chunks of about `EXPORT_CHUNK_SIZE` bytes.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+
+    for row in rows:
+        writer.writerow(row)
+        if buffer.tell() >= EXPORT_CHUNK_SIZE:
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate()
+
+    yield buffer.getvalue().encode('utf-8')
+
+
+def iter_jsonl(columns, rows):
+    """
+    Encodes rows as JSON Lines (one object per row), yielding chunks of about `EXPORT_CHUNK_SIZE` bytes.
+    """
+    options = orjson.OPT_UTC_Z | orjson.OPT_APPEND_NEWLINE
+    lines, size = [], 0
+
+    for row in rows:
+        line = orjson.dumps(dict(zip(columns, row)), default=str, option=options)
+        lines.append(line)
+        size += len(line)
+        if size >= EXPORT_CHUNK_SIZE:
+            yield b''.join(lines)
+            lines, size = [], 0
+
+    yield b''.join(lines)
+
+
+def iter_gzip(chunks):
+    """
+    Compresses chunks into a gzip stream on the fly, holding only the compressor state.
+    """
+    # wbits 31: deflate with a gzip header and trailer
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+
+    yield compressor.flush()
+
+
+def iter_export(dataset, file_format, filters, compress=False, on_progress=None):
+    """
+    Streams a whole export as bytes chunks, in constant memory whatever the number of rows.
+
+    Args:
+        dataset (str): One of `EXPORT_DATASETS`.
+        file_format (str): One of `EXPORT_FORMATS`.
+        filters (dict): Filters validated by `get_export_filters`.
+        compress (bool, optional): Gzip the output.
+        on_progress (callable, optional): Called with the number of rows exported so far, every
+            `EXPORT_PROGRESS_EVERY` rows and once at the end.
+    """
+    columns, rows = iter_export_rows(dataset, filters)
+
+    if on_progress is not None:
+        rows = _count_rows(rows, on_progress)
+
+    chunks = iter_csv(columns, rows) if file_format == 'csv' else iter_jsonl(columns, rows)
+    return iter_gzip(chunks) if compress else chunks
+
+
+def _count_rows(rows, on_progress):
+    count = 0
+    for row in rows:
+        yield row
+        count += 1
+        if count % EXPORT_PROGRESS_EVERY == 0:
+            on_progress(count)
+
+    on_progress(count)
+
+
+def export_file_name(dataset, file_format, compress=False):
+    extension = EXPORT_FORMATS[file_format][1]
+    return f"{dataset}-{timezone.now():%Y%m%d-%H%M%S}.{extension}{'.gz' if compress else ''}"
+
+
+def streaming_export_response(dataset, file_format, filters, compress=False):
+    """
+    Streams an export to the client as a file download, rows are read and encoded while it downloads.
+    """
+    content_type = 'application/gzip' if compress else EXPORT_FORMATS[file_format][0]
+    response = StreamingHttpResponse(iter_export(dataset, file_format, filters, compress), content_type=content_type)
+    response['Content-Disposition'] = f'attachment; filename="{export_file_name(dataset, file_format, compress)}"'
+
+    return response
+
+
+def write_export_file(file_name, dataset, file_format, filters, compress=False, on_progress=None):
+    """
+    Writes an export to `EXPORT_DIR`, through a temporary file so a half written export is never served.
+
+    Returns:
+        dict: `file_name`, `file_path` and `size` (bytes) of the export.
+    """
+    export_dir = Path(settings.EXPORT_DIR)
+    export_dir.mkdir(parents=True, exist_ok=True)
+    file_path = export_dir / file_name
+    temporary_path = export_dir / f'.{file_name}.part'
+
+    try:
+        with open(temporary_path, 'wb') as export_file:
+            for chunk in iter_export(dataset, file_format, filters, compress, on_progress):
+                export_file.write(chunk)
+        os.replace(temporary_path, file_path)
+    finally:
+        if temporary_path.exists():
+            temporary_path.unlink()
+
+    return {'file_name': file_name, 'file_path': str(file_path), 'size': file_path.stat().st_size}
+
+
+def _export_job_key(job_id):
+    return f'export_job:{job_id}'
+
+
+def record_export_job(job_id):
+    """
+    Records the id of a started export job, for as long as its file is kept.
+    """
+    cache.set(_export_job_key(job_id), True, timeout=settings.EXPORT_RETENTION_HOURS * 3600)
+
+
+def get_export_job(job_id):
+    """
+    Status of an export job, read from the celery result backend.
+
+    Raises:
+        Http404: If the id is not one of an export job started within `EXPORT_RETENTION_HOURS` (celery
+            reads any unknown id, e.g. of another task, as pending).
+    """
+    if not cache.get(_export_job_key(job_id)):
+        raise Http404(messages.EXPORT_JOB_NOT_FOUND_MESSAGE)
+
+    result = AsyncResult(job_id)
+    info = result.info if isinstance(result.info, dict) else {}
+
+    return {
+        'job_id': job_id,
+        'status': EXPORT_JOB_STATUSES.get(result.state, result.state.lower()),
+        'rows': info.get('rows'),
+        'file_name': info.get('file_name'),
+        'size': info.get('size'),
+        'failure_reason': str(result.info)[:2000] if result.state == 'FAILURE' else '',
+    }
+
+
+def get_export_file(job_id):
+    """
+    Path of the file written by a completed export job.
+
+    Raises:
+        ValidationError: If the job has not completed.
+        Http404: If the job is unknown or its file was purged.
+    """
+    job = get_export_job(job_id)
+    if job['status'] != 'completed':
+        raise ValidationError({'detail': messages.EXPORT_JOB_NOT_READY_MESSAGE})
+
+    # Only ever serve a file of EXPORT_DIR, whatever the result backend holds
+    file_path = Path(settings.EXPORT_DIR) / Path(job['file_name']).name
+    if not file_path.is_file():
+        raise Http404(messages.EXPORT_FILE_EXPIRED_MESSAGE)
+
+    return file_path
+
+
+def purge_expired_exports():
+    """
+    Removes the export files older than `EXPORT_RETENTION_HOURS`. Returns the number of files removed.
+    """
+    export_dir = Path(settings.EXPORT_DIR)
+    if not export_dir.exists():
+        return 0
+
+    expires_before = time.time() - settings.EXPORT_RETENTION_HOURS * 3600
+    removed = 0
+    for export_file in export_dir.iterdir():
+        if export_file.is_file() and export_file.stat().st_mtime < expires_before:
+            export_file.unlink(missing_ok=True)
+            removed += 1
+
+    return removed
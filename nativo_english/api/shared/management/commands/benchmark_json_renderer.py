@@ -0,0 +1,92 @@
+import datetime
+import decimal
+import json
+import timeit
+import uuid
+import orjson
+from django.core.management.base import BaseCommand
+from rest_framework.renderers import JSONRenderer
+from nativo_english.api.shared import messages
+from nativo_english.api.shared.course.views import course_list_item
+from nativo_english.api.shared.renderers import FastJSONRenderer
+
+
+def course_page_rows(rows):
+    """
+    Builds `rows` rows shaped like the ones `courses_list_with_pagination_get` returns.
+    """
+    now = datetime.datetime(2024, 11, 1, 9, 30, 15, 123456, tzinfo=datetime.timezone.utc)
+    return [
+        {
+            'course_id': course_id,
+            'title': f'Course {course_id} - Everyday English conversation',
+            'description': 'Practice speaking, listening and pronunciation with native teachers. ' * 4,
+            'is_paid': course_id % 2 == 0,
+            'price': 49.99 if course_id % 2 == 0 else None,
+            'mode': 'self',
+            'level': 'intermediate',
+            'avg_rating': 4.25,
+            'is_active': True,
+            'owner_name': 'Jane Doe',
+            'updated_by_name': 'John Smith',
+            'owner': 7,
+            'created_at': now - datetime.timedelta(days=course_id),
+            'updated_at': now,
+            'enrollment_count': course_id * 3,
+            'total_count': 5000,
+        }
+        for course_id in range(1, rows + 1)
+    ]
+
+
+class Command(BaseCommand):
+    help = 'Compares the stock DRF JSONRenderer against FastJSONRenderer on an api_response course page'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=100, help='Courses on the page (default: 100)')
+        parser.add_argument('--number', type=int, default=2000, help='Renders per measurement (default: 2000)')
+        parser.add_argument('--repeat', type=int, default=5, help='Measurements, the best one is reported (default: 5)')
+
+    def handle(self, *args, **options):
+        rows, number, repeat = options['rows'], options['number'], options['repeat']
+
+        def envelope(courses):
+            # What api_response hands to the renderer for a course list page
+            return {
+                'status': 'success',
+                'status_code': 200,
+                'message': messages.COURSE_LIST_RETRIEVED_SUCCESS_MESSAGE,
+                'data': {
+                    'courses': courses,
+                    'total_count': 5000,
+                    'is_total_estimated': False,
+                    'total_pages': 50,
+                    'current_page': 1,
+                    'page_size': rows,
+                    'request_id': uuid.uuid4(),
+                    'min_price': decimal.Decimal('9.99'),
+                },
+            }
+
+        data = envelope([course_list_item(row) for row in course_page_rows(rows)])
+        renderers = [('JSONRenderer', JSONRenderer()), ('FastJSONRenderer', FastJSONRenderer())]
+
+        # Both must produce the same document
+        documents = [json.loads(renderer.render(data)) for _, renderer in renderers]
+        if documents[0] != documents[1]:
+            self.stderr.write(self.style.ERROR('The renderers produced different documents'))
+            return
+
+        # The output of FastJSONRenderer depends on the orjson release, report the one checked
+        self.stdout.write(f'Rendering a {rows} row course page with orjson {orjson.__version__}, best of {repeat} x {number} renders')
+        results = {}
+        for name, renderer in renderers:
+            best = min(timeit.repeat(lambda: renderer.render(data), number=number, repeat=repeat))
+            results[name] = best / number
+            self.stdout.write(
+                f'{name:<18} {results[name] * 1e6:10.1f} us/render  {len(renderer.render(data)):8d} bytes'
+            )
+
+        self.stdout.write(self.style.SUCCESS(
+            f'FastJSONRenderer is {results["JSONRenderer"] / results["FastJSONRenderer"]:.1f}x faster'
+        ))
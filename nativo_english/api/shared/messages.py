@@ -7,6 +7,19 @@ USERS_LIST_RETRIEVED_SUCCESS_MESSAGE = 'Users list retrieved successfully'
 USER_SUSPENDED_SUCCESS_MESSAGE = 'User suspended successfully'
 NO_USER_ROLE_PROVIDED = 'No user role provided'
 NO_USER_FOUND = 'No user found'
+USERS_BULK_ROLE_UPDATED_SUCCESS_MESSAGE = 'Role of the selected users updated successfully'
+USERS_BULK_STATUS_UPDATED_SUCCESS_MESSAGE = 'Status of the selected users updated successfully'
+NO_USERS_SELECTED_MESSAGE = 'Select the users with ids and / or filter'
+INVALID_BULK_USER_IDS_MESSAGE = 'ids must be a non empty list of at most {max_ids} user ids'
+INVALID_BULK_USER_FILTER_MESSAGE = 'filter only supports role and is_active (true or false)'
+INVALID_USER_ROLE_MESSAGE = 'Invalid role. Must be admin, teacher or student'
+USER_IMPORT_STARTED_SUCCESS_MESSAGE = 'User import started, poll the job for its progress'
+USER_IMPORT_JOB_RETRIEVED_SUCCESS_MESSAGE = 'User import job retrieved successfully'
+USER_IMPORT_ERRORS_RETRIEVED_SUCCESS_MESSAGE = 'User import errors retrieved successfully'
+USER_IMPORT_JOB_NOT_FOUND_MESSAGE = 'User import job not found'
+USER_IMPORT_FILE_REQUIRED_MESSAGE = 'A CSV or JSONL file is required'
+USER_IMPORT_INVALID_FORMAT_MESSAGE = 'Invalid file format. Must be csv or jsonl'
+USER_IMPORT_FILE_TOO_LARGE_MESSAGE = 'The file is too large to import'
 
 BAD_REQUEST_ERROR_MESSAGE = 'Bad request'
 UNAUTHORIZED_ERROR_MESSAGE = 'Unauthorized access'
@@ -27,6 +40,24 @@ COURSE_UPDATED_SUCCESS_MESSAGE = 'Course updated successfully'
 COURSE_CANNOT_REASSIGN_BY_USER = 'Teacher cannot assign this course to other user'
 COURSE_NOT_FOUND_MESSAGE = 'Course Not Found'
 COURSE_CREATE_ERROR_MESSAGE = 'Error creating course'
+COURSE_CACHE_STATS_RETRIEVED_SUCCESS_MESSAGE = 'Course cache stats retrieved successfully'
+TOKEN_BLACKLIST_STATS_RETRIEVED_SUCCESS_MESSAGE = 'Token blacklist filter stats retrieved successfully'
+TASK_QUEUE_LATENCY_RETRIEVED_SUCCESS_MESSAGE = 'Task queue latency stats retrieved successfully'
+EMAIL_OUTBOX_STATS_RETRIEVED_SUCCESS_MESSAGE = 'Email outbox stats retrieved successfully'
+EXPORT_STARTED_SUCCESS_MESSAGE = 'Export started, poll the job and download the file once it succeeds'
+EXPORT_JOB_RETRIEVED_SUCCESS_MESSAGE = 'Export job retrieved successfully'
+EXPORT_JOB_NOT_READY_MESSAGE = 'The export is not ready yet, or it failed'
+EXPORT_JOB_NOT_FOUND_MESSAGE = 'Export job not found, or expired'
+EXPORT_FILE_EXPIRED_MESSAGE = 'The export file has expired, start a new export'
+INVALID_EXPORT_DATASET_MESSAGE = 'Invalid dataset. Must be users, courses or enrollments'
+INVALID_EXPORT_FORMAT_MESSAGE = 'Invalid file format. Must be csv or jsonl'
+INVALID_EXPORT_FILTER_MESSAGE = 'Invalid filter. is_active must be true or false and course_id an integer'
+EXPORT_TOO_LARGE_MESSAGE = 'About {rows} rows to export, more than can be streamed directly. Start an export job instead'
+COURSE_TREE_RETRIEVED_SUCCESS_MESSAGE = 'Course tree retrieved successfully'
+INVALID_LANGUAGE_MESSAGE = 'Unsupported language. Must be one of en, fr or es'
+INVALID_CURSOR_MESSAGE = 'Invalid cursor. Request the first page again without a cursor'
+INVALID_INTEGER_PARAM_MESSAGE = '{name} must be an integer'
+INVALID_CURSOR_SORT_FIELD_MESSAGE = 'Cursor pagination supports sort_by course_id, title, price, avg_rating, enrollment_count, created_at, updated_at or relevance'
 
 COURSE_SECTION_CREATED_SUCCESS_MESSAGE = 'Course section created successfully'
 SECTION_LIST_RETRIEVED_SUCCESS_MESSAGE = 'Section List Retrieved successfully'
@@ -43,4 +74,9 @@ LESSON_NOT_FOUND_MESSAGE = 'Lesson Not Found'
 
 ACTIVATE_SUSPEND_INVALID_ACTION_MESSAGE = 'Invalid Action. Must be activate or suspend'
 
+NOTIFICATION_LIST_RETRIEVED_SUCCESS_MESSAGE = 'Notifications retrieved successfully'
+NOTIFICATIONS_MARKED_READ_SUCCESS_MESSAGE = 'Notifications marked as read successfully'
+NOTIFICATION_UNREAD_COUNT_RETRIEVED_SUCCESS_MESSAGE = 'Unread notification count retrieved successfully'
+NO_NOTIFICATIONS_SELECTED_MESSAGE = 'Provide the notification ids to mark as read, or all set to true'
+
 
@@ -0,0 +1,163 @@
+import logging
+import os
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# SendGrid accepts up to 1000 personalizations (recipients here) per mail/send call
+MAX_PERSONALIZATIONS = 1000
+
+# Retries of a call answered 429 (rate limited), waiting BACKOFF_BASE * 2 ** attempt seconds unless
+# the response says when to come back. A 5xx may come after SendGrid accepted the email, it is not retried
+MAX_RETRIES = 5
+BACKOFF_BASE = 1.0
+MAX_BACKOFF = 60.0
+
+# Only connections that could not be opened are retried: once a mail/send POST went out a read error
+# or a dropped connection may still have sent the email, so it is never replayed
+CONNECT_RETRY = Retry(
+    total=None, connect=MAX_RETRIES, read=0, status=0, other=0, redirect=0,
+    backoff_factor=BACKOFF_BASE, backoff_max=MAX_BACKOFF, raise_on_status=False,
+)
+
+
+class SendGridError(Exception):
+    def __init__(self, status_code, body):
+        super().__init__(f'SendGrid answered {status_code}: {body}')
+        self.status_code = status_code
+        self.body = body
+
+
+class SendGridDispatcher:
+    """
+    Sends emails through the SendGrid v3 mail/send API over a pooled, keep-alive HTTP session.
+
+    The session is created once per process (Celery workers fork after import), so consecutive emails
+    reuse the same TLS connection instead of building a new client each time. Recipients sharing a
+    content go out `MAX_PERSONALIZATIONS` per call, one personalization each so they never see each
+    other. Point `SENDGRID_API_URL` to a `FakeSendGridServer` to run without the real API.
+    """
+
+    def __init__(self, api_url=None, api_key=None):
+        self.api_url = (api_url or settings.SENDGRID_API_URL).rstrip('/')
+        self.api_key = api_key or settings.SENDGRID_API_KEY
+        self._session = None
+        self._session_pid = None
+        self._lock = threading.Lock()
+        self.api_calls = 0
+
+    @property
+    def session(self):
+        with self._lock:
+            if self._session is None or self._session_pid != os.getpid():
+                session = requests.Session()
+                session.mount(self.api_url, HTTPAdapter(
+                    pool_connections=1, pool_maxsize=settings.SENDGRID_POOL_SIZE, max_retries=CONNECT_RETRY,
+                ))
+                session.headers.update({
+                    'Authorization': f'Bearer {self.api_key}',
+                    'Content-Type': 'application/json',
+                })
+                self._session = session
+                self._session_pid = os.getpid()
+
+        return self._session
+
+    @staticmethod
+    def from_email(sender_type):
+        # Select the sender email based on the sender_type
+        return (
+            settings.SENDGRID_NOTIFY_FROM_EMAIL  # noreply
+            if sender_type == "default"
+            else settings.SENDGRID_INFO_FROM_EMAIL  # info
+        )
+
+    def send(self, subject, html_content, recipients, sender_type="default", substitutions=None):
+        """
+        Sends the same email to every recipient, in as few API calls as possible.
+
+        Args:
+            subject (str): Email subject.
+            html_content (str): Email content in HTML format.
+            recipients (list[str]): Recipient email addresses.
+            sender_type (str): Either 'default' or 'info' to select the sender.
+            substitutions (dict, optional): Per recipient `{email: {tag: value}}` replaced by SendGrid
+                in the subject and content (e.g. `{'-name-': 'Jane'}`).
+
+        Returns:
+            int: Number of API calls made.
+        """
+        substitutions = substitutions or {}
+        calls = 0
+
+        for start in range(0, len(recipients), MAX_PERSONALIZATIONS):
+            personalizations = []
+            for email in recipients[start:start + MAX_PERSONALIZATIONS]:
+                personalization = {'to': [{'email': email}]}
+                if email in substitutions:
+                    personalization['substitutions'] = substitutions[email]
+                personalizations.append(personalization)
+
+            self.post_mail({
+                'personalizations': personalizations,
+                'from': {'email': self.from_email(sender_type)},
+                'subject': subject,
+                'content': [{'type': 'text/html', 'value': html_content}],
+            })
+            calls += 1
+
+        return calls
+
+    def post_mail(self, payload):
+        """
+        POSTs one mail/send payload, backing off on 429 answers. Connection failures are retried by the
+        session (`CONNECT_RETRY`), other network errors and 5xx answers are raised.
+        """
+        for attempt in range(MAX_RETRIES + 1):
+            response = self.session.post(f'{self.api_url}/v3/mail/send', json=payload, timeout=settings.SENDGRID_TIMEOUT)
+            self.api_calls += 1
+
+            if response.status_code < 400:
+                logger.info('Email sent to %s recipients: %s', len(payload['personalizations']), response.status_code)
+                return response.status_code
+
+            if response.status_code != 429 or attempt == MAX_RETRIES:
+                raise SendGridError(response.status_code, response.text)
+
+            delay = self.retry_delay(response, attempt)
+            logger.warning('SendGrid answered %s, retrying in %.1fs', response.status_code, delay)
+            time.sleep(delay)
+
+    @staticmethod
+    def retry_delay(response, attempt):
+        # SendGrid sends the epoch second the rate limit resets at, other proxies Retry-After
+        reset = response.headers.get('X-RateLimit-Reset')
+        retry_after = response.headers.get('Retry-After')
+        try:
+            if reset is not None:
+                return min(MAX_BACKOFF, max(0.0, float(reset) - time.time()))
+            if retry_after is not None:
+                return min(MAX_BACKOFF, float(retry_after))
+        except ValueError:
+            pass
+
+        return min(MAX_BACKOFF, BACKOFF_BASE * 2 ** attempt)
+
+
+_dispatcher = None
+
+
+def get_dispatcher():
+    """
+    Returns the dispatcher of the process, created on first use.
+    """
+    global _dispatcher
+    if _dispatcher is None:
+        _dispatcher = SendGridDispatcher()
+
+    return _dispatcher
@@ -0,0 +1,127 @@
+import logging
+import threading
+from collections import namedtuple
+from django.conf import settings
+from django.core.cache import cache
+from django.template import Template
+from nativo_english.api.shared.notifications.models import EmailTemplate
+
+logger = logging.getLogger(__name__)
+
+# Templates shipped in EMAIL_TEMPLATES_DIR: name -> (file, subject). A row of the same name in
+# EmailTemplate (edited by the admins) takes precedence over the file.
+FILE_EMAIL_TEMPLATES = {
+    'otp_email': ('resend_otp.html', 'Your verification code'),
+    'reset_password': ('reset_password.html', 'Reset your password'),
+}
+
+# Version of the templates compiled from a file
+FILE_VERSION = 'file'
+
+CompiledEmailTemplate = namedtuple('CompiledEmailTemplate', ['subject', 'body', 'version'])
+
+_compiled = {}
+_lock = threading.Lock()
+
+
+def _version_key(name):
+    return f'email_template:{name}:version'
+
+
+def _row_version(updated_at):
+    return updated_at.isoformat()
+
+
+def _compile_row(template):
+    return CompiledEmailTemplate(template.subject, Template(template.body), _row_version(template.updated_at))
+
+
+def _compile_file(name):
+    file_name, subject = FILE_EMAIL_TEMPLATES[name]
+    with open(settings.EMAIL_TEMPLATES_DIR / file_name, encoding='utf-8') as template_file:
+        return CompiledEmailTemplate(subject, Template(template_file.read()), FILE_VERSION)
+
+
+def _load(name):
+    template = EmailTemplate.objects.filter(name=name).only('subject', 'body', 'updated_at').first()
+    if template is not None:
+        return _compile_row(template)
+
+    if name in FILE_EMAIL_TEMPLATES:
+        return _compile_file(name)
+
+    raise EmailTemplate.DoesNotExist(f'No email template named {name}')
+
+
+def _publish_version(name, version, replace=True):
+    try:
+        if replace:
+            cache.set(_version_key(name), version, timeout=None)
+        else:
+            cache.add(_version_key(name), version, timeout=None)
+    except Exception as ex:
+        logger.warning('Could not publish the version of email template %s: %s', name, ex)
+
+
+def get_email_template(name):
+    """
+    Returns the compiled template `name`, parsed once per worker process.
+
+    The compiled template is reused as long as its version (the `updated_at` of its row, or `file`)
+    matches the version published in the cache when the row is saved, so a send costs one cache
+    read instead of a query plus a template parse. When the cache cannot tell the version the
+    template is loaded from the database again.
+
+    Returns:
+        CompiledEmailTemplate: `subject` (str), `body` (django Template) and `version`.
+    """
+    try:
+        version = cache.get(_version_key(name))
+    except Exception as ex:
+        logger.warning('Could not read the version of email template %s: %s', name, ex)
+        return _load(name)
+
+    compiled = _compiled.get(name)
+    if compiled is not None and compiled.version == version:
+        return compiled
+
+    compiled = _load(name)
+    with _lock:
+        _compiled[name] = compiled
+
+    # Unknown version (first use, evicted), the row loaded is the current one unless a save races us
+    if version is None:
+        _publish_version(name, compiled.version, replace=False)
+
+    return compiled
+
+
+def invalidate_email_template(name, updated_at=None):
+    """
+    Publishes the new version of the template `name` (saved at `updated_at`, or deleted when None),
+    every worker recompiles it on its next send.
+    """
+    # Deleted rows fall back to the file of the template (if there is one)
+    _publish_version(name, _row_version(updated_at) if updated_at is not None else FILE_VERSION)
+
+
+def warm_email_templates():
+    """
+    Compiles every template of the database (one query) and the files not overridden by a row,
+    so the first sends of a worker do not pay for them.
+    """
+    templates = EmailTemplate.objects.only('name', 'subject', 'body', 'updated_at')
+    compiled = {template.name: _compile_row(template) for template in templates}
+    for name in FILE_EMAIL_TEMPLATES.keys() - compiled.keys():
+        try:
+            compiled[name] = _compile_file(name)
+        except OSError as ex:
+            logger.warning('Could not read email template file of %s: %s', name, ex)
+
+    with _lock:
+        _compiled.update(compiled)
+
+    for name, template in compiled.items():
+        _publish_version(name, template.version, replace=False)
+
+    return len(compiled)
@@ -0,0 +1,81 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class FakeSendGridHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive, as the real API
+
+    def do_POST(self):
+        server = self.server
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+
+        with server.lock:
+            server.connections.add(self.client_address)
+            rate_limited = server.rate_limit_next > 0
+            if rate_limited:
+                server.rate_limit_next -= 1
+            else:
+                server.requests.append({
+                    'path': self.path,
+                    'authorization': self.headers.get('Authorization'),
+                    'payload': json.loads(body or b'{}'),
+                })
+
+        if self.path != '/v3/mail/send':
+            self.reply(404, b'{"errors": [{"message": "not found"}]}')
+        elif rate_limited:
+            self.reply(429, b'{"errors": [{"message": "too many requests"}]}', {'Retry-After': '0'})
+        else:
+            self.reply(202, b'')
+
+    def reply(self, status_code, body, headers=None):
+        self.send_response(status_code)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeSendGridServer(ThreadingHTTPServer):
+    """
+    Local stand-in of the SendGrid v3 mail/send API, for tests and development.
+
+    Accepts every mail/send call (202) and records it in `requests`, `rate_limit(n)` makes the next
+    `n` calls answer 429. Use it as a context manager and point `SENDGRID_API_URL` to `url`:
+
+        with FakeSendGridServer() as fake:
+            SendGridDispatcher(api_url=fake.url).send(...)
+            assert len(fake.requests) == 1
+    """
+    daemon_threads = True
+
+    def __init__(self, host='127.0.0.1', port=0):
+        super().__init__((host, port), FakeSendGridHandler)
+        self.lock = threading.Lock()
+        self.requests = []
+        self.connections = set()
+        self.rate_limit_next = 0
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def rate_limit(self, count):
+        with self.lock:
+            self.rate_limit_next = count
+
+    def __enter__(self):
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+        self.server_close()
@@ -0,0 +1,119 @@
+import csv
+import io
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+from nativo_english.api.shared.course.models import CourseEnrollment
+from nativo_english.api.shared.notifications.models import Notification
+from nativo_english.api.shared.user.models import User
+
+AUDIENCES = ('course', 'role', 'all')
+
+
+def get_audience(audience, course_id=None, role=None):
+    """
+    Builds the query of the users an audience reaches, as (queryset, user id field).
+
+    Args:
+        audience (str): 'course' (active students of `course_id`), 'role' (active users of `role`)
+            or 'all' (every active user).
+    """
+    if audience == 'course':
+        return CourseEnrollment.objects.filter(fk_course_id=course_id, is_active=True), 'fk_user_id'
+    if audience == 'role':
+        return User.objects.filter(role=role, is_active=True), 'id'
+    if audience == 'all':
+        return User.objects.filter(is_active=True), 'id'
+
+    raise ValueError(f'Unknown audience {audience}, expected one of {", ".join(AUDIENCES)}')
+
+
+def iter_user_id_chunks(queryset, field, chunk_size):
+    """
+    Streams the user ids of `queryset` in `chunk_size` lists, keyset paginated on `field` so every
+    chunk is an index range scan whatever the size of the audience.
+    """
+    last_id = 0
+    while True:
+        user_ids = list(
+            queryset.filter(**{f'{field}__gt': last_id})
+            .order_by(field)
+            .values_list(field, flat=True)
+            .distinct()[:chunk_size]
+        )
+        if not user_ids:
+            return
+
+        yield user_ids
+        last_id = user_ids[-1]
+
+
+def copy_notifications(user_ids, message, notification_type, created_at):
+    """
+    Inserts one notification per user with a single COPY, the cheapest way to load rows in PostgreSQL.
+    """
+    rows = io.StringIO()
+    writer = csv.writer(rows)
+    for user_id in user_ids:
+        writer.writerow((user_id, message, notification_type, 'f', created_at.isoformat()))
+    rows.seek(0)
+
+    with connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {Notification._meta.db_table} (fk_user_id, message, notification_type, is_read, created_at) "
+            "FROM STDIN WITH (FORMAT csv)",
+            rows,
+        )
+
+
+def bulk_create_notifications(user_ids, message, notification_type, created_at):
+    """
+    Portable (multi row INSERT) variant of `copy_notifications`, created_at is stamped by auto_now_add.
+    """
+    Notification.objects.bulk_create(
+        Notification(fk_user_id_id=user_id, message=message, notification_type=notification_type)
+        for user_id in user_ids
+    )
+
+
+def fan_out_notification(message, notification_type, audience, course_id=None, role=None,
+                         send_email=None, subject=None, chunk_size=None, method='copy'):
+    """
+    Notifies a whole audience: streams its user ids in chunks, inserts the notifications of every
+    chunk in one statement and enqueues their emails one batch per chunk.
+
+    Args:
+        message (str): Notification message.
+        notification_type (str): 'email' or 'system'.
+        audience (str): See `get_audience`.
+        course_id (int, optional): Course of the 'course' audience.
+        role (str, optional): Role of the 'role' audience.
+        send_email (bool, optional): Email the notification too. Defaults to `notification_type == 'email'`.
+        subject (str, optional): Subject of the emails.
+        chunk_size (int, optional): Users per chunk. Defaults to `NOTIFICATION_FANOUT_CHUNK_SIZE`.
+        method (str, optional): 'copy' (COPY FROM STDIN) or 'bulk_create'.
+
+    Returns:
+        int: Number of users notified.
+    """
+    from nativo_english.api.shared.notifications.tasks import send_notification_emails
+
+    chunk_size = chunk_size or settings.NOTIFICATION_FANOUT_CHUNK_SIZE
+    send_email = notification_type == 'email' if send_email is None else send_email
+    insert = copy_notifications if method == 'copy' else bulk_create_notifications
+    created_at = timezone.now()
+
+    queryset, field = get_audience(audience, course_id=course_id, role=role)
+    notified = 0
+    for user_ids in iter_user_id_chunks(queryset, field, chunk_size):
+        with transaction.atomic():
+            insert(user_ids, message, notification_type, created_at)
+
+            if send_email:
+                transaction.on_commit(
+                    lambda user_ids=user_ids: send_notification_emails.delay(user_ids, subject or message[:80], message)
+                )
+
+        notified += len(user_ids)
+
+    return notified
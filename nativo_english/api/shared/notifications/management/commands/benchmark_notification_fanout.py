@@ -0,0 +1,52 @@
+import time
+import uuid
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from nativo_english.api.shared.notifications.fanout import fan_out_notification
+from nativo_english.api.shared.notifications.models import Notification
+from nativo_english.api.shared.user.models import User
+
+
+class Command(BaseCommand):
+    help = (
+        'Fans a notification out to --users generated students with COPY and with bulk_create, '
+        'everything runs in a transaction rolled back at the end'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=100000, help='Students to generate (default: 100000)')
+        parser.add_argument('--chunk-size', type=int, default=5000, help='Users per chunk (default: 5000)')
+
+    def handle(self, *args, **options):
+        users, chunk_size = options['users'], options['chunk_size']
+        run = uuid.uuid4().hex[:8]
+
+        with transaction.atomic():
+            started = time.perf_counter()
+            User.objects.bulk_create(
+                (
+                    User(username=f'fanout-{run}-{number}', email=f'fanout-{run}-{number}@example.com', role='student', password='!')
+                    for number in range(users)
+                ),
+                batch_size=chunk_size,
+            )
+            self.stdout.write(f'Generated {users} students in {time.perf_counter() - started:.1f}s')
+
+            for method in ('copy', 'bulk_create'):
+                with transaction.atomic():
+                    started = time.perf_counter()
+                    notified = fan_out_notification(
+                        f'Benchmark {run}', 'system', 'role', role='student', send_email=False,
+                        chunk_size=chunk_size, method=method,
+                    )
+                    elapsed = time.perf_counter() - started
+
+                    self.stdout.write(
+                        f'{method:<12} {notified} notifications in {elapsed:.2f}s '
+                        f'({notified / elapsed:,.0f} rows/s, {Notification.objects.filter(message=f"Benchmark {run}").count()} rows)'
+                    )
+                    transaction.set_rollback(True)
+
+            transaction.set_rollback(True)
+
+        self.stdout.write(self.style.SUCCESS('Done, the generated rows were rolled back'))
@@ -0,0 +1,51 @@
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from nativo_english.api.shared.notifications.tasks import send_otp_email, send_template_email_to_many
+from nativo_english.api.shared.task_metrics import get_queue_latency_stats
+
+
+class Command(BaseCommand):
+    help = (
+        'Floods the bulk queue with --bulk campaign emails, sends --otp OTP emails every --interval seconds '
+        'meanwhile and prints the latency of every queue. Needs running workers with SENDGRID_API_URL '
+        'pointing to a fake server (manage.py run_fake_sendgrid)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--bulk', type=int, default=200, help='Campaign email tasks to enqueue (default: 200)')
+        parser.add_argument('--recipients', type=int, default=1000, help='Recipients per campaign email (default: 1000)')
+        parser.add_argument('--otp', type=int, default=50, help='OTP emails to send during the flood (default: 50)')
+        parser.add_argument('--interval', type=float, default=0.2, help='Seconds between two OTP emails (default: 0.2)')
+
+    def handle(self, *args, **options):
+        if 'api.sendgrid.com' in settings.SENDGRID_API_URL:
+            raise CommandError('SENDGRID_API_URL points to the real SendGrid API, run manage.py run_fake_sendgrid and point it there')
+
+        recipients = [f'bulk-{number}@example.com' for number in range(options['recipients'])]
+        for _ in range(options['bulk']):
+            send_template_email_to_many.delay('otp_email', recipients, {'otp': '000000'})
+        self.stdout.write(f"Enqueued {options['bulk']} campaign emails to {len(recipients)} recipients each")
+
+        for number in range(options['otp']):
+            send_otp_email.delay(f'otp-{number}@example.com', '000000')
+            time.sleep(options['interval'])
+
+        # Let the last OTP emails go out before reading the stats
+        time.sleep(settings.CELERY_QUEUE_LATENCY_TARGETS['priority'])
+
+        stats = get_queue_latency_stats(minutes=max(1, int(options['otp'] * options['interval'] // 60) + 2))
+        for queue, queue_stats in stats['queues'].items():
+            total = queue_stats['total']
+            self.stdout.write(
+                f"{queue:<9} tasks {total['count']:>6}  wait p95 {queue_stats['wait']['p95']}s  "
+                f"total p50 {total['p50']}s p95 {total['p95']}s p99 {total['p99']}s  "
+                f"within {queue_stats['target_seconds']}s: {total['within_target']}"
+            )
+
+        priority = stats['queues']['priority']['total']
+        if priority['within_target'] is not None and priority['p95'] is not None \
+                and priority['p95'] <= stats['queues']['priority']['target_seconds']:
+            self.stdout.write(self.style.SUCCESS('OTP emails stayed within their target during the bulk send'))
+        else:
+            self.stdout.write(self.style.WARNING('OTP emails missed their target during the bulk send'))
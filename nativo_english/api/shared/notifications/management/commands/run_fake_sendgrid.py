@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+from nativo_english.api.shared.notifications.fake_sendgrid import FakeSendGridServer
+
+
+class Command(BaseCommand):
+    help = 'Runs a local fake of the SendGrid mail/send API, set SENDGRID_API_URL to its URL to send emails to it'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--host', default='127.0.0.1', help='Interface to listen on (default: 127.0.0.1)')
+        parser.add_argument('--port', type=int, default=3030, help='Port to listen on (default: 3030)')
+
+    def handle(self, *args, **options):
+        server = FakeSendGridServer(options['host'], options['port'])
+        self.stdout.write(self.style.SUCCESS(f'Fake SendGrid listening on {server.url}, CTRL-C to stop'))
+
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            self.stdout.write(f'Received {len(server.requests)} mail/send calls')
@@ -0,0 +1,24 @@
+# Generated by Django 5.1.2 on 2026-10-18 10:00
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0002_emailtemplate'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # The column was never created (the field was a tuple), rows without a user cannot be kept
+        migrations.RunSQL('DELETE FROM notifications_notification', migrations.RunSQL.noop),
+        migrations.AddField(
+            model_name='notification',
+            name='fk_user_id',
+            field=models.ForeignKey(db_column='fk_user_id', default=None, on_delete=django.db.models.deletion.CASCADE, related_name='notifications', to=settings.AUTH_USER_MODEL),
+            preserve_default=False,
+        ),
+    ]
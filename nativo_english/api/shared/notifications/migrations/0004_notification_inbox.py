@@ -0,0 +1,142 @@
+# Generated by Django 5.1.2 on 2026-10-18 10:27
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+# Keeps notifications_notificationunreadcounter equal to the unread notifications of every user.
+# The triggers run once per statement over its transition table, so a fan-out COPY of thousands of
+# rows or a "mark all as read" UPDATE costs one counter write per user, not one per notification.
+UNREAD_COUNTER_SQL = """
+CREATE OR REPLACE FUNCTION notification_unread_counter_insert()
+RETURNS TRIGGER AS
+$$
+BEGIN
+    INSERT INTO notifications_notificationunreadcounter (fk_user_id, unread_count)
+    SELECT fk_user_id, COUNT(*)
+    FROM new_rows
+    WHERE NOT is_read
+    GROUP BY fk_user_id
+    ON CONFLICT (fk_user_id) DO UPDATE
+    SET unread_count = notifications_notificationunreadcounter.unread_count + EXCLUDED.unread_count;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION notification_unread_counter_update()
+RETURNS TRIGGER AS
+$$
+BEGIN
+    -- Rows that stopped being unread (or moved away) count -1 for their old user, rows that became
+    -- unread (or moved in) +1 for their new user
+    WITH deltas AS (
+        SELECT user_id, SUM(delta) AS delta
+        FROM (
+            SELECT fk_user_id AS user_id, -1 AS delta FROM old_rows WHERE NOT is_read
+            UNION ALL
+            SELECT fk_user_id AS user_id, 1 AS delta FROM new_rows WHERE NOT is_read
+        ) changes
+        GROUP BY user_id
+        HAVING SUM(delta) <> 0
+    ),
+    updated AS (
+        UPDATE notifications_notificationunreadcounter c
+        SET unread_count = GREATEST(c.unread_count + d.delta, 0)
+        FROM deltas d
+        WHERE c.fk_user_id = d.user_id
+        RETURNING c.fk_user_id
+    )
+    -- Users without a counter yet (an existing notification marked unread again)
+    INSERT INTO notifications_notificationunreadcounter (fk_user_id, unread_count)
+    SELECT user_id, delta
+    FROM deltas
+    WHERE delta > 0 AND user_id NOT IN (SELECT fk_user_id FROM updated)
+    ON CONFLICT (fk_user_id) DO NOTHING;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION notification_unread_counter_delete()
+RETURNS TRIGGER AS
+$$
+BEGIN
+    UPDATE notifications_notificationunreadcounter c
+    SET unread_count = GREATEST(c.unread_count - d.deleted, 0)
+    FROM (
+        SELECT fk_user_id, COUNT(*) AS deleted
+        FROM old_rows
+        WHERE NOT is_read
+        GROUP BY fk_user_id
+    ) d
+    WHERE c.fk_user_id = d.fk_user_id;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Transition tables allow a single event per trigger
+CREATE TRIGGER notification_unread_counter_insert_trigger
+    AFTER INSERT ON notifications_notification
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION notification_unread_counter_insert();
+
+CREATE TRIGGER notification_unread_counter_update_trigger
+    AFTER UPDATE ON notifications_notification
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION notification_unread_counter_update();
+
+CREATE TRIGGER notification_unread_counter_delete_trigger
+    AFTER DELETE ON notifications_notification
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION notification_unread_counter_delete();
+
+-- Backfill existing notifications
+INSERT INTO notifications_notificationunreadcounter (fk_user_id, unread_count)
+SELECT fk_user_id, COUNT(*)
+FROM notifications_notification
+WHERE NOT is_read
+GROUP BY fk_user_id;
+"""
+
+UNREAD_COUNTER_ROLLBACK_SQL = """
+DROP TRIGGER IF EXISTS notification_unread_counter_insert_trigger ON notifications_notification;
+DROP TRIGGER IF EXISTS notification_unread_counter_update_trigger ON notifications_notification;
+DROP TRIGGER IF EXISTS notification_unread_counter_delete_trigger ON notifications_notification;
+DROP FUNCTION IF EXISTS notification_unread_counter_insert();
+DROP FUNCTION IF EXISTS notification_unread_counter_update();
+DROP FUNCTION IF EXISTS notification_unread_counter_delete();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('User', '0010_otp_temptoken_passwordresetrequest_indexes'),
+        ('notifications', '0003_notification_fk_user_id'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotificationUnreadCounter',
+            fields=[
+                ('fk_user_id', models.OneToOneField(db_column='fk_user_id', on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='notification_unread_counter', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('unread_count', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['fk_user_id', '-id'], name='notification_user_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(condition=models.Q(('is_read', False)), fields=['fk_user_id', '-id'], name='notification_user_unread_idx'),
+        ),
+        migrations.RunSQL(UNREAD_COUNTER_SQL, reverse_sql=UNREAD_COUNTER_ROLLBACK_SQL),
+    ]
@@ -1,4 +1,6 @@
 from django.db import models
+from django.db.models import Q
+from django.utils import timezone
 from nativo_english.api.shared.user.models import User
 
 # Create your models here.
@@ -8,16 +10,30 @@ class Notification(models.Model):
         ('system', 'System')
     ]
 
-    fk_user_id = models.ForeignKey(User, on_delete=models.CASCADE, related_name="notifications", db_column='fk_user_id'),
+    fk_user_id = models.ForeignKey(User, on_delete=models.CASCADE, related_name="notifications", db_column='fk_user_id')
     message = models.TextField()
     notification_type = models.CharField(max_length=50, choices=NOTIFICATION_CHOICES)
     is_read = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # Inbox of a user, newest first
+            models.Index(fields=['fk_user_id', '-id'], name='notification_user_id_idx'),
+            # Unread part of the inbox, only as large as what is left to read
+            models.Index(fields=['fk_user_id', '-id'], condition=Q(is_read=False), name='notification_user_unread_idx'),
+        ]
 
     def __str__(self):
         return f"{self.fk_user_id.username} - {self.notification_type}"
-    
+
+
+# Unread notifications of a user, maintained by database triggers on Notification (see migration 0004)
+# so the inbox badge is a primary key lookup however many notifications the user has
+class NotificationUnreadCounter(models.Model):
+    fk_user_id = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, related_name="notification_unread_counter", db_column='fk_user_id')
+    unread_count = models.IntegerField(default=0)
+
 
 class EmailTemplate(models.Model):
     name = models.CharField(max_length=255, unique=True)
@@ -30,4 +46,36 @@ class EmailTemplate(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
-        return self.name
\ No newline at end of file
+        return self.name
+
+
+# Emails to send, written in the transaction of the change that triggers them and sent by the
+# outbox flusher once it commits (see api/shared/notifications/outbox.py)
+class EmailOutbox(models.Model):
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('sent', 'Sent'),
+        ('failed', 'Failed')
+    ]
+
+    template_name = models.CharField(max_length=255)
+    recipient_email = models.EmailField()
+    context = models.JSONField(default=dict, blank=True)
+    sender_type = models.CharField(max_length=20, default='default')
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True, default='')
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # Due emails claimed by the flusher, failed ones counted by the stats
+            models.Index(fields=['status', 'next_attempt_at'], name='email_outbox_status_due_idx'),
+            # Throughput of the last minutes
+            models.Index(fields=['sent_at'], name='email_outbox_sent_at_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.template_name} - {self.recipient_email} - {self.status}"
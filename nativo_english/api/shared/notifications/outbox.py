@@ -0,0 +1,269 @@
+import json
+import logging
+import time
+from collections import Counter, defaultdict
+from datetime import timedelta
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Min
+from django.template import Context
+from django.utils import timezone
+from nativo_english.api.shared.auth.purge import purge_in_batches
+from nativo_english.api.shared.notifications.dispatcher import SendGridError, get_dispatcher
+from nativo_english.api.shared.notifications.email_templates import get_email_template
+from nativo_english.api.shared.notifications.models import EmailOutbox, EmailTemplate
+
+logger = logging.getLogger(__name__)
+
+# A claimed email is sent (or rescheduled) before its lease ends, past it another flusher may claim it
+# again (e.g. the worker sending it died). The flusher renews the lease of its batch once half of it
+# has run out, so half a lease must outlast one SendGrid call backing off on every attempt (about
+# 6 minutes with the default timeout, see dispatcher.py)
+OUTBOX_LEASE = timedelta(minutes=15)
+
+# Attempts of an email before it is marked failed, waiting OUTBOX_BACKOFF_BASE * 2 ** (attempts - 1) in between
+OUTBOX_MAX_ATTEMPTS = 8
+OUTBOX_BACKOFF_BASE = timedelta(seconds=30)
+OUTBOX_MAX_BACKOFF = timedelta(hours=1)
+
+
+def enqueue_email(template_name, recipient_email, context=None, sender_type="default"):
+    """
+    Adds an email to the outbox, in the transaction of the caller: it is sent once (and only if) that
+    transaction commits, even if the broker is unavailable at that moment.
+
+    Args:
+        template_name (str): Email template (see `get_email_template`).
+        recipient_email (str): Recipient email address.
+        context (dict, optional): JSON serializable template context, `year` is added when rendering.
+        sender_type (str): Either 'default' or 'info' to select the sender.
+    """
+    email = EmailOutbox.objects.create(
+        template_name=template_name,
+        recipient_email=recipient_email,
+        context=context or {},
+        sender_type=sender_type,
+    )
+    transaction.on_commit(request_outbox_flush)
+
+    return email
+
+
+def request_outbox_flush():
+    """
+    Asks a worker to flush the outbox now, the periodic flush sends the emails if the broker is down.
+    """
+    from nativo_english.api.shared.notifications.tasks import flush_email_outbox_task
+
+    try:
+        flush_email_outbox_task.delay()
+    except Exception as ex:
+        logger.warning('Could not enqueue the email outbox flush, the periodic flush will send the email: %s', ex)
+
+
+def claim_outbox_batch(batch_size):
+    """
+    Claims up to `batch_size` due emails. Rows locked by a concurrent flusher are skipped, and the
+    claimed ones leased for `OUTBOX_LEASE` so the transaction ends before anything is sent. The
+    `next_attempt_at` of the returned emails is their lease.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        batch = list(
+            EmailOutbox.objects
+            .select_for_update(skip_locked=True)
+            .filter(status='pending', next_attempt_at__lte=now)
+            .order_by('next_attempt_at')
+            .only('id', 'template_name', 'recipient_email', 'context', 'sender_type', 'attempts')[:batch_size]
+        )
+        if batch:
+            EmailOutbox.objects.filter(id__in=[email.id for email in batch]).update(next_attempt_at=now + OUTBOX_LEASE)
+
+    for email in batch:
+        email.next_attempt_at = now + OUTBOX_LEASE
+
+    return batch
+
+
+def renew_outbox_lease(emails):
+    """
+    Extends the lease of claimed emails. An email whose lease ran out may have been claimed by another
+    flusher meanwhile: it is left to it and not returned.
+
+    Returns:
+        list: The emails still leased, their `next_attempt_at` set to the new lease.
+    """
+    lease = timezone.now() + OUTBOX_LEASE
+    with transaction.atomic():
+        kept_ids = set(
+            EmailOutbox.objects
+            .select_for_update()
+            .filter(id__in=[email.id for email in emails], status='pending', next_attempt_at=emails[0].next_attempt_at)
+            .values_list('id', flat=True)
+        )
+        EmailOutbox.objects.filter(id__in=kept_ids).update(next_attempt_at=lease)
+
+    kept = [email for email in emails if email.id in kept_ids]
+    for email in kept:
+        email.next_attempt_at = lease
+
+    return kept
+
+
+def _backoff(attempts):
+    return min(OUTBOX_MAX_BACKOFF, OUTBOX_BACKOFF_BASE * 2 ** (attempts - 1))
+
+
+def send_outbox_batch(batch):
+    """
+    Sends a claimed batch and records the outcome of every email. Emails sharing a template, a
+    context and a sender are rendered once and sent in the same SendGrid calls. Outcomes are only
+    recorded on the emails still holding the lease of the batch.
+
+    Returns:
+        Counter: `sent`, `retried` and `failed` emails.
+    """
+    groups = defaultdict(list)
+    for email in batch:
+        groups[(email.template_name, email.sender_type, json.dumps(email.context, sort_keys=True))].append(email)
+
+    outcome = Counter()
+    sent_ids = []
+    lease = batch[0].next_attempt_at
+    pending = {email.id for email in batch}
+    for (template_name, sender_type, _), emails in groups.items():
+        if pending and timezone.now() >= lease - OUTBOX_LEASE / 2:
+            # Renewed before it runs out, so another flusher never claims (and sends again) the rest of a slow batch
+            _mark_outbox_sent(sent_ids, lease, outcome)
+            sent_ids = []
+            kept = renew_outbox_lease([email for email in batch if email.id in pending])
+            pending = {email.id for email in kept}
+            lease = kept[0].next_attempt_at if kept else lease
+
+        emails = [email for email in emails if email.id in pending]
+        if not emails:
+            continue
+
+        try:
+            template = get_email_template(template_name)
+            html_content = template.body.render(Context({"year": timezone.now().year, **emails[0].context}))
+            get_dispatcher().send(template.subject, html_content, [email.recipient_email for email in emails], sender_type=sender_type)
+        except Exception as ex:
+            # Missing templates and rejected payloads (4xx but 429) will not get better with retries
+            permanent = isinstance(ex, EmailTemplate.DoesNotExist) or (
+                isinstance(ex, SendGridError) and ex.status_code != 429 and ex.status_code < 500
+            )
+            logger.warning('Could not send %s outbox emails of template %s: %s', len(emails), template_name, ex)
+            for email in emails:
+                attempts = email.attempts + 1
+                failed = permanent or attempts >= OUTBOX_MAX_ATTEMPTS
+                EmailOutbox.objects.filter(id=email.id, next_attempt_at=lease).update(
+                    status='failed' if failed else 'pending',
+                    attempts=attempts,
+                    next_attempt_at=timezone.now() + _backoff(attempts),
+                    last_error=str(ex)[:2000],
+                )
+                outcome['failed' if failed else 'retried'] += 1
+        else:
+            sent_ids.extend(email.id for email in emails)
+
+        pending.difference_update(email.id for email in emails)
+
+    _mark_outbox_sent(sent_ids, lease, outcome)
+
+    return outcome
+
+
+def _mark_outbox_sent(sent_ids, lease, outcome):
+    if sent_ids:
+        # OTP codes and reset links do not need to outlive the send
+        outcome['sent'] += EmailOutbox.objects.filter(id__in=sent_ids, next_attempt_at=lease).update(
+            status='sent', sent_at=timezone.now(), context={}, last_error='',
+        )
+
+
+def flush_email_outbox(batch_size=None, max_batches=None, batch_pause=None):
+    """
+    Sends the due emails of the outbox, `batch_size` at a time, at most `max_batches` batches per run
+    with `batch_pause` seconds in between, so a burst drains at a controlled rate. Several flushers
+    can run at once, each claims its own rows.
+
+    Returns:
+        dict: Emails claimed, sent, retried and failed, batches, duration and emails sent per second.
+    """
+    batch_size = batch_size or settings.EMAIL_OUTBOX_BATCH_SIZE
+    max_batches = max_batches or settings.EMAIL_OUTBOX_MAX_BATCHES
+    batch_pause = settings.EMAIL_OUTBOX_BATCH_PAUSE if batch_pause is None else batch_pause
+
+    stats = Counter()
+    started = time.monotonic()
+    for _ in range(max_batches):
+        batch = claim_outbox_batch(batch_size)
+        if not batch:
+            break
+
+        stats['batches'] += 1
+        stats['claimed'] += len(batch)
+        stats.update(send_outbox_batch(batch))
+
+        if len(batch) < batch_size:
+            break
+        if batch_pause:
+            time.sleep(batch_pause)
+
+    seconds = time.monotonic() - started
+    result = {
+        'claimed': stats['claimed'],
+        'sent': stats['sent'],
+        'retried': stats['retried'],
+        'failed': stats['failed'],
+        'batches': stats['batches'],
+        'seconds': round(seconds, 3),
+        'per_second': round(stats['sent'] / seconds, 1) if seconds and stats['sent'] else 0.0,
+    }
+    if stats['claimed']:
+        logger.info('Email outbox flushed: %s', result)
+
+    return result
+
+
+def get_email_outbox_stats():
+    """
+    Backlog and throughput of the outbox: pending and due emails, age of the oldest pending one,
+    failed emails and emails sent over the last minute and hour.
+    """
+    now = timezone.now()
+    pending = EmailOutbox.objects.filter(status='pending').aggregate(
+        count=Count('id'),
+        oldest_created_at=Min('created_at'),
+    )
+    sent_last_hour = EmailOutbox.objects.filter(sent_at__gte=now - timedelta(hours=1))
+
+    return {
+        'pending': pending['count'],
+        'due': EmailOutbox.objects.filter(status='pending', next_attempt_at__lte=now).count(),
+        'oldest_pending_seconds': (now - pending['oldest_created_at']).total_seconds() if pending['oldest_created_at'] else None,
+        'failed': EmailOutbox.objects.filter(status='failed').count(),
+        'sent_last_minute': sent_last_hour.filter(sent_at__gte=now - timedelta(minutes=1)).count(),
+        'sent_last_hour': sent_last_hour.count(),
+    }
+
+
+def purge_email_outbox():
+    """
+    Deletes the sent and failed emails older than `EMAIL_OUTBOX_RETENTION_DAYS`, in batches (see
+    `purge_in_batches`). Pending emails are never purged.
+
+    Returns:
+        dict: Rows deleted per table.
+    """
+    expires_before = timezone.now() - timedelta(days=settings.EMAIL_OUTBOX_RETENTION_DAYS)
+    purged = Counter()
+    # A failed email keeps the next_attempt_at of its last attempt, both filters use an index
+    purged.update(purge_in_batches(EmailOutbox.objects.filter(status='sent', sent_at__lt=expires_before)))
+    purged.update(purge_in_batches(EmailOutbox.objects.filter(status='failed', next_attempt_at__lt=expires_before)))
+
+    for label, count in sorted(purged.items()):
+        logger.info('Purged %s %s rows', count, label)
+
+    return dict(purged)
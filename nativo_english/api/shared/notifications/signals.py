@@ -1,13 +1,44 @@
 # nativo_english/api/notifications/signals.py
-from django.db.models.signals import post_save 
+import logging
+from celery.signals import worker_init
+from django.db import connections, transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 from nativo_english.api.shared.user.models import OTP
-from nativo_english.api.shared.notifications.tasks import send_otp_email
+from nativo_english.api.shared.notifications.models import EmailTemplate
+from nativo_english.api.shared.notifications.outbox import enqueue_email
+from nativo_english.api.shared.notifications.email_templates import invalidate_email_template, warm_email_templates
+
+logger = logging.getLogger(__name__)
+
 
 @receiver(post_save, sender=OTP)
 def otp_generated(sender, instance, created, **kwargs):
     if created:
-        # Send OTP email asynchronously using Celery
+        # Sent through the outbox once the OTP is committed
         instance.refresh_from_db()
-        send_otp_email.delay(instance.user.email, instance.otp)
+        enqueue_email("otp_email", instance.user.email, {
+            "user_name": instance.user.email,
+            "otp": instance.otp,
+            "otp_validity_minutes": 5,
+        })
+
+
+@receiver(post_save, sender=EmailTemplate)
+@receiver(post_delete, sender=EmailTemplate)
+def email_template_changed(sender, instance, **kwargs):
+    name = instance.name
+    updated_at = None if kwargs['signal'] is post_delete else instance.updated_at
+    transaction.on_commit(lambda: invalidate_email_template(name, updated_at))
+
+
+@worker_init.connect
+def warm_email_templates_on_worker_init(**kwargs):
+    # Prefork children inherit the compiled templates, but must not share the connection used here
+    try:
+        warm_email_templates()
+    except Exception as ex:
+        logger.warning('Could not warm the email templates: %s', ex)
+    finally:
+        connections.close_all()
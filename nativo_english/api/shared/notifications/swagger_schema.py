@@ -0,0 +1,122 @@
+# Define OpenAPI schema components for better readability
+from drf_spectacular.utils import OpenApiParameter, OpenApiRequest, OpenApiResponse
+from drf_spectacular.types import OpenApiTypes
+from nativo_english.api.shared.swagger_sample_responses import SWAGGER_ERROR_SAMPLE_RESPONSES_ADMIN_ROLE
+
+# --------------------------------------------
+# Notifications Inbox Swagger Schema
+# --------------------------------------------
+GET_NOTIFICATION_LIST_SCHEMA = {
+    'tags': ['Notifications'],
+    'operation_id': 'get_notifications_list',
+    'summary': 'Get the notifications of the logged in user',
+    'description': 'Lists the notifications of the logged in user, newest first. Pass the `next_cursor` of a page as `cursor` to get the next one.',
+    'parameters': [
+        OpenApiParameter(
+            name='cursor',
+            location=OpenApiParameter.QUERY,
+            description='Opaque cursor returned as next_cursor by the previous page (optional)',
+            required=False,
+            type=OpenApiTypes.STR,
+        ),
+        OpenApiParameter(
+            name='page_size',
+            location=OpenApiParameter.QUERY,
+            description='Number of notifications per page, at most 100 (default 20)',
+            required=False,
+            type=OpenApiTypes.INT,
+        ),
+        OpenApiParameter(
+            name='unread_only',
+            location=OpenApiParameter.QUERY,
+            description='Only list the unread notifications, true or false (default false)',
+            required=False,
+            type=OpenApiTypes.BOOL,
+        ),
+    ],
+    'responses': {
+        200: OpenApiResponse(
+            description='Successful response with a page of notifications',
+            response={
+                'type': 'object',
+                'properties': {
+                    'notifications': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'object',
+                            'properties': {
+                                'id': {'type': 'integer'},
+                                'message': {'type': 'string'},
+                                'notification_type': {'type': 'string'},
+                                'is_read': {'type': 'boolean'},
+                                'created_at': {'type': 'string', 'format': 'date-time'},
+                            },
+                        },
+                    },
+                    'next_cursor': {'type': 'string', 'nullable': True},
+                    'page_size': {'type': 'integer'},
+                },
+            },
+        ),
+        400: SWAGGER_ERROR_SAMPLE_RESPONSES_ADMIN_ROLE['400'],
+        401: SWAGGER_ERROR_SAMPLE_RESPONSES_ADMIN_ROLE['401'],
+    },
+}
+
+POST_NOTIFICATION_MARK_READ_SCHEMA = {
+    'tags': ['Notifications'],
+    'operation_id': 'mark_notifications_read',
+    'summary': 'Mark notifications of the logged in user as read',
+    'description': 'Marks the notifications in `ids` as read, or the whole inbox when `all` is true.',
+    'request': OpenApiRequest(
+        {
+            'type': 'object',
+            'properties': {
+                'ids': {
+                    'type': 'array',
+                    'items': {'type': 'integer'},
+                    'example': [12, 15],
+                    'description': 'Ids of the notifications to mark as read.',
+                },
+                'all': {
+                    'type': 'boolean',
+                    'example': False,
+                    'description': 'Mark the whole inbox as read instead.',
+                },
+            },
+        }
+    ),
+    'responses': {
+        200: OpenApiResponse(
+            description='Notifications marked as read',
+            response={
+                'type': 'object',
+                'properties': {
+                    'marked_read': {'type': 'integer'},
+                    'unread_count': {'type': 'integer'},
+                },
+            },
+        ),
+        400: SWAGGER_ERROR_SAMPLE_RESPONSES_ADMIN_ROLE['400'],
+        401: SWAGGER_ERROR_SAMPLE_RESPONSES_ADMIN_ROLE['401'],
+    },
+}
+
+GET_NOTIFICATION_UNREAD_COUNT_SCHEMA = {
+    'tags': ['Notifications'],
+    'operation_id': 'get_notifications_unread_count',
+    'summary': 'Get the unread notification count of the logged in user',
+    'description': 'Number of unread notifications (badge), read from a counter kept up to date by the database.',
+    'responses': {
+        200: OpenApiResponse(
+            description='Unread notification count',
+            response={
+                'type': 'object',
+                'properties': {
+                    'unread_count': {'type': 'integer'},
+                },
+            },
+        ),
+        401: SWAGGER_ERROR_SAMPLE_RESPONSES_ADMIN_ROLE['401'],
+    },
+}
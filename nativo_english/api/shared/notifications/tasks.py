@@ -2,13 +2,16 @@
 from celery import shared_task
 from django.core.mail import send_mail, get_connection
 from django.conf import settings
-from django.template import Template, Context
+from django.template import Context
 from django.utils.timezone import now
 from nativo_english.api.shared.notifications.models import EmailTemplate
 
-from nativo_english.api.shared.user.models import OTP
-from sendgrid import SendGridAPIClient
-from sendgrid.helpers.mail import Mail
+from nativo_english.api.shared.user.models import OTP, User
+from nativo_english.api.shared.notifications.dispatcher import get_dispatcher
+from nativo_english.api.shared.notifications.email_templates import get_email_template
+from nativo_english.api.shared.notifications.fanout import fan_out_notification
+from nativo_english.api.shared.notifications.outbox import flush_email_outbox, purge_email_outbox
+from django.utils.html import linebreaks
 
 
 def send_email_via_sendgrid(subject, recipient_email, html_content, sender_type="default"):
@@ -17,36 +20,14 @@ def send_email_via_sendgrid(subject, recipient_email, html_content, sender_type=
 
     Args:
         subject (str): Email subject.
-        recipient_email (str): Recipient's email address.
+        recipient_email (str | list[str]): Recipient's email address, or the addresses of all the
+            recipients of the same email (batched into as few API calls as possible).
         html_content (str): Email content in HTML format.
         sender_type (str): Either 'default' or 'info' to select the sender.
     """
-    try:
-        # Select the sender email based on the sender_type
-        from_email = (
-            settings.SENDGRID_NOTIFY_FROM_EMAIL  # noreply
-            if sender_type == "default"
-            else settings.SENDGRID_INFO_FROM_EMAIL  # info
-        )
-
-        # Construct the email
-        message = Mail(
-            from_email=from_email,
-            to_emails=recipient_email,
-            subject=subject,
-            html_content=html_content,
-        )
-
-        # Send the email
-        sg = SendGridAPIClient(settings.SENDGRID_API_KEY)
-        response = sg.send(message)
-
-        print(f"Email sent successfully: {response.status_code}")
-        return response.status_code
+    recipients = [recipient_email] if isinstance(recipient_email, str) else list(recipient_email)
 
-    except Exception as e:
-        print(f"Error sending email via SendGrid: {e}")
-        raise e
+    return get_dispatcher().send(subject, html_content, recipients, sender_type=sender_type)
     
 @shared_task
 def send_email_notification(subject, message, recipient_list):
@@ -61,10 +42,8 @@ def send_email_notification(subject, message, recipient_list):
 @shared_task
 def send_otp_email(user_email, otp):
     try:
-        # Fetch the template from the database
-        template = EmailTemplate.objects.get(name="otp_email")
-        subject = template.subject
-        body = template.body
+        # Compiled template of the worker, parsed once
+        template = get_email_template("otp_email")
 
         # Render the template with dynamic content
         context = {
@@ -73,14 +52,71 @@ def send_otp_email(user_email, otp):
             "otp_validity_minutes": 5,
             "year": now().year,
         }
-        rendered_body = Template(body).render(Context(context))
+        rendered_body = template.body.render(Context(context))
 
         # Send the email
         send_email_via_sendgrid (
-            subject=subject,
+            subject=template.subject,
             recipient_email=user_email,
             html_content=rendered_body
         )
 
     except Exception as e:
-        print(f"Error sending email: {e}")
\ No newline at end of file
+        print(f"Error sending email: {e}")
+
+
+@shared_task
+def send_template_email_to_many(template_name, recipient_emails, context=None, sender_type="default"):
+    """
+    Sends an email template rendered once to many recipients, through batched SendGrid calls.
+    """
+    template = get_email_template(template_name)
+    context = Context({"year": now().year, **(context or {})})
+
+    return send_email_via_sendgrid(
+        subject=template.subject,
+        recipient_email=recipient_emails,
+        html_content=template.body.render(context),
+        sender_type=sender_type,
+    )
+
+
+@shared_task
+def fan_out_notification_task(message, notification_type, audience, course_id=None, role=None, subject=None):
+    """
+    Notifies a whole audience (students of a course, a role, everyone) off the request, see `fan_out_notification`.
+    """
+    return fan_out_notification(message, notification_type, audience, course_id=course_id, role=role, subject=subject)
+
+
+@shared_task
+def send_notification_emails(user_ids, subject, message):
+    """
+    Emails a notification to a chunk of fanned out users, in batched SendGrid calls.
+    """
+    recipient_emails = list(User.objects.filter(id__in=user_ids, is_active=True).values_list('email', flat=True))
+    if not recipient_emails:
+        return 0
+
+    return send_email_via_sendgrid(
+        subject=subject,
+        recipient_email=recipient_emails,
+        html_content=linebreaks(message, autoescape=True),
+    )
+
+
+@shared_task
+def flush_email_outbox_task():
+    """
+    Sends the due emails of the outbox, enqueued when an email is added and every 30 seconds by celery beat.
+    """
+    return flush_email_outbox()
+
+
+@shared_task
+def purge_email_outbox_task():
+    """
+    Periodic purge of the sent and failed outbox emails past their retention, scheduled by celery beat
+    (see `CELERY_BEAT_SCHEDULE`). Returns the rows purged.
+    """
+    return purge_email_outbox()
@@ -1,3 +1,151 @@
-from django.shortcuts import render
+from drf_spectacular.utils import extend_schema
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.views import APIView
+from nativo_english.api.shared import messages
+from nativo_english.api.shared.pagination import encode_cursor, decode_cursor, get_int_param
+from nativo_english.api.shared.utils import api_response
+from .models import Notification, NotificationUnreadCounter
+from .swagger_schema import GET_NOTIFICATION_LIST_SCHEMA, POST_NOTIFICATION_MARK_READ_SCHEMA, GET_NOTIFICATION_UNREAD_COUNT_SCHEMA
 
-# Create your views here.
+NOTIFICATION_MAX_PAGE_SIZE = 100
+
+
+def get_user_notifications(user_id, cursor=None, page_size=20, unread_only=False):
+    """
+    Retrieves one page of the inbox of a user, newest first, using keyset (cursor) pagination.
+
+    Every page is a range scan of the (user, id) index, or of the partial unread index with `unread_only`,
+    so it costs the same whatever the number of notifications the user has.
+
+    Args:
+        user_id (int): Owner of the inbox.
+        cursor (str, optional): `next_cursor` of the previous page, None for the first page.
+        page_size (int, optional): Number of notifications to return, at most `NOTIFICATION_MAX_PAGE_SIZE`.
+        unread_only (bool, optional): Only list the unread notifications.
+
+    Returns:
+        dict: The notifications of the page and the `next_cursor` (None on the last page).
+
+    Raises:
+        ValidationError: If the cursor is invalid.
+    """
+    notifications = Notification.objects.filter(fk_user_id=user_id)
+    if unread_only:
+        notifications = notifications.filter(is_read=False)
+
+    if cursor:
+        position = decode_cursor(cursor)
+        # bool is an int subclass, a cursor holding true would read as id 1
+        if not isinstance(position.get('id'), int) or isinstance(position['id'], bool):
+            raise ValidationError({'detail': messages.INVALID_CURSOR_MESSAGE})
+        notifications = notifications.filter(id__lt=position['id'])
+
+    # Fetch one extra row to know whether there is a next page without counting
+    rows = list(
+        notifications
+        .order_by('-id')
+        .values('id', 'message', 'notification_type', 'is_read', 'created_at')[:page_size + 1]
+    )
+
+    page_rows = rows[:page_size]
+    next_cursor = encode_cursor({'id': page_rows[-1]['id']}) if len(rows) > page_size else None
+
+    return {
+        'notifications': page_rows,
+        'next_cursor': next_cursor,
+        'page_size': page_size,
+    }
+
+
+def get_unread_notification_count(user_id):
+    """
+    Returns the number of unread notifications of a user, read from the trigger maintained counter.
+    """
+    unread_count = (
+        NotificationUnreadCounter.objects
+        .filter(fk_user_id=user_id)
+        .values_list('unread_count', flat=True)
+        .first()
+    )
+    return unread_count or 0
+
+
+def mark_notifications_read(user_id, notification_ids=None):
+    """
+    Marks notifications of a user as read in one UPDATE, the unread counter follows through its trigger.
+
+    Args:
+        user_id (int): Owner of the notifications.
+        notification_ids (list[int], optional): Notifications to mark, None marks the whole inbox.
+
+    Returns:
+        int: Number of notifications that were unread.
+    """
+    notifications = Notification.objects.filter(fk_user_id=user_id, is_read=False)
+    if notification_ids is not None:
+        notifications = notifications.filter(id__in=notification_ids)
+
+    return notifications.update(is_read=True)
+
+
+# -----------------------------------------
+# This view corresponds to following endpoints
+# 1. List the notifications of the logged in user (any role --> GET /api/notifications/)
+# -----------------------------------------
+class NotificationListView(APIView):
+
+    @extend_schema(**GET_NOTIFICATION_LIST_SCHEMA)
+    def get(self, request, *args, **kwargs):
+        page_size = get_int_param(request.query_params, 'page_size', 20, max_value=NOTIFICATION_MAX_PAGE_SIZE)
+        cursor = request.query_params.get('cursor', None)
+        unread_only = str(request.query_params.get('unread_only', 'false')).lower() == 'true'
+
+        inbox = get_user_notifications(request.user.id, cursor, page_size, unread_only)
+
+        return api_response(status.HTTP_200_OK, messages.NOTIFICATION_LIST_RETRIEVED_SUCCESS_MESSAGE, inbox)
+# -----------------------------------------
+
+
+# -----------------------------------------
+# This view corresponds to following endpoints
+# 1. Mark notifications of the logged in user as read (any role --> POST /api/notifications/mark-read/)
+# -----------------------------------------
+class NotificationMarkReadView(APIView):
+
+    @extend_schema(**POST_NOTIFICATION_MARK_READ_SCHEMA)
+    def post(self, request, *args, **kwargs):
+        notification_ids = request.data.get('ids', None)
+        mark_all = request.data.get('all', False) is True
+
+        if not mark_all and (
+            not isinstance(notification_ids, list)
+            or not notification_ids
+            or not all(
+                isinstance(notification_id, int) and not isinstance(notification_id, bool)
+                for notification_id in notification_ids
+            )
+        ):
+            raise ValidationError({'detail': messages.NO_NOTIFICATIONS_SELECTED_MESSAGE})
+
+        marked = mark_notifications_read(request.user.id, None if mark_all else notification_ids)
+
+        return api_response(status.HTTP_200_OK, messages.NOTIFICATIONS_MARKED_READ_SUCCESS_MESSAGE, {
+            'marked_read': marked,
+            'unread_count': get_unread_notification_count(request.user.id),
+        })
+# -----------------------------------------
+
+
+# -----------------------------------------
+# This view corresponds to following endpoints
+# 1. Unread notification count (badge) of the logged in user (any role --> GET /api/notifications/unread-count/)
+# -----------------------------------------
+class NotificationUnreadCountView(APIView):
+
+    @extend_schema(**GET_NOTIFICATION_UNREAD_COUNT_SCHEMA)
+    def get(self, request, *args, **kwargs):
+        return api_response(status.HTTP_200_OK, messages.NOTIFICATION_UNREAD_COUNT_RETRIEVED_SUCCESS_MESSAGE, {
+            'unread_count': get_unread_notification_count(request.user.id),
+        })
+# -----------------------------------------
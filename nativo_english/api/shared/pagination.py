@@ -0,0 +1,75 @@
+import base64
+import binascii
+import json
+from rest_framework.exceptions import ValidationError
+from nativo_english.api.shared import messages
+
+
+def encode_cursor(payload):
+    """
+    Encodes a keyset position into an opaque, URL safe cursor token.
+
+    Args:
+        payload (dict): JSON serializable values identifying the last row of a page
+                        (e.g. the sort field, sort order, sort value and row id).
+
+    Returns:
+        str: Base64 (URL safe, unpadded) token to hand out as `next_cursor`.
+    """
+    raw = json.dumps(payload, separators=(',', ':'), default=str).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(token):
+    """
+    Decodes a cursor token produced by `encode_cursor`.
+
+    Args:
+        token (str): Cursor token received from the client.
+
+    Returns:
+        dict: The keyset position encoded in the token.
+
+    Raises:
+        ValidationError: If the token is malformed or has been tampered with.
+    """
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except (ValueError, TypeError, binascii.Error):
+        raise ValidationError({'detail': messages.INVALID_CURSOR_MESSAGE})
+
+    if not isinstance(payload, dict):
+        raise ValidationError({'detail': messages.INVALID_CURSOR_MESSAGE})
+
+    return payload
+
+
+def get_int_param(params, name, default, min_value=1, max_value=None):
+    """
+    Reads an integer query parameter (e.g. `page` or `page_size`), clamped to `[min_value, max_value]`.
+
+    Args:
+        params (QueryDict): Query parameters of the request.
+        name (str): Name of the parameter.
+        default (int): Value when the parameter is missing or empty.
+        min_value (int, optional): Lower bound. Defaults to 1.
+        max_value (int, optional): Upper bound, None for no bound.
+
+    Returns:
+        int: The value of the parameter.
+
+    Raises:
+        ValidationError: If the parameter is not an integer.
+    """
+    value = params.get(name)
+    if value is None or value == '':
+        value = default
+
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        raise ValidationError({'detail': messages.INVALID_INTEGER_PARAM_MESSAGE.format(name=name)})
+
+    value = max(value, min_value)
+    return min(value, max_value) if max_value is not None else value
@@ -0,0 +1,35 @@
+import orjson
+from rest_framework.utils.encoders import JSONEncoder
+from rest_framework.renderers import JSONRenderer
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    Drop-in replacement of DRF's `JSONRenderer` backed by orjson.
+
+    orjson encodes dicts, lists, datetimes (ISO 8601, `Z` for UTC) and UUIDs natively in C and
+    returns bytes directly, instead of walking the data in Python through `json.dumps` and
+    re-encoding the resulting string. Anything it does not know (Decimal, lazy translation strings,
+    querysets, ...) goes through DRF's `JSONEncoder`, so every payload DRF renders still renders.
+    Enabled through `REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES']`.
+    """
+    options = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+    _fallback_encoder = JSONEncoder()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render `data` into JSON, returning a bytestring.
+        """
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        options = self.options
+        if self.get_indent(accepted_media_type, renderer_context) is not None:
+            options |= orjson.OPT_INDENT_2
+
+        ret = orjson.dumps(data, default=self._fallback_encoder.default, option=options)
+
+        # Same as JSONRenderer: escape \u2028 and \u2029 so the output stays a strict javascript subset
+        return ret.replace('\u2028'.encode(), b'\\u2028').replace('\u2029'.encode(), b'\\u2029')
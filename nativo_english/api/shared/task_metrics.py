@@ -0,0 +1,129 @@
+import logging
+import time
+from celery.signals import before_task_publish, task_prerun, task_postrun
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (seconds) of the latency histogram buckets, the last one catches the rest
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10, 30, 60, 120, 300, 600, float('inf'))
+
+# Latencies are counted per minute window, kept for an hour
+LATENCY_WINDOW = 60
+LATENCY_RETENTION = 60 * 60
+
+# wait: published -> started by a worker, total: published -> finished (what the user waits for)
+LATENCY_KINDS = ('wait', 'total')
+
+
+def _bucket(seconds):
+    for index, bound in enumerate(LATENCY_BUCKETS):
+        if seconds <= bound:
+            return index
+
+
+def _key(kind, queue, window, bucket):
+    return f'task_latency:{kind}:{queue}:{window}:{bucket}'
+
+
+def record_latency(kind, queue, seconds, now=None):
+    """
+    Counts one task latency in the histogram of `queue` for the current minute window.
+    """
+    key = _key(kind, queue, int((now or time.time()) // LATENCY_WINDOW), _bucket(seconds))
+    try:
+        cache.add(key, 0, timeout=LATENCY_RETENTION)
+        cache.incr(key)
+    except Exception as ex:
+        logger.warning('Could not record the %s latency of queue %s: %s', kind, queue, ex)
+
+
+def _percentile(counts, total, ratio):
+    # Upper bound of the bucket holding the percentile, None above the last finite bound
+    threshold = ratio * total
+    seen = 0
+    for bound, count in zip(LATENCY_BUCKETS, counts):
+        seen += count
+        if seen >= threshold:
+            return bound if bound != float('inf') else None
+
+
+def get_queue_latency_stats(minutes=5):
+    """
+    Latency percentiles of every task queue over the last `minutes` minute windows.
+
+    Percentiles are the upper bound of their histogram bucket (None past the last one), `within_target`
+    is the share of the tasks finished within the target of the queue (`CELERY_QUEUE_LATENCY_TARGETS`).
+    """
+    current = int(time.time() // LATENCY_WINDOW)
+    windows = range(current - minutes + 1, current + 1)
+    queues = list(settings.CELERY_QUEUE_LATENCY_TARGETS)
+
+    keys = [
+        _key(kind, queue, window, bucket)
+        for kind in LATENCY_KINDS
+        for queue in queues
+        for window in windows
+        for bucket in range(len(LATENCY_BUCKETS))
+    ]
+    values = cache.get_many(keys)
+
+    stats = {}
+    for queue in queues:
+        target = settings.CELERY_QUEUE_LATENCY_TARGETS[queue]
+        stats[queue] = {'target_seconds': target}
+
+        for kind in LATENCY_KINDS:
+            counts = [
+                sum(values.get(_key(kind, queue, window, bucket), 0) for window in windows)
+                for bucket in range(len(LATENCY_BUCKETS))
+            ]
+            total = sum(counts)
+            kind_stats = {
+                'count': total,
+                'p50': _percentile(counts, total, 0.50) if total else None,
+                'p95': _percentile(counts, total, 0.95) if total else None,
+                'p99': _percentile(counts, total, 0.99) if total else None,
+            }
+            if kind == 'total':
+                within = sum(count for bound, count in zip(LATENCY_BUCKETS, counts) if bound <= target)
+                kind_stats['within_target'] = within / total if total else None
+            stats[queue][kind] = kind_stats
+
+    return {'minutes': minutes, 'queues': stats}
+
+
+@before_task_publish.connect
+def stamp_published_at(headers=None, **kwargs):
+    # Custom message headers end up on task.request in the worker
+    if headers is not None:
+        headers.setdefault('published_at', time.time())
+
+
+def _started(task):
+    request = task.request
+    published_at = request.get('published_at')
+    queue = (request.delivery_info or {}).get('routing_key')
+
+    # Scheduled (eta / countdown) tasks wait on purpose, eager ones never went through a queue
+    if published_at is None or queue is None or request.eta:
+        return None, None
+
+    return queue, published_at
+
+
+@task_prerun.connect
+def record_wait_latency(task=None, **kwargs):
+    queue, published_at = _started(task)
+    if queue is not None:
+        now = time.time()
+        record_latency('wait', queue, now - published_at, now)
+
+
+@task_postrun.connect
+def record_total_latency(task=None, **kwargs):
+    queue, published_at = _started(task)
+    if queue is not None:
+        now = time.time()
+        record_latency('total', queue, now - published_at, now)
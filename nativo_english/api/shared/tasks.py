@@ -0,0 +1,35 @@
+# shared/tasks.py
+import logging
+from celery import shared_task
+from .exports import export_file_name, purge_expired_exports, write_export_file
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(bind=True)
+def export_dataset_task(self, dataset, file_format, filters, compress=False):
+    """
+    Writes an export (see `write_export_file`) to `EXPORT_DIR`. The id of the task is the handle of the
+    export: its progress (`PROGRESS` state, rows written so far) and result are kept in the result backend.
+    """
+    file_name = f'{self.request.id}-{export_file_name(dataset, file_format, compress)}'
+    exported = 0
+
+    def on_progress(rows):
+        nonlocal exported
+        exported = rows
+        self.update_state(state='PROGRESS', meta={'rows': rows})
+
+    on_progress(0)
+    result = write_export_file(file_name, dataset, file_format, filters, compress, on_progress=on_progress)
+    logger.info('Exported %s %s rows to %s', exported, dataset, result['file_name'])
+
+    return {**result, 'rows': exported}
+
+
+@shared_task
+def purge_expired_exports_task():
+    """
+    Removes the export files past `EXPORT_RETENTION_HOURS`, run by celery beat.
+    """
+    return purge_expired_exports()
@@ -0,0 +1,307 @@
+import csv
+import io
+import json
+import logging
+import multiprocessing
+import os
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.validators import validate_email
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+from nativo_english.api.shared.user.models import User, UserPrefs, UserImportJob, UserImportRowError
+
+logger = logging.getLogger(__name__)
+
+IMPORT_FORMATS = ('csv', 'jsonl')
+
+# Columns read from every row, the others are ignored. Only username and email are required, users
+# imported without a password get an unusable one (they set it through forgot password)
+IMPORT_FIELDS = ('username', 'email', 'password', 'first_name', 'last_name', 'role', 'preferred_lang')
+
+ROLES = dict(User.ROLE_CHOICES)
+LANGUAGES = dict(settings.LANGUAGES)
+
+
+def save_import_file(uploaded_file, file_format, created_by_id=None):
+    """
+    Stores an uploaded file (copied in chunks, never read whole) in `USER_IMPORT_DIR` and creates its import job.
+    """
+    import_dir = Path(settings.USER_IMPORT_DIR)
+    import_dir.mkdir(parents=True, exist_ok=True)
+    file_path = import_dir / f'{uuid.uuid4().hex}.{file_format}'
+
+    with open(file_path, 'wb') as destination:
+        for chunk in uploaded_file.chunks():
+            destination.write(chunk)
+
+    return UserImportJob.objects.create(
+        file_name=uploaded_file.name[:255],
+        file_path=str(file_path),
+        file_format=file_format,
+        created_by_id=created_by_id,
+    )
+
+
+def count_import_rows(file_path, file_format):
+    """
+    Number of rows of the file (its non empty lines, minus the CSV header), for the progress of the job.
+    """
+    with open(file_path, 'rb') as import_file:
+        lines = sum(1 for line in import_file if line.strip())
+
+    return max(lines - 1, 0) if file_format == 'csv' else lines
+
+
+def iter_import_rows(file_path, file_format):
+    """
+    Streams the rows of an import file as `(row_number, row)`, `row` being a dict or None when the
+    line cannot be parsed. Row numbers are the data rows, starting at 1.
+    """
+    with open(file_path, 'rb') as raw_file:
+        text_file = io.TextIOWrapper(raw_file, encoding='utf-8-sig', newline='')
+
+        if file_format == 'csv':
+            for row_number, row in enumerate(csv.DictReader(text_file), start=1):
+                yield row_number, {key.strip().lower(): value for key, value in row.items() if key}
+            return
+
+        row_number = 0
+        for line in text_file:
+            if not line.strip():
+                continue
+            row_number += 1
+            try:
+                row = json.loads(line)
+            except ValueError:
+                row = None
+            yield row_number, row if isinstance(row, dict) else None
+
+
+def validate_import_row(row, seen_usernames, seen_emails):
+    """
+    Validates and normalizes one row.
+
+    Returns:
+        tuple: `(values, errors)`, `values` the normalized fields and `errors` a dict of field -> message
+        (empty when the row is valid).
+    """
+    if row is None:
+        return None, {'row': 'Row could not be parsed'}
+
+    values = {field: str(row.get(field) or '').strip() for field in IMPORT_FIELDS}
+    values['role'] = values['role'].lower() or 'student'
+    values['preferred_lang'] = values['preferred_lang'] or 'en'
+    errors = {}
+
+    if not values['username']:
+        errors['username'] = 'Username is required'
+    elif len(values['username']) > 150:
+        errors['username'] = 'Username must be at most 150 characters'
+    else:
+        try:
+            User.username_validator(values['username'])
+        except DjangoValidationError as ex:
+            errors['username'] = ex.messages[0]
+
+    if not values['email']:
+        errors['email'] = 'Email is required'
+    else:
+        try:
+            validate_email(values['email'])
+        except DjangoValidationError:
+            errors['email'] = 'Enter a valid email address'
+
+    if values['role'] not in ROLES:
+        errors['role'] = f'Role must be one of {", ".join(ROLES)}'
+
+    if values['preferred_lang'] not in LANGUAGES:
+        errors['preferred_lang'] = f'Language must be one of {", ".join(LANGUAGES)}'
+
+    for field in ('first_name', 'last_name'):
+        if len(values[field]) > 150:
+            errors[field] = 'Must be at most 150 characters'
+
+    # Duplicates of a row of the same file
+    if 'username' not in errors and values['username'] in seen_usernames:
+        errors['username'] = 'Username is repeated in the file'
+    if 'email' not in errors and values['email'] in seen_emails:
+        errors['email'] = 'Email is repeated in the file'
+
+    return values, errors
+
+
+def hash_password(password):
+    # Top level so the hash pool processes can run it
+    return make_password(password or None)
+
+
+def get_hash_pool():
+    """
+    Process pool hashing the passwords of an import on every core, None when this process cannot have
+    children (e.g. a prefork worker child), then passwords are hashed in process.
+    """
+    workers = hash_workers()
+    if workers < 2 or multiprocessing.current_process().daemon:
+        return None
+
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('fork'))
+
+
+def hash_workers():
+    return settings.USER_IMPORT_HASH_WORKERS or os.cpu_count() or 1
+
+
+def insert_import_chunk(rows):
+    """
+    Creates the users of a validated chunk (and their prefs) in one transaction, two multi row
+    INSERTs. Should a row clash with a user created meanwhile, the chunk is inserted row by row so
+    only that row fails.
+
+    Args:
+        rows (list[tuple]): `(row_number, values, password_hash)` of the chunk.
+
+    Returns:
+        list[tuple]: `(row_number, values, errors)` of the rows that could not be created.
+    """
+    def build(values, password_hash):
+        return User(
+            username=values['username'],
+            email=values['email'],
+            password=password_hash,
+            first_name=values['first_name'],
+            last_name=values['last_name'],
+            role=values['role'],
+        )
+
+    try:
+        with transaction.atomic():
+            users = User.objects.bulk_create([build(values, password_hash) for _, values, password_hash in rows])
+            UserPrefs.objects.bulk_create(
+                UserPrefs(fk_user_id=user, preferred_lang=values['preferred_lang'])
+                for user, (_, values, _) in zip(users, rows)
+            )
+        return []
+    except IntegrityError:
+        logger.info('User import chunk clashed with existing users, inserting it row by row')
+
+    failed = []
+    for row_number, values, password_hash in rows:
+        try:
+            with transaction.atomic():
+                user = build(values, password_hash)
+                user.save()
+                UserPrefs.objects.create(fk_user_id=user, preferred_lang=values['preferred_lang'])
+        except IntegrityError:
+            failed.append((row_number, values, {'row': 'Username or email already exists'}))
+
+    return failed
+
+
+def import_users(job, chunk_size=None):
+    """
+    Runs an import job: streams its file, validates the rows a chunk at a time (one query per chunk
+    checks the usernames and emails already taken), hashes the passwords in a process pool and
+    inserts every chunk in its own transaction. The progress of the job and the rows that failed are
+    saved after every chunk.
+
+    Returns:
+        UserImportJob: The job, completed.
+    """
+    chunk_size = chunk_size or settings.USER_IMPORT_CHUNK_SIZE
+    UserImportJob.objects.filter(id=job.id).update(
+        status='running',
+        started_at=timezone.now(),
+        total_rows=count_import_rows(job.file_path, job.file_format),
+    )
+
+    seen_usernames, seen_emails = set(), set()
+    hash_pool = get_hash_pool()
+    try:
+        chunk = []
+        for row_number, row in iter_import_rows(job.file_path, job.file_format):
+            chunk.append((row_number, row))
+            if len(chunk) == chunk_size:
+                import_chunk(job, chunk, seen_usernames, seen_emails, hash_pool)
+                chunk = []
+        if chunk:
+            import_chunk(job, chunk, seen_usernames, seen_emails, hash_pool)
+    finally:
+        if hash_pool is not None:
+            hash_pool.shutdown()
+
+    UserImportJob.objects.filter(id=job.id).update(status='completed', finished_at=timezone.now())
+    job.refresh_from_db()
+
+    return job
+
+
+def import_chunk(job, chunk, seen_usernames, seen_emails, hash_pool):
+    """
+    Validates, hashes and inserts one chunk of rows, then records its progress and errors.
+    """
+    valid, failed = [], []
+    for row_number, row in chunk:
+        values, errors = validate_import_row(row, seen_usernames, seen_emails)
+        if errors:
+            failed.append((row_number, values, errors))
+            continue
+
+        seen_usernames.add(values['username'])
+        seen_emails.add(values['email'])
+        valid.append((row_number, values))
+
+    # Users already in the database, one query for the whole chunk
+    if valid:
+        taken_usernames = set(User.objects.filter(username__in=[values['username'] for _, values in valid]).values_list('username', flat=True))
+        taken_emails = set(User.objects.filter(email__in=[values['email'] for _, values in valid]).values_list('email', flat=True))
+
+        kept = []
+        for row_number, values in valid:
+            errors = {}
+            if values['username'] in taken_usernames:
+                errors['username'] = 'Username already exists'
+            if values['email'] in taken_emails:
+                errors['email'] = 'Email already exists'
+            if errors:
+                failed.append((row_number, values, errors))
+            else:
+                kept.append((row_number, values))
+        valid = kept
+
+    if valid:
+        passwords = [values['password'] for _, values in valid]
+        if hash_pool is not None:
+            # A few tasks per process, each hash takes a few hundred milliseconds
+            chunksize = max(1, len(passwords) // (hash_workers() * 4))
+            password_hashes = list(hash_pool.map(hash_password, passwords, chunksize=chunksize))
+        else:
+            password_hashes = [hash_password(password) for password in passwords]
+
+        failed.extend(insert_import_chunk([
+            (row_number, values, password_hash)
+            for (row_number, values), password_hash in zip(valid, password_hashes)
+        ]))
+
+    failed.sort(key=lambda failure: failure[0])
+    UserImportRowError.objects.bulk_create(
+        UserImportRowError(
+            fk_job_id_id=job.id,
+            row_number=row_number,
+            username=(values or {}).get('username', '')[:150],
+            email=(values or {}).get('email', '')[:254],
+            errors=errors,
+        )
+        for row_number, values, errors in failed
+    )
+
+    UserImportJob.objects.filter(id=job.id).update(
+        processed_rows=F('processed_rows') + len(chunk),
+        created_count=F('created_count') + len(chunk) - len(failed),
+        error_count=F('error_count') + len(failed),
+    )
@@ -0,0 +1,29 @@
+# Generated by Django 5.1.2 on 2026-10-18 10:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('User', '0009_passwordresetrequest'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='otp',
+            index=models.Index(fields=['user', 'is_used', 'expires_at'], name='otp_user_used_expires_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='otp',
+            index=models.Index(fields=['expires_at'], name='otp_expires_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='passwordresetrequest',
+            index=models.Index(fields=['requested_at'], name='pwdresetrequest_requested_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='temptoken',
+            index=models.Index(fields=['expires_at'], name='temptoken_expires_idx'),
+        ),
+    ]
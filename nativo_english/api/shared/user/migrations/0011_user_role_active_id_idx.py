@@ -0,0 +1,18 @@
+# Generated by Django 5.1.2 on 2026-10-18 10:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('User', '0010_otp_temptoken_passwordresetrequest_indexes'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['role', 'is_active', '-id'], name='user_role_active_id_idx'),
+        ),
+    ]
@@ -22,6 +22,12 @@ class User(AbstractUser):
 
     # Override the email field to make it mandatory
     email = models.EmailField(unique=True, blank=False, null=False)
+
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # Admin user listing filtered by role / status, newest first
+            models.Index(fields=['role', 'is_active', '-id'], name='user_role_active_id_idx'),
+        ]
     
 class UserPrefs(models.Model):
     fk_user_id = models.OneToOneField(User, on_delete=models.CASCADE, related_name="prefs", db_column='fk_user_id')
@@ -66,6 +72,13 @@ class OTP(models.Model):
     expires_at = models.DateTimeField()
     is_used = models.BooleanField(default=False)  # Track if OTP is used
 
+    class Meta:
+        indexes = [
+            # Unused OTP lookups of a user, and the purge of expired ones
+            models.Index(fields=['user', 'is_used', 'expires_at'], name='otp_user_used_expires_idx'),
+            models.Index(fields=['expires_at'], name='otp_expires_idx'),
+        ]
+
     def __str__(self):
         return f"OTP for {self.user.email} - {self.otp} (Expires at: {self.expires_at})"
     
@@ -118,5 +131,67 @@ class TempToken(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     expires_at = models.DateTimeField()
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['expires_at'], name='temptoken_expires_idx'),
+        ]
+
     def is_valid(self):
-        return timezone.now() <= self.expires_at
\ No newline at end of file
+        return timezone.now() <= self.expires_at
+
+
+class PasswordResetRequest(models.Model):
+    user = models.ForeignKey(get_user_model(), on_delete=models.CASCADE)
+    requested_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['requested_at'], name='pwdresetrequest_requested_idx'),
+        ]
+
+
+# Bulk user import of an uploaded CSV / JSONL file, run by a Celery worker (see api/shared/user/imports.py)
+class UserImportJob(models.Model):
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('running', 'Running'),
+        ('completed', 'Completed'),
+        ('failed', 'Failed'),
+    ]
+    FORMAT_CHOICES = [
+        ('csv', 'CSV'),
+        ('jsonl', 'JSON Lines'),
+    ]
+
+    file_name = models.CharField(max_length=255)
+    file_path = models.CharField(max_length=500)
+    file_format = models.CharField(max_length=10, choices=FORMAT_CHOICES)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    total_rows = models.PositiveIntegerField(null=True, blank=True)
+    processed_rows = models.PositiveIntegerField(default=0)
+    created_count = models.PositiveIntegerField(default=0)
+    error_count = models.PositiveIntegerField(default=0)
+    failure_reason = models.TextField(blank=True, default='')
+
+    created_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='user_import_jobs', db_column='created_by')
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"User import {self.id} - {self.file_name} ({self.status})"
+
+
+# Rows of an import that were not created, with the reason per field
+class UserImportRowError(models.Model):
+    fk_job_id = models.ForeignKey(UserImportJob, on_delete=models.CASCADE, related_name='row_errors', db_column='fk_job_id')
+    row_number = models.PositiveIntegerField()
+    username = models.CharField(max_length=150, blank=True, default='')
+    email = models.CharField(max_length=254, blank=True, default='')
+    errors = models.JSONField(default=dict)
+
+    class Meta:
+        indexes = [
+            # Error report of a job, in file order
+            models.Index(fields=['fk_job_id', 'row_number'], name='userimport_error_job_row_idx'),
+        ]
@@ -0,0 +1,30 @@
+# user/tasks.py
+import logging
+import os
+from celery import shared_task
+from django.utils import timezone
+from .imports import import_users
+from .models import UserImportJob
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def import_users_task(job_id):
+    """
+    Runs a bulk user import job (see `import_users`), the uploaded file is removed once done.
+    """
+    job = UserImportJob.objects.get(id=job_id)
+    try:
+        job = import_users(job)
+    except Exception as ex:
+        logger.exception('User import %s failed', job_id)
+        UserImportJob.objects.filter(id=job_id).update(status='failed', failure_reason=str(ex)[:2000], finished_at=timezone.now())
+        return None
+    finally:
+        try:
+            os.remove(job.file_path)
+        except OSError:
+            pass
+
+    return {'created': job.created_count, 'errors': job.error_count}
@@ -1,3 +1,260 @@
-from django.shortcuts import render
+from django.db import connection
+from django.db.models import Count, Window
+from django.http import Http404
+from rest_framework.exceptions import ValidationError
+from nativo_english.api.shared import messages
+from nativo_english.api.shared.db_helper import estimate_queryset_count
+from nativo_english.api.shared.pagination import encode_cursor, decode_cursor
+from nativo_english.api.shared.user.models import User, UserImportJob, UserImportRowError
 
-# Create your views here.
+# Columns of a user in the admin listings, exactly what is rendered (no deferred field is read later)
+USER_LIST_FIELDS = ('id', 'username', 'email', 'first_name', 'last_name', 'role', 'is_active')
+
+
+def get_users_queryset(role=None, is_active=None):
+    """
+    Users matching the admin listing filters, newest first. Both filters are served by the
+    (role, is_active, id) index.
+    """
+    queryset = User.objects.all()
+    if role:
+        queryset = queryset.filter(role=role)
+
+    if is_active is not None:
+        queryset = queryset.filter(is_active=is_active)
+
+    return queryset.order_by('-id')
+
+
+def get_users_with_pagination(page_num, page_size, role=None, is_active=None, estimate_total=False):
+    """
+    Retrieves one page of users and the total number of matching users in a single query.
+
+    The exact total is computed by a window count alongside the page rows. With `estimate_total`
+    the count is skipped and the total comes from the planner statistics instead
+    (`estimate_queryset_count`), which keeps the listing cheap at millions of users.
+
+    Args:
+        page_num (int): Page to return, starting at 1.
+        page_size (int): Number of users per page.
+        role (str, optional): Only list users with this role.
+        is_active (bool, optional): Only list active (True) or suspended (False) users.
+        estimate_total (bool, optional): Return an estimated instead of an exact total count. Defaults to False.
+
+    Returns:
+        dict: The users of the page, the total count and the number of pages.
+    """
+    page_num, page_size = max(page_num, 1), max(page_size, 1)
+    queryset = get_users_queryset(role, is_active)
+    offset = (page_num - 1) * page_size
+
+    if estimate_total:
+        users = list(queryset.values(*USER_LIST_FIELDS)[offset:offset + page_size])
+        total_count = estimate_queryset_count(queryset)
+
+        # The estimate can never be lower than what has already been listed
+        total_count = max(total_count, offset + len(users))
+    else:
+        users = list(
+            queryset
+            .annotate(total_count=Window(Count('id')))
+            .values(*USER_LIST_FIELDS, 'total_count')[offset:offset + page_size]
+        )
+        if users:
+            total_count = users[0]['total_count']
+            for user in users:
+                user.pop('total_count')
+        else:
+            # Past the last page the window has no row to report the count on
+            total_count = queryset.count() if page_num > 1 else 0
+
+    return {
+        'count': total_count,
+        'is_total_estimated': estimate_total,
+        'num_pages': (total_count + page_size - 1) // page_size,
+        'current_page': page_num,
+        'results': users,
+    }
+
+
+def get_users_with_cursor(cursor, page_size, role=None, is_active=None):
+    """
+    Retrieves one page of users using keyset (cursor) pagination on the user id.
+
+    The database seeks directly past the last user of the previous page, so every page costs the
+    same no matter how deep the client has scrolled. No total count is computed in this mode.
+
+    Args:
+        cursor (str): `next_cursor` from the previous page, or an empty string for the first page.
+        page_size (int): Number of users to return.
+        The filters behave as in `get_users_with_pagination`.
+
+    Returns:
+        dict: The users of the page, the `next_cursor` (None on the last page) and the page size.
+
+    Raises:
+        ValidationError: If the cursor is invalid.
+    """
+    page_size = max(page_size, 1)
+    queryset = get_users_queryset(role, is_active)
+
+    if cursor:
+        position = decode_cursor(cursor)
+        if not isinstance(position.get('id'), int) or isinstance(position['id'], bool):
+            raise ValidationError({'detail': messages.INVALID_CURSOR_MESSAGE})
+        queryset = queryset.filter(id__lt=position['id'])
+
+    # Fetch one extra row to know whether there is a next page without counting
+    users = list(queryset.values(*USER_LIST_FIELDS)[:page_size + 1])
+
+    page_rows = users[:page_size]
+    next_cursor = encode_cursor({'id': page_rows[-1]['id']}) if len(users) > page_size else None
+
+    return {
+        'results': page_rows,
+        'next_cursor': next_cursor,
+        'page_size': page_size,
+    }
+
+
+# Fields of an import job returned to the admins
+USER_IMPORT_JOB_FIELDS = (
+    'id', 'file_name', 'file_format', 'status', 'total_rows', 'processed_rows', 'created_count',
+    'error_count', 'failure_reason', 'created_at', 'started_at', 'finished_at',
+)
+
+
+def get_user_import_job(job_id):
+    """
+    Retrieves the progress of a bulk user import job.
+
+    Raises:
+        Http404: If the job does not exist.
+    """
+    job = UserImportJob.objects.filter(id=job_id).values(*USER_IMPORT_JOB_FIELDS).first()
+    if job is None:
+        raise Http404(messages.USER_IMPORT_JOB_NOT_FOUND_MESSAGE)
+
+    job['progress'] = (
+        round(100 * job['processed_rows'] / job['total_rows'], 1) if job['total_rows']
+        else (100.0 if job['status'] == 'completed' else 0.0)
+    )
+    return job
+
+
+def get_user_import_errors(job_id, cursor, page_size):
+    """
+    Retrieves one page of the error report of an import job, in file order, using keyset (cursor)
+    pagination on the row number.
+
+    Raises:
+        ValidationError: If the cursor is invalid.
+    """
+    page_size = max(page_size, 1)
+    row_errors = UserImportRowError.objects.filter(fk_job_id=job_id)
+
+    if cursor:
+        position = decode_cursor(cursor)
+        if not isinstance(position.get('row'), int) or isinstance(position['row'], bool):
+            raise ValidationError({'detail': messages.INVALID_CURSOR_MESSAGE})
+        row_errors = row_errors.filter(row_number__gt=position['row'])
+
+    # Fetch one extra row to know whether there is a next page without counting
+    rows = list(row_errors.order_by('row_number').values('row_number', 'username', 'email', 'errors')[:page_size + 1])
+
+    page_rows = rows[:page_size]
+    next_cursor = encode_cursor({'row': page_rows[-1]['row_number']}) if len(rows) > page_size else None
+
+    return {
+        'errors': page_rows,
+        'next_cursor': next_cursor,
+        'page_size': page_size,
+    }
+
+
+# Users an admin batch operation can change at once
+BULK_UPDATE_MAX_IDS = 10000
+
+
+def get_bulk_user_selection(data):
+    """
+    Reads the users a bulk operation applies to: `ids` (a list of user ids) and / or `filter`
+    (`role` and / or `is_active`). Both narrow the selection, at least one is required.
+
+    Returns:
+        tuple: `(ids, filters)`, `ids` None when not given.
+
+    Raises:
+        ValidationError: If no users are selected or the selection is malformed.
+    """
+    ids = data.get('ids')
+    filters = data.get('filter') or {}
+
+    if ids is not None and (
+        not isinstance(ids, list)
+        or not ids
+        or len(ids) > BULK_UPDATE_MAX_IDS
+        # bool is an int subclass, and ids must fit the BIGINT of bulk_update_users' id = ANY(%s)
+        or not all(isinstance(user_id, int) and not isinstance(user_id, bool) and 0 < user_id < 2 ** 63 for user_id in ids)
+    ):
+        raise ValidationError({'detail': messages.INVALID_BULK_USER_IDS_MESSAGE.format(max_ids=BULK_UPDATE_MAX_IDS)})
+
+    if not isinstance(filters, dict) or set(filters) - {'role', 'is_active'}:
+        raise ValidationError({'detail': messages.INVALID_BULK_USER_FILTER_MESSAGE})
+
+    if 'role' in filters and filters['role'] not in dict(User.ROLE_CHOICES):
+        raise ValidationError({'detail': messages.INVALID_USER_ROLE_MESSAGE})
+
+    if 'is_active' in filters and not isinstance(filters['is_active'], bool):
+        raise ValidationError({'detail': messages.INVALID_BULK_USER_FILTER_MESSAGE})
+
+    if ids is None and not filters:
+        raise ValidationError({'detail': messages.NO_USERS_SELECTED_MESSAGE})
+
+    return ids, filters
+
+
+def bulk_update_users(values, ids=None, filters=None, exclude_id=None):
+    """
+    Applies `values` to every selected user in a single set based UPDATE, one round trip whatever the
+    number of users.
+
+    Users already holding the values are left untouched, so they are neither counted nor have their
+    tokens revoked by the caller.
+
+    Args:
+        values (dict): Columns to set (`role` and / or `is_active`).
+        ids (list[int], optional): Only update these users.
+        filters (dict, optional): Only update the users matching `role` / `is_active`.
+        exclude_id (int, optional): User never updated, e.g. the admin running the operation.
+
+    Returns:
+        list[int]: Ids of the users updated.
+    """
+    quote_name = connection.ops.quote_name
+    conditions, params = [], []
+
+    if ids is not None:
+        conditions.append('id = ANY(%s)')
+        params.append(list(ids))
+
+    for field, value in (filters or {}).items():
+        conditions.append(f'{quote_name(field)} = %s')
+        params.append(value)
+
+    if exclude_id is not None:
+        conditions.append('id <> %s')
+        params.append(exclude_id)
+
+    conditions.append('(' + ' OR '.join(f'{quote_name(field)} IS DISTINCT FROM %s' for field in values) + ')')
+    params.extend(values.values())
+
+    set_clause = ', '.join(f'{quote_name(field)} = %s' for field in values)
+    query = (
+        f'UPDATE {quote_name(User._meta.db_table)} SET {set_clause} '
+        f'WHERE {" AND ".join(conditions)} RETURNING id'
+    )
+
+    with connection.cursor() as cursor:
+        cursor.execute(query, [*values.values(), *params])
+        return [row[0] for row in cursor.fetchall()]
@@ -22,6 +22,13 @@ GET_TEACHER_COURSE_LIST_SCHEMA = {
             required=False,
             type=OpenApiTypes.INT,
         ),
+        OpenApiParameter(
+            name="cursor",
+            location=OpenApiParameter.QUERY,
+            description="Cursor pagination - Pass an empty value for the first page, then the next_cursor of the previous page. page_num is ignored and no total count is returned in this mode",
+            required=False,
+            type=OpenApiTypes.STR,
+        ),
         OpenApiParameter(
             name="page_size",
             location=OpenApiParameter.QUERY,
@@ -71,7 +78,7 @@ GET_TEACHER_COURSE_LIST_SCHEMA = {
         OpenApiParameter(
             name="search",
             location=OpenApiParameter.QUERY,
-            description="Search - Search for courses this will be helpful to integrate with search bar",
+            description="Search - Search for courses this will be helpful to integrate with search bar, matches title and description (full text and partial words), use sort_by=relevance to rank the matches",
             required=False,
             type=OpenApiTypes.STR,  # You should use STR since it's a textual value
         ),
@@ -81,7 +88,7 @@ GET_TEACHER_COURSE_LIST_SCHEMA = {
             description="Sort By - Sort by fields",
             required=False,
             type=OpenApiTypes.STR,  # You should use STR since it's a textual value
-            enum=['course_id', 'title', 'mode', 'avg_rating', 'price', 'enrollment_count', 'created_at', 'updated_at']
+            enum=['course_id', 'title', 'mode', 'avg_rating', 'price', 'enrollment_count', 'created_at', 'updated_at', 'relevance']
         ),
         OpenApiParameter(
             name="sort_order",
@@ -121,6 +128,7 @@ GET_TEACHER_COURSE_LIST_SCHEMA = {
                                 }
                             ],
                         "total_count": 1,
+                        "is_total_estimated": 'false',
                         "total_pages": 1,
                         "current_page": 1,
                         "page_size": 10  
@@ -385,4 +393,82 @@ UPDATE_TEACHER_COURSE_LESSON_UPDATE_SCHEMA = {
 #     'summary': 'Get All Lesson content (Admin access only)',
 #     'operation_id': 'get_lesson_content_list',
 #     'description': 'Lists all lesson content'
-# }
\ No newline at end of file
+# }
+# --------------------------------------------
+
+
+# --------------------------------------------
+# Get course tree by teacher Schema
+# --------------------------------------------
+GET_TEACHER_COURSE_TREE_SCHEMA = {
+    'tags': ['TeacherCourse'],
+    'summary': 'Retrieve the whole course tree by course ID (Teacher access only)',
+    'operation_id': 'get_course_tree_by_id_of_teacher',
+    'description': 'Retrieves a course with its sections, active lessons (ordered by lesson_position) and their active content (ordered by lesson_content_position) in one request. Content is returned in the requested language, lessons without content in it fall back to English.',
+    'parameters': [
+        OpenApiParameter(
+            name="id",
+            location=OpenApiParameter.PATH,
+            description="Course ID",
+            required=True,
+            type=OpenApiTypes.INT
+        ),
+        OpenApiParameter(
+            name="language",
+            location=OpenApiParameter.QUERY,
+            description="Language of the lesson content, defaults to the Accept-Language header",
+            required=False,
+            type=OpenApiTypes.STR,
+            enum=['en', 'fr', 'es']
+        ),
+    ],
+    'responses': {
+        200: OpenApiResponse(
+            description='Course tree successfully retrieved',
+            response={
+                'type': 'object',
+                'properties': {
+                    'status': {'type': 'integer', 'example': 200},
+                    'data': {
+                        'type': 'object',
+                        'example': {
+                            'course_id': 1,
+                            'title': 'Advanced Python Programming',
+                            'language': 'en',
+                            'sections': [
+                                {
+                                    'section_id': 1,
+                                    'section_title': 'Getting started',
+                                    'section_description': 'Setup and basics',
+                                    'lessons': [
+                                        {
+                                            'lesson_id': 1,
+                                            'lesson_title': 'Installing Python',
+                                            'lesson_description': None,
+                                            'lesson_position': 1,
+                                            'language': 'en',
+                                            'contents': [
+                                                {
+                                                    'content_id': 1,
+                                                    'content_title': 'Introduction',
+                                                    'lesson_content_position': 1,
+                                                    'content_type': 'text',
+                                                    'content_text': 'Welcome to the course',
+                                                    'content_video_url': None,
+                                                    'content_audio_url': None,
+                                                    'content_image_url': None,
+                                                },
+                                            ],
+                                        },
+                                    ],
+                                },
+                            ],
+                        },
+                    },
+                },
+            },
+        ),
+        400: SWAGGER_ERROR_SAMPLE_RESPONSES_ADMIN_ROLE ['400'],
+        404: SWAGGER_ERROR_SAMPLE_RESPONSES_ADMIN_ROLE ['404'],
+    },
+}
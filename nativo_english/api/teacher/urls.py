@@ -1,6 +1,6 @@
 from django.urls import path, include
 from .views import (
-    TeacherCourseListCreateView, TeacherCourseRetrieveUpdateView, 
+    TeacherCourseListCreateView, TeacherCourseRetrieveUpdateView, TeacherCourseTreeRetrieveView, 
     TeacherCourseSectionListCreateView, TeacherCourseSectionRetrieveUpdateView,
     TeacherCourseLessonListCreateView, TeacherCourseLessonRetrieveUpdateView)
 
@@ -8,6 +8,7 @@ from .views import (
 urlpatterns = [
     path('course/', TeacherCourseListCreateView.as_view(), name='teacher-course-create-list'),
     path('course/<int:id>/', TeacherCourseRetrieveUpdateView.as_view(), name='teacher-course-detail'),
+    path('course/<int:id>/tree/', TeacherCourseTreeRetrieveView.as_view(), name='teacher-course-tree'),
 
     path('course/<int:course_id>/section/', TeacherCourseSectionListCreateView.as_view(), name='teacher-course-section-create-list'),
     path('course/<int:course_id>/section/<int:course_section_id>/', TeacherCourseSectionRetrieveUpdateView.as_view(), name='teacher-course-section-detail'),
@@ -11,20 +11,27 @@ from nativo_english.api.shared.course.serializer import (
     CourseSerializer, CourseSectionSerializer,
     CourseLessonSerializer )
 from nativo_english.api.shared.course.views import (
-    get_all_courses_with_pagination, create_course,
+    get_all_courses_with_pagination, get_all_courses_with_cursor, create_course,
     get_course_detail_by_id, update_course,
+    get_course_tree_by_id, get_request_language,
     get_all_course_sections, create_course_section,
     get_course_section_by_id, update_course_section,
     get_all_course_lessons, create_course_lesson,
     get_course_lesson_by_id, update_course_lesson)
 
+from nativo_english.api.shared.conditional import conditional_get
+from nativo_english.api.shared.pagination import get_int_param
+from nativo_english.api.shared.course.etags import (
+    course_detail_validator, course_tree_validator, course_section_list_validator,
+    course_section_validator, course_lesson_list_validator, course_lesson_validator)
 from .swagger_schema import (
     GET_TEACHER_COURSE_LIST_SCHEMA, POST_TEACHER_COURSE_CREATE_SCHEMA, 
     GET_TEACHER_COURSE_RETRIEVE_SCHEMA, UPDATE_TEACHER_COURSE_UPDATE_SCHEMA,
     GET_TEACHER_COURSE_ALL_SECTION_SCHEMA, POST_TEACHER_COURSE_SECTION_CREATE_SCHEMA,
     GET_TEACHER_COURSE_SECTION_DETAIL_BY_ID_SCHEMA, UPDATE_TEACHER_COURSE_SECTION_BY_ID_SCHEMA,
     GET_TEACHER_ALL_COURSE_LESSON_RETRIEVE_SCHEMA, GET_TEACHER_COURSE_LESSON_RETRIEVE_SCHEMA,
-    POST_TEACHER_COURSE_LESSON_CREATE_SCHEMA, UPDATE_TEACHER_COURSE_LESSON_UPDATE_SCHEMA)
+    POST_TEACHER_COURSE_LESSON_CREATE_SCHEMA, UPDATE_TEACHER_COURSE_LESSON_UPDATE_SCHEMA,
+    GET_TEACHER_COURSE_TREE_SCHEMA)
 
 
 # Create your views here.
@@ -50,8 +57,8 @@ class TeacherCourseListCreateView(APIView):
 
     @extend_schema(**GET_TEACHER_COURSE_LIST_SCHEMA)
     def get(self, request, *args, **kwargs):
-        page_num = int(request.query_params.get('page_num', 1))
-        page_size = int(request.query_params.get('page_size', 10))
+        page_num = get_int_param(request.query_params, 'page_num', 1)
+        page_size = get_int_param(request.query_params, 'page_size', 10)
         filter_title = request.query_params.get('title', None)
         filter_mode = request.query_params.get('mode', None)
         filter_is_paid = request.query_params.get('is_paid', None)
@@ -62,6 +69,24 @@ class TeacherCourseListCreateView(APIView):
         filter_level = request.query_params.get('level', None)
 
         owner_id = request.user.id
+        cursor = request.query_params.get('cursor', None)
+
+        # Keyset pagination mode, the client passes back the next_cursor of the previous page
+        if cursor is not None:
+            queryset = get_all_courses_with_cursor(cursor,
+                                                   page_size,
+                                                   filter_title,
+                                                   filter_mode,
+                                                   filter_is_paid,
+                                                   filter_is_active,
+                                                   search_query,
+                                                   sort_field,
+                                                   sort_order,
+                                                   owner_id,
+                                                   filter_level)
+
+            return api_response(status.HTTP_200_OK, messages.COURSE_LIST_RETRIEVED_SUCCESS_MESSAGE, queryset)
+
         queryset = get_all_courses_with_pagination(page_num, 
                                                    page_size, 
                                                    filter_title, 
@@ -109,6 +134,7 @@ class TeacherCourseRetrieveUpdateView(APIView):
     pagination_class = TeacherUserPagination
 
     @extend_schema(**GET_TEACHER_COURSE_RETRIEVE_SCHEMA)
+    @conditional_get(course_detail_validator, owned=True)
     def get(self, request, id, *args, **kwargs):
         course_data = get_course_detail_by_id(id, request.user.id)
         
@@ -136,6 +162,26 @@ class TeacherCourseRetrieveUpdateView(APIView):
 # -----------------------------------------
 
 
+# -----------------------------------------
+# This view corresponds to following endpoints
+# 1. Retreive the whole Course tree (sections, lessons, content) by ID (can only be access by Teacher user rol --> GET /api/teacher/course/{id}/tree/)
+# -----------------------------------------
+class TeacherCourseTreeRetrieveView(APIView):
+    permission_classes = [IsAuthenticated, IsTeacherUserRole]
+
+    @extend_schema(**GET_TEACHER_COURSE_TREE_SCHEMA)
+    @conditional_get(course_tree_validator, owned=True)
+    def get(self, request, id, *args, **kwargs):
+        course_tree = get_course_tree_by_id(id, get_request_language(request), request.user.id)
+
+        # Check if there is no course access to this teacher
+        if not course_tree:
+            return api_response(status.HTTP_403_FORBIDDEN, messages.COURSE_NOT_FOUND_MESSAGE)
+
+        return api_response(status.HTTP_200_OK, messages.COURSE_TREE_RETRIEVED_SUCCESS_MESSAGE, course_tree)
+# -----------------------------------------
+
+
 
 # -----------------------------------------
 # This view corresponds to following endpoints
@@ -151,6 +197,7 @@ class TeacherCourseSectionListCreateView(APIView):
     pagination_class = TeacherUserPagination
 
     @extend_schema(**GET_TEACHER_COURSE_ALL_SECTION_SCHEMA)
+    @conditional_get(course_section_list_validator, owned=True)
     def get(self, request, course_id, *args, **kwargs):
         title = request.query_params.get('title')
 
@@ -213,6 +260,7 @@ class TeacherCourseSectionRetrieveUpdateView(APIView):
     pagination_class = TeacherUserPagination
 
     @extend_schema(**GET_TEACHER_COURSE_SECTION_DETAIL_BY_ID_SCHEMA)
+    @conditional_get(course_section_validator)
     def get(self, request, course_id, course_section_id,*args, **kwargs):
         course_data = get_course_section_by_id(request, course_section_id, course_id)
         return api_response(status.HTTP_200_OK, messages.COURSE_SECTION_RETRIEVED_SUCCESS_MESSAGE, course_data)
@@ -246,6 +294,7 @@ class TeacherCourseLessonListCreateView(APIView):
     pagination_class = TeacherUserPagination
 
     @extend_schema(**GET_TEACHER_ALL_COURSE_LESSON_RETRIEVE_SCHEMA)
+    @conditional_get(course_lesson_list_validator)
     def get(self, request, course_section_id, *args, **kwargs):
         title = request.query_params.get('title')
         
@@ -295,6 +344,7 @@ class TeacherCourseLessonRetrieveUpdateView(APIView):
     pagination_class = TeacherUserPagination
 
     @extend_schema(**GET_TEACHER_COURSE_LESSON_RETRIEVE_SCHEMA)
+    @conditional_get(course_lesson_validator)
     def get(self, request, course_section_id, course_lesson_id, *args, **kwargs):
         course_data = get_course_lesson_by_id(course_lesson_id)
         return api_response(status.HTTP_200_OK, messages.COURSE_LESSON_RETRIEVED_SUCCESS_MESSAGE, course_data)
@@ -1,4 +1,5 @@
 from django.urls import path, include
+from rest_framework_simplejwt.views import TokenRefreshView
 from nativo_english.api.shared.auth.views import LoginView, TwoFactorView, VerifyOtpView, ForgotPasswordView, UpdatePasswordView, ResendOtpView, LogoutView
 
 # Will be adding all api based urlpatterns here
@@ -6,6 +7,7 @@ urlpatterns = [
     
     path('login/', LoginView.as_view(), name='token_obtain_pair'),
     path('logout/', LogoutView.as_view(), name='logout_user'),
+    path('token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
     path('2fa/', TwoFactorView.as_view(), name='two_factor'),
     path('verify-otp/', VerifyOtpView.as_view(), name='verify_otp'),
     path('resend-otp/', ResendOtpView.as_view(), name='resend-otp'),
@@ -17,7 +19,10 @@ urlpatterns = [
     path('admin/', include('nativo_english.api.admin.urls')),
 
     # Teacher API URLs goes here
-    path('teacher/', include('nativo_english.api.teacher.urls'))
+    path('teacher/', include('nativo_english.api.teacher.urls')),
+
+    # Notification inbox URLs (any role) goes here
+    path('notifications/', include('nativo_english.api.shared.notifications.urls'))
 
 ]
 
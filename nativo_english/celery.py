@@ -12,12 +12,13 @@ app = Celery('nativo_english')
 # Namespace 'CELERY' means all celery-related config keys
 # should be prefixed with `CELERY_`.
 app.config_from_object('django.conf:settings', namespace='CELERY')
-app.conf.update(
-    CELERY_POOL = 'solo'
-)
+
 # Load task modules from all registered Django app configs.
 app.autodiscover_tasks()
 
+# Per queue latency histograms, recorded on publish / task start / task end
+import nativo_english.api.shared.task_metrics  # noqa: E402,F401
+
 @app.task(bind=True)
 def debug_task(self):
     print(f'Request: {self.request!r}')
\ No newline at end of file
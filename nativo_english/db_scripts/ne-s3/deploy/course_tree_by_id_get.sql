@@ -0,0 +1,106 @@
+/*****************************************************
+Author: Muhammad Hassaan Bashir
+Ticket:
+Description: This function will return the whole tree of a course (course -> sections -> lessons -> content)
+             as a single JSON document built with jsonb_agg / jsonb_build_object, so a client renders a
+             course with one query instead of one call per section and per lesson.
+             Only active lessons and active content are included, lessons are ordered by lesson_position and
+             content by lesson_content_position. Content is returned in p_language, a lesson without content
+             in that language falls back to p_fallback_language. Returns NULL if the course does not exist
+             (or is not owned by p_owner_id).
+
+Params: course_id, language, fallback_language, owner_id (optional for teacher role)
+*****************************************************/
+
+-- Drop the function if it already exists
+DROP FUNCTION IF EXISTS course_tree_by_id_get(BIGINT, TEXT, TEXT, BIGINT);
+
+-- Create or replace the function
+CREATE OR REPLACE FUNCTION course_tree_by_id_get(
+    p_course_id BIGINT,                -- Course ID
+    p_language TEXT DEFAULT 'en',      -- Language of the lesson content
+    p_fallback_language TEXT DEFAULT 'en',
+    p_owner_id BIGINT DEFAULT NULL     -- Owner ID (optional, for teacher role)
+)
+RETURNS JSONB AS
+$$
+BEGIN
+    RETURN (
+        SELECT jsonb_build_object(
+            'course_id', crs.id,
+            'title', crs.title,
+            'description', crs.description,
+            'is_paid', crs.is_paid,
+            'price', crs.price,
+            'mode', crs.mode,
+            'level', crs.level,
+            'avg_rating', crs.avg_rating,
+            'is_active', crs.is_active,
+            'enrollment_count', crs.enrollment_count,
+            'language', p_language,
+            'sections', COALESCE((
+                SELECT jsonb_agg(
+                    jsonb_build_object(
+                        'section_id', sec.id,
+                        'section_title', sec.section_title,
+                        'section_description', sec.section_description,
+                        'lessons', COALESCE((
+                            SELECT jsonb_agg(
+                                jsonb_build_object(
+                                    'lesson_id', lsn.id,
+                                    'lesson_title', lsn.lesson_title,
+                                    'lesson_description', lsn.lesson_description,
+                                    'lesson_position', lsn.lesson_position,
+                                    'language', lang.code,
+                                    'contents', COALESCE((
+                                        SELECT jsonb_agg(
+                                            jsonb_build_object(
+                                                'content_id', cnt.id,
+                                                'content_title', cnt.content_title,
+                                                'lesson_content_position', cnt.lesson_content_position,
+                                                'content_type', cnt.content_type,
+                                                'content_text', cnt.content_text,
+                                                'content_video_url', cnt.content_video_url,
+                                                'content_audio_url', cnt.content_audio_url,
+                                                'content_image_url', cnt.content_image_url
+                                            )
+                                            ORDER BY cnt.lesson_content_position, cnt.id
+                                        )
+                                        FROM "course_lessoncontent" cnt
+                                        WHERE cnt.fk_course_lesson_id = lsn.id
+                                          AND cnt.is_active = TRUE
+                                          AND cnt.language = lang.code
+                                    ), '[]'::JSONB)
+                                )
+                                ORDER BY lsn.lesson_position, lsn.id
+                            )
+                            FROM "course_courselesson" lsn
+                            -- Language of the lesson: the requested one if the lesson has content in it
+                            CROSS JOIN LATERAL (
+                                SELECT CASE
+                                    WHEN EXISTS (
+                                        SELECT 1
+                                        FROM "course_lessoncontent" req
+                                        WHERE req.fk_course_lesson_id = lsn.id
+                                          AND req.is_active = TRUE
+                                          AND req.language = p_language
+                                    ) THEN p_language
+                                    ELSE p_fallback_language
+                                END AS code
+                            ) lang
+                            WHERE lsn.fk_section_id = sec.id
+                              AND lsn.is_active = TRUE
+                        ), '[]'::JSONB)
+                    )
+                    ORDER BY sec.id
+                )
+                FROM "course_coursesection" sec
+                WHERE sec.fk_course_id = crs.id
+            ), '[]'::JSONB)
+        )
+        FROM "course_course" crs
+        WHERE crs.id = p_course_id
+          AND (p_owner_id IS NULL OR crs.fk_owner_id = p_owner_id) -- Filter by owner if provided
+    );
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,65 @@
+/*****************************************************
+Author: Muhammad Hassaan Bashir
+Ticket:
+Description: This function will return the validator of a course tree (see course_tree_by_id_get): the latest
+             updated_at and the row counts of the course, its sections, active lessons and active content,
+             plus the trigger-maintained course counters. It only aggregates indexed columns, so it is much
+             cheaper than building the tree. Returns no row if the course does not exist
+             (or is not owned by p_owner_id).
+
+Params: course_id, owner_id (optional for teacher role)
+*****************************************************/
+
+-- Drop the function if it already exists
+DROP FUNCTION IF EXISTS course_tree_version_get(BIGINT, BIGINT);
+
+-- Create or replace the function
+CREATE OR REPLACE FUNCTION course_tree_version_get(
+    p_course_id BIGINT,             -- Course ID
+    p_owner_id BIGINT DEFAULT NULL  -- Owner ID (optional, for teacher role)
+)
+RETURNS TABLE(
+    last_modified TIMESTAMPTZ,
+    section_count BIGINT,
+    lesson_count BIGINT,
+    content_count BIGINT,
+    enrollment_count BIGINT,
+    rating_count BIGINT,
+    rating_sum FLOAT
+) AS
+$$
+BEGIN
+    RETURN QUERY
+    SELECT
+        GREATEST(crs.updated_at, sections.last_modified, lessons.last_modified, contents.last_modified),
+        sections.total,
+        lessons.total,
+        contents.total,
+        crs.enrollment_count::BIGINT,
+        crs.rating_count::BIGINT,
+        crs.rating_sum
+    FROM
+        "course_course" crs
+    CROSS JOIN LATERAL (
+        SELECT MAX(sec.updated_at) AS last_modified, COUNT(*) AS total
+        FROM "course_coursesection" sec
+        WHERE sec.fk_course_id = crs.id
+    ) sections
+    CROSS JOIN LATERAL (
+        SELECT MAX(lsn.updated_at) AS last_modified, COUNT(*) AS total
+        FROM "course_coursesection" sec
+        INNER JOIN "course_courselesson" lsn ON lsn.fk_section_id = sec.id AND lsn.is_active = TRUE
+        WHERE sec.fk_course_id = crs.id
+    ) lessons
+    CROSS JOIN LATERAL (
+        SELECT MAX(cnt.updated_at) AS last_modified, COUNT(*) AS total
+        FROM "course_coursesection" sec
+        INNER JOIN "course_courselesson" lsn ON lsn.fk_section_id = sec.id AND lsn.is_active = TRUE
+        INNER JOIN "course_lessoncontent" cnt ON cnt.fk_course_lesson_id = lsn.id AND cnt.is_active = TRUE
+        WHERE sec.fk_course_id = crs.id
+    ) contents
+    WHERE
+        crs.id = p_course_id
+        AND (p_owner_id IS NULL OR crs.fk_owner_id = p_owner_id); -- Filter by owner if provided
+END;
+$$ LANGUAGE plpgsql;
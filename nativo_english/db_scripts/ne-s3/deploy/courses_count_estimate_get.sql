@@ -0,0 +1,55 @@
+/*****************************************************
+Author: Muhammad Hassaan Bashir
+Ticket:
+Description: This function will return the planner's estimate of the number of courses matching the
+             course list filters, read from EXPLAIN instead of counting rows. Its cost does not grow with
+             the size of course_course, at the price of being approximate (it is as fresh as the table statistics).
+
+Params: same filters as courses_list_with_pagination_get
+*****************************************************/
+
+-- Drop the function if it already exists
+DROP FUNCTION IF EXISTS courses_count_estimate_get(TEXT, TEXT, BOOLEAN, BOOLEAN, TEXT, BIGINT, TEXT);
+
+-- Create or replace the function
+CREATE OR REPLACE FUNCTION courses_count_estimate_get(
+    filter_title TEXT DEFAULT NULL,
+    filter_mode TEXT DEFAULT NULL,
+    filter_is_paid BOOLEAN DEFAULT NULL,
+    filter_is_active BOOLEAN DEFAULT TRUE,
+    search_query TEXT DEFAULT NULL,
+    filter_owner_id BIGINT DEFAULT NULL,
+    filter_level TEXT DEFAULT NULL
+)
+RETURNS BIGINT AS $$
+DECLARE
+    count_query TEXT;
+    query_plan JSON;
+BEGIN
+
+    -- Filters are inlined as quoted literals so the planner can use the column statistics
+    count_query := format($query$
+        SELECT 1
+        FROM course_course c
+        WHERE
+            c.is_active = %1$L
+            AND (%2$L IS NULL OR c.title ILIKE '%%' || %2$L || '%%')
+            AND (%3$L IS NULL OR c.mode ILIKE '%%' || %3$L || '%%')
+            AND (%4$L IS NULL OR c.level ILIKE '%%' || %4$L || '%%')
+            AND (%5$L IS NULL OR c.is_paid = %5$L)
+            AND (%6$L IS NULL OR c.fk_owner_id = %6$L)
+            AND (
+                %7$L IS NULL
+                OR c.search_vector @@ course_search_tsquery(%7$L)
+                OR c.title ILIKE '%%' || %7$L || '%%'
+                OR c.description ILIKE '%%' || %7$L || '%%'
+            )
+    $query$, filter_is_active, filter_title, filter_mode, filter_level, filter_is_paid, filter_owner_id, search_query);
+
+    EXECUTE 'EXPLAIN (FORMAT JSON) ' || count_query INTO query_plan;
+
+    RETURN (query_plan -> 0 -> 'Plan' ->> 'Plan Rows')::BIGINT;
+
+END;
+
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,159 @@
+/*****************************************************
+Author: Muhammad Hassaan Bashir
+Ticket:
+Description: This function will return one page of courses using keyset (cursor) pagination.
+             Instead of skipping OFFSET rows it seeks past the last row of the previous page using
+             its sort value and id, so deep pages cost the same as the first one.
+             search_query matches the full text search document (see course migration 0009) or a title /
+             description substring, sort_field 'relevance' ranks the matches.
+
+Params: page_size, filters (same as courses_list_with_pagination_get), sort_field, sort_direction,
+        cursor_value (sort value of the last row of the previous page, as text),
+        cursor_id (id of the last row of the previous page)
+*****************************************************/
+
+-- Drop the function if it already exists
+DROP FUNCTION IF EXISTS courses_list_with_cursor_get(INT, TEXT, TEXT, BOOLEAN, BOOLEAN, TEXT, TEXT, TEXT, BIGINT, TEXT, TEXT, BIGINT);
+
+-- Create or replace the function
+CREATE OR REPLACE FUNCTION courses_list_with_cursor_get(
+    page_size INT DEFAULT 10,
+    filter_title TEXT DEFAULT NULL,
+    filter_mode TEXT DEFAULT NULL,
+    filter_is_paid BOOLEAN DEFAULT NULL,
+    filter_is_active BOOLEAN DEFAULT TRUE,
+    search_query TEXT DEFAULT NULL,
+    sort_field TEXT DEFAULT 'created_at',  -- Default sort by creation date
+    sort_direction TEXT DEFAULT 'DESC',   -- Default sort direction is descending
+    filter_owner_id BIGINT DEFAULT NULL,   -- Filter by owner ID
+    filter_level TEXT DEFAULT NULL,
+    cursor_value TEXT DEFAULT NULL,        -- Sort value of the last row already returned
+    cursor_id BIGINT DEFAULT NULL          -- Id of the last row already returned
+)
+
+RETURNS TABLE (
+    course_id BIGINT,
+    title character varying,
+    description TEXT,
+    is_paid BOOLEAN,
+    price FLOAT,
+    mode character varying,
+    level character varying,
+    avg_rating FLOAT,
+    is_active BOOLEAN,
+    owner_name TEXT,
+    updated_by_name TEXT,
+    owner BIGINT,
+    created_at TIMESTAMPTZ,
+    updated_at TIMESTAMPTZ,
+    enrollment_count BIGINT,
+    sort_value TEXT
+) AS $$
+DECLARE
+    sort_expr TEXT;
+    sort_type TEXT;
+    sort_dir TEXT;
+    seek_op TEXT;
+BEGIN
+
+    -- Relevance only means something when searching, otherwise list the newest courses first
+    IF sort_field = 'relevance' AND NULLIF(search_query, '') IS NULL THEN
+        sort_field := 'created_at';
+    END IF;
+
+    -- Resolve the sort column and the type its cursor value must be cast back to
+    CASE COALESCE(NULLIF(sort_field, ''), 'created_at')
+        WHEN 'course_id' THEN sort_expr := 'c.id'; sort_type := 'BIGINT';
+        WHEN 'title' THEN sort_expr := 'c.title'; sort_type := 'VARCHAR';
+        WHEN 'price' THEN sort_expr := 'COALESCE(c.price, 0.0)'; sort_type := 'FLOAT';
+        WHEN 'avg_rating' THEN sort_expr := 'c.avg_rating'; sort_type := 'FLOAT';
+        WHEN 'created_at' THEN sort_expr := 'c.created_at'; sort_type := 'TIMESTAMPTZ';
+        WHEN 'updated_at' THEN sort_expr := 'c.updated_at'; sort_type := 'TIMESTAMPTZ';
+        WHEN 'enrollment_count' THEN sort_expr := 'c.enrollment_count'; sort_type := 'INTEGER';
+        -- Relevance: full text rank of the search document plus the trigram similarity of the title
+        WHEN 'relevance' THEN
+            sort_expr := '(ts_rank_cd(c.search_vector, course_search_tsquery($7)) + similarity(c.title, $7))::FLOAT8';
+            sort_type := 'FLOAT';
+        ELSE RAISE EXCEPTION 'Unsupported sort field for cursor pagination: %', sort_field;
+    END CASE;
+
+    IF UPPER(COALESCE(sort_direction, '')) = 'ASC' THEN
+        sort_dir := 'ASC';
+        seek_op := '>';
+    ELSE
+        sort_dir := 'DESC';
+        seek_op := '<';
+    END IF;
+
+    -- The seek predicate and ORDER BY use the same (sort column, id) pair so the
+    -- (is_active, <sort column>, id) indexes on course_course can serve the page directly
+    RETURN QUERY EXECUTE format($query$
+        SELECT
+            c.id AS course_id,
+            c.title,
+            c.description,
+            c.is_paid,
+            c.price,
+            c.mode,
+            c.level,
+            c.avg_rating,
+            c.is_active,
+            COALESCE(
+                CASE
+                    WHEN owner_user.first_name IS NOT NULL OR owner_user.last_name IS NOT NULL
+                    THEN CONCAT(
+                        COALESCE(owner_user.first_name, ''),
+                        CASE WHEN owner_user.first_name IS NOT NULL AND owner_user.last_name IS NOT NULL THEN ' ' ELSE '' END,
+                        COALESCE(owner_user.last_name, '')
+                    )
+                    ELSE 'NA'
+                END,
+                'NA'
+            ) AS owner_name,
+            COALESCE(
+                CASE
+                    WHEN updated_user.first_name IS NOT NULL OR updated_user.last_name IS NOT NULL
+                    THEN CONCAT(
+                        COALESCE(updated_user.first_name, ''),
+                        CASE WHEN updated_user.first_name IS NOT NULL AND updated_user.last_name IS NOT NULL THEN ' ' ELSE '' END,
+                        COALESCE(updated_user.last_name, '')
+                    )
+                    ELSE ''
+                END,
+                ''
+            ) AS updated_by_name,
+            c.fk_owner_id AS owner,
+            c.created_at,
+            c.updated_at,
+            c.enrollment_count::BIGINT AS enrollment_count,
+            (%1$s)::TEXT AS sort_value
+        FROM
+            course_course c
+        LEFT JOIN
+            "User_user" owner_user ON c.fk_owner_id = owner_user.id
+        LEFT JOIN
+            "User_user" updated_user ON c.modified_by = updated_user.id
+        WHERE
+            c.is_active = $1
+            AND ($2 IS NULL OR c.title ILIKE '%%' || $2 || '%%')
+            AND ($3 IS NULL OR c.mode ILIKE '%%' || $3 || '%%')
+            AND ($4 IS NULL OR c.level ILIKE '%%' || $4 || '%%')
+            AND ($5 IS NULL OR c.is_paid = $5)
+            AND ($6 IS NULL OR c.fk_owner_id = $6)
+            AND (
+                $7 IS NULL
+                OR c.search_vector @@ course_search_tsquery($7)
+                OR c.title ILIKE '%%' || $7 || '%%'
+                OR c.description ILIKE '%%' || $7 || '%%'
+            )
+            AND ($9 IS NULL OR (%1$s, c.id) %2$s ($8::%3$s, $9))
+        ORDER BY
+            %1$s %4$s, c.id %4$s
+        LIMIT $10
+    $query$, sort_expr, seek_op, sort_type, sort_dir)
+    USING filter_is_active, filter_title, filter_mode, filter_level, filter_is_paid,
+          filter_owner_id, search_query, cursor_value, cursor_id, page_size;
+
+END;
+
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,159 @@
+/*****************************************************
+Author: Muhammad Hassaan Bashir
+Ticket:
+Description: This function will return all courses with sorting and filtering options, including owner-specific filtering and the updated by user name.
+             The page and the total count of matching courses are computed in a single pass over course_course
+             (COUNT(*) OVER ()), enrollment_count is read from the trigger-maintained course_course counter.
+             Pass with_total = FALSE to skip the count entirely (e.g. when the caller uses courses_count_estimate_get).
+             search_query matches the full text search document (see course migration 0009) or a title /
+             description substring, sort_field 'relevance' ranks the matches.
+*****************************************************/
+
+-- Drop the function if it already exists
+DROP FUNCTION IF EXISTS courses_list_with_pagination_get(INT, INT, TEXT, TEXT, BOOLEAN, BOOLEAN, TEXT, TEXT, TEXT, BIGINT, TEXT);
+DROP FUNCTION IF EXISTS courses_list_with_pagination_get(INT, INT, TEXT, TEXT, BOOLEAN, BOOLEAN, TEXT, TEXT, TEXT, BIGINT, TEXT, BOOLEAN);
+
+-- Create or replace the function
+CREATE OR REPLACE FUNCTION courses_list_with_pagination_get(
+    page_num INT DEFAULT 1,
+    page_size INT DEFAULT 10,
+    filter_title TEXT DEFAULT NULL,
+    filter_mode TEXT DEFAULT NULL,
+    filter_is_paid BOOLEAN DEFAULT NULL,
+    filter_is_active BOOLEAN DEFAULT TRUE,
+    search_query TEXT DEFAULT NULL,
+    sort_field TEXT DEFAULT 'created_at',  -- Default sort by creation date
+    sort_direction TEXT DEFAULT 'DESC',   -- Default sort direction is descending
+    filter_owner_id BIGINT DEFAULT NULL,   -- Filter by owner ID
+    filter_level TEXT DEFAULT NULL,
+    with_total BOOLEAN DEFAULT TRUE        -- Compute the exact total count of matching courses
+)
+
+RETURNS TABLE (
+    course_id BIGINT,
+    title character varying,
+    description TEXT,
+    is_paid BOOLEAN,
+    price FLOAT,
+    mode character varying,
+    level character varying,
+    avg_rating FLOAT,
+    is_active BOOLEAN,
+    owner_name TEXT,
+    updated_by_name TEXT,
+    owner BIGINT,
+    created_at TIMESTAMPTZ,
+    updated_at TIMESTAMPTZ,
+    enrollment_count BIGINT,
+    total_count BIGINT
+) AS $$
+DECLARE
+    sort_expr TEXT;
+    sort_dir TEXT;
+BEGIN
+
+    -- Relevance only means something when searching, otherwise list the newest courses first
+    IF sort_field = 'relevance' AND NULLIF(search_query, '') IS NULL THEN
+        sort_field := 'created_at';
+    END IF;
+
+    -- Resolve the sort column, unknown fields fall back to the creation date
+    CASE COALESCE(NULLIF(sort_field, ''), 'created_at')
+        WHEN 'course_id' THEN sort_expr := 'c.id';
+        WHEN 'title' THEN sort_expr := 'c.title';
+        WHEN 'mode' THEN sort_expr := 'c.mode';
+        WHEN 'price' THEN sort_expr := 'COALESCE(c.price, 0.0)';
+        WHEN 'avg_rating' THEN sort_expr := 'c.avg_rating';
+        WHEN 'updated_at' THEN sort_expr := 'c.updated_at';
+        -- Relevance: full text rank of the search document plus the trigram similarity of the title
+        WHEN 'relevance' THEN
+            sort_expr := '(ts_rank_cd(c.search_vector, course_search_tsquery($7)) + similarity(c.title, $7))::FLOAT8';
+        WHEN 'enrollment_count' THEN sort_expr := 'c.enrollment_count';
+        ELSE sort_expr := 'c.created_at';
+    END CASE;
+
+    sort_dir := CASE WHEN UPPER(COALESCE(sort_direction, '')) = 'ASC' THEN 'ASC' ELSE 'DESC' END;
+
+    -- The page CTE only touches course_course: it filters, counts (window) and sorts the
+    -- matching courses once, then the joins run for the page rows only
+    RETURN QUERY EXECUTE format($query$
+        WITH page AS (
+            SELECT
+                c.id,
+                %3$s AS total_count,
+                ROW_NUMBER() OVER (ORDER BY %1$s %2$s, c.id %2$s) AS position
+            FROM
+                course_course c
+            WHERE
+                c.is_active = $1
+                AND ($2 IS NULL OR c.title ILIKE '%%' || $2 || '%%')
+                AND ($3 IS NULL OR c.mode ILIKE '%%' || $3 || '%%')
+                AND ($4 IS NULL OR c.level ILIKE '%%' || $4 || '%%')
+                AND ($5 IS NULL OR c.is_paid = $5)
+                AND ($6 IS NULL OR c.fk_owner_id = $6)
+                AND (
+                    $7 IS NULL
+                    OR c.search_vector @@ course_search_tsquery($7)
+                    OR c.title ILIKE '%%' || $7 || '%%'
+                    OR c.description ILIKE '%%' || $7 || '%%'
+                )
+            ORDER BY
+                %1$s %2$s, c.id %2$s
+            LIMIT $8 OFFSET $9
+        )
+        SELECT
+            c.id AS course_id,
+            c.title,
+            c.description,
+            c.is_paid,
+            c.price,
+            c.mode,
+            c.level,
+            c.avg_rating,
+            c.is_active,
+            COALESCE(
+                CASE
+                    WHEN owner_user.first_name IS NOT NULL OR owner_user.last_name IS NOT NULL
+                    THEN CONCAT(
+                        COALESCE(owner_user.first_name, ''),
+                        CASE WHEN owner_user.first_name IS NOT NULL AND owner_user.last_name IS NOT NULL THEN ' ' ELSE '' END,
+                        COALESCE(owner_user.last_name, '')
+                    )
+                    ELSE 'NA'
+                END,
+                'NA'
+            ) AS owner_name,
+            COALESCE(
+                CASE
+                    WHEN updated_user.first_name IS NOT NULL OR updated_user.last_name IS NOT NULL
+                    THEN CONCAT(
+                        COALESCE(updated_user.first_name, ''),
+                        CASE WHEN updated_user.first_name IS NOT NULL AND updated_user.last_name IS NOT NULL THEN ' ' ELSE '' END,
+                        COALESCE(updated_user.last_name, '')
+                    )
+                    ELSE ''
+                END,
+                ''
+            ) AS updated_by_name,
+            c.fk_owner_id AS owner,
+            c.created_at,
+            c.updated_at,
+            c.enrollment_count::BIGINT AS enrollment_count,
+            page.total_count
+        FROM
+            page
+        INNER JOIN
+            course_course c ON c.id = page.id
+        LEFT JOIN
+            "User_user" owner_user ON c.fk_owner_id = owner_user.id
+        LEFT JOIN
+            "User_user" updated_user ON c.modified_by = updated_user.id
+        ORDER BY
+            page.position
+    $query$, sort_expr, sort_dir, CASE WHEN with_total THEN 'COUNT(*) OVER ()' ELSE 'NULL::BIGINT' END)
+    USING filter_is_active, filter_title, filter_mode, filter_level, filter_is_paid,
+          filter_owner_id, search_query, page_size, (page_num - 1) * page_size;
+
+END;
+
+$$ LANGUAGE plpgsql;
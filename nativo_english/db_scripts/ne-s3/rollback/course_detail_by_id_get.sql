@@ -0,0 +1,11 @@
+/*****************************************************
+Author: Hadiya Kashif
+Ticket: https://app.clickup.com/t/868axzz4x
+Description: Rollback of function course_detail_by_id_get (enrollment counter version),
+             redeploy ne-s2/deploy/course_detail_by_id_get.sql afterwards to restore the previous version
+
+Params: course_id, owner_id
+*****************************************************/
+
+-- Drop the function if it already exists
+DROP FUNCTION IF EXISTS course_detail_by_id_get(INT, BIGINT);
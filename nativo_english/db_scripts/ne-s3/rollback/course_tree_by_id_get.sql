@@ -0,0 +1,8 @@
+/*****************************************************
+Author: Muhammad Hassaan Bashir
+Ticket: 
+Description: Rollback of function course_tree_by_id_get
+*****************************************************/
+
+-- Drop the function if it already exists
+DROP FUNCTION IF EXISTS course_tree_by_id_get(BIGINT, TEXT, TEXT, BIGINT);
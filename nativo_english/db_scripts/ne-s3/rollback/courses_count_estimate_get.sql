@@ -0,0 +1,8 @@
+/*****************************************************
+Author: Muhammad Hassaan Bashir
+Ticket: 
+Description: Rollback of function courses_count_estimate_get
+*****************************************************/
+
+-- Drop the function if it already exists
+DROP FUNCTION IF EXISTS courses_count_estimate_get(TEXT, TEXT, BOOLEAN, BOOLEAN, TEXT, BIGINT, TEXT);
@@ -0,0 +1,8 @@
+/*****************************************************
+Author: Muhammad Hassaan Bashir
+Ticket: 
+Description: Rollback of function courses_list_with_cursor_get
+*****************************************************/
+
+-- Drop the function if it already exists
+DROP FUNCTION IF EXISTS courses_list_with_cursor_get(INT, TEXT, TEXT, BOOLEAN, BOOLEAN, TEXT, TEXT, TEXT, BIGINT, TEXT, TEXT, BIGINT);
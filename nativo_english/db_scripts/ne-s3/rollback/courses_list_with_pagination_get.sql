@@ -0,0 +1,9 @@
+/*****************************************************
+Author: Muhammad Hassaan Bashir
+Ticket: 
+Description: Rollback of function courses_list_with_pagination_get (single pass version),
+             redeploy ne-s2/deploy/courses_list_with_pagination_get.sql afterwards to restore the previous version
+*****************************************************/
+
+-- Drop the function if it already exists
+DROP FUNCTION IF EXISTS courses_list_with_pagination_get(INT, INT, TEXT, TEXT, BOOLEAN, BOOLEAN, TEXT, TEXT, TEXT, BIGINT, TEXT, BOOLEAN);
@@ -1,3 +1,4 @@
+import hashlib
 import os
 from django.core.management.base import BaseCommand
 from django.conf import settings
@@ -5,22 +6,20 @@ from nativo_english.db_scripts_automate.models import ExecutedSQLScript
 import glob
 import time
 from django.db import connection
+from django.db.migrations.loader import MigrationLoader
 
 class Command(BaseCommand):
     help = 'Automatically generates migration file for running SQL scripts'
 
     def handle(self, *args, **kwargs):
-        # Fetch all migrations from the database
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT app, name FROM django_migrations WHERE app = 'db_scripts_automate' ORDER BY app, name ")
-            all_migrations = cursor.fetchall()  # Returns a list of (app_name, migration_name)
-
-        # Format dependencies as a Python list of tuples
-        formatted_dependencies = ",\n        ".join(
-            [f"('{app}', '{name}')" for app, name in all_migrations]
-        )
+        # Latest migration of the app on disk, the new one depends on it (migrations recorded in the
+        # database may have been squashed or removed since)
+        loader = MigrationLoader(connection, ignore_no_migrations=True)
+        leaf_migration = loader.graph.leaf_nodes('db_scripts_automate')[0]
+
+        formatted_dependencies = f"('{leaf_migration[0]}', '{leaf_migration[1]}')"
 
-        migration_counter = int(all_migrations[-1][1].split('_')[0])
+        migration_counter = int(leaf_migration[1].split('_')[0])
 
         # Define the directory for migration files inside the app
         migration_dir = os.path.join(
@@ -41,8 +40,8 @@ class Command(BaseCommand):
         
         db_scripts_folder = os.path.join(project_root, 'db_scripts', settings.BUILD_VERSION, 'deploy')
         
-        # Get all SQL files recursively in the deploy folder
-        sql_files = glob.glob(os.path.join(db_scripts_folder, '**', '*.sql'), recursive=True)
+        # Get all SQL files of the deploy folder
+        sql_files = sorted(glob.glob(os.path.join(db_scripts_folder, '*.sql')))
 
         # Debugging
         print(f"SQL Files Path: {db_scripts_folder}")
@@ -54,13 +53,15 @@ class Command(BaseCommand):
         
         scripts_count = len(sql_files)
         
-        # Check if any SQL file is not already executed
+        # Check if any SQL file is not already executed, or was edited since it was
         for sql_file in sql_files:
             file_name = os.path.basename(sql_file)  # Get the file name only
             build_number = settings.BUILD_VERSION  # Current build number from settings
+            with open(sql_file, 'rb') as file:
+                checksum = hashlib.sha256(file.read()).hexdigest()
         
-            # Check if an entry exists in the database for this file and build number
-            if ExecutedSQLScript.objects.filter(file_name=file_name, build_number=build_number).exists():
+            # Check if an entry exists in the database for this file, build number and content
+            if ExecutedSQLScript.objects.filter(file_name=file_name, build_number=build_number, checksum=checksum).exists():
                 # If any file is not executed, return True (migration file should be created)
                 scripts_count = scripts_count - 1
         
@@ -68,8 +69,10 @@ class Command(BaseCommand):
             print("NO MIGRATION FILE REQUIRED FOR DB SCIRPTS")
             return
         
-        # Generate a unique migration file name (e.g., with timestamp)
-        migration_file_name = f"{(migration_counter+1):04}_auto_run_sql_scripts.py"
+        # Generate a unique migration file name, carrying the build so it never matches the name of a
+        # removed migration a database recorded as applied
+        build_suffix = settings.BUILD_VERSION.replace('-', '_')
+        migration_file_name = f"{(migration_counter+1):04}_auto_run_sql_scripts_{build_suffix}.py"
         migration_file_path = os.path.join(migration_dir, migration_file_name)
 
         # Write migration content
@@ -77,44 +80,51 @@ class Command(BaseCommand):
 # Generated migration to run SQL scripts
 
 from django.db import migrations
-from django.conf import settings
+from django.utils import timezone
+import hashlib
 import os
 import glob
-from nativo_english.db_scripts_automate.models import ExecutedSQLScript
+
+# Build whose scripts this migration runs, pinned at generation time so a fresh
+# database replays every build in order instead of only the current one
+BUILD_VERSION = '{settings.BUILD_VERSION}'
 
 def run_sql_scripts(apps, schema_editor):
+    ExecutedSQLScript = apps.get_model('db_scripts_automate', 'ExecutedSQLScript')
 
     project_root = os.path.dirname(os.path.dirname(
             os.path.dirname(__file__)
         ))
-    # Path to the db_scripts folder from settings.py
-    db_scripts_folder = os.path.join(project_root, 'db_scripts', settings.BUILD_VERSION, 'deploy')
+    # Path to the db_scripts folder of the pinned build
+    db_scripts_folder = os.path.join(project_root, 'db_scripts', BUILD_VERSION, 'deploy')
 
     print(db_scripts_folder)
-    # Get all SQL files recursively in the deploy folder
-    sql_files = glob.glob(os.path.join(db_scripts_folder, '*.sql'), recursive=True)
+    # Get all SQL files of the deploy folder
+    sql_files = sorted(glob.glob(os.path.join(db_scripts_folder, '*.sql')))
     
     print(sql_files)
     
     for sql_file in sql_files:
-        # Check if this script has already been executed
-        if not ExecutedSQLScript.objects.filter(file_name=os.path.basename(sql_file), build_number=settings.BUILD_VERSION).exists():
-            # Check if file exists before reading
-            if not os.path.exists(sql_file):
-                print("SQL file not found: " + sql_file)
-                continue
-            
-            # Open the SQL file and read its content
-            with open(sql_file, 'r') as file:
-                sql_script = file.read()
-
-            # Execute SQL script
-            with schema_editor.connection.cursor() as cursor:
-                cursor.execute(sql_script)
-
-            # Mark the script as executed by adding an entry to the database
-            ExecutedSQLScript.objects.create(file_name=os.path.basename(sql_file), build_number=settings.BUILD_VERSION)
-            print("Executed SQL script: " + os.path.basename(sql_file))
+        file_name = os.path.basename(sql_file)
+
+        # Open the SQL file and read its content
+        with open(sql_file, 'rb') as file:
+            sql_script = file.read()
+        checksum = hashlib.sha256(sql_script).hexdigest()
+
+        # Skip the scripts already executed with this exact content, edited ones run again
+        executed = ExecutedSQLScript.objects.filter(file_name=file_name, build_number=BUILD_VERSION)
+        if executed.filter(checksum=checksum).exists():
+            continue
+
+        # Execute SQL script
+        with schema_editor.connection.cursor() as cursor:
+            cursor.execute(sql_script.decode('utf-8'))
+
+        # Mark the script as executed (with its content hash) in the database
+        if not executed.update(checksum=checksum, executed_at=timezone.now()):
+            ExecutedSQLScript.objects.create(file_name=file_name, build_number=BUILD_VERSION, checksum=checksum)
+        print("Executed SQL script: " + file_name)
 
 class Migration(migrations.Migration):
 
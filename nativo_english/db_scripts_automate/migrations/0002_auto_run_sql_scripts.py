@@ -5,15 +5,19 @@ from django.db import migrations
 from django.conf import settings
 import os
 import glob
-from nativo_english.db_scripts_automate.models import ExecutedSQLScript
+
+# Build whose scripts this migration runs, pinned at generation time so a fresh
+# database replays every build in order instead of only the current one
+BUILD_VERSION = 'ne-s2'
 
 def run_sql_scripts(apps, schema_editor):
+    ExecutedSQLScript = apps.get_model('db_scripts_automate', 'ExecutedSQLScript')
 
     project_root = os.path.dirname(os.path.dirname(
             os.path.dirname(__file__)
         ))
-    # Path to the db_scripts folder from settings.py
-    db_scripts_folder = os.path.join(project_root, 'db_scripts', settings.BUILD_VERSION, 'deploy')
+    # Path to the db_scripts folder of the pinned build
+    db_scripts_folder = os.path.join(project_root, 'db_scripts', BUILD_VERSION, 'deploy')
 
     print(db_scripts_folder)
     # Get all SQL files recursively in the deploy folder
@@ -23,7 +27,7 @@ def run_sql_scripts(apps, schema_editor):
     
     for sql_file in sql_files:
         # Check if this script has already been executed
-        if not ExecutedSQLScript.objects.filter(file_name=os.path.basename(sql_file), build_number=settings.BUILD_VERSION).exists():
+        if not ExecutedSQLScript.objects.filter(file_name=os.path.basename(sql_file), build_number=BUILD_VERSION).exists():
             # Check if file exists before reading
             if not os.path.exists(sql_file):
                 print("SQL file not found: " + sql_file)
@@ -38,7 +42,7 @@ def run_sql_scripts(apps, schema_editor):
                 cursor.execute(sql_script)
 
             # Mark the script as executed by adding an entry to the database
-            ExecutedSQLScript.objects.create(file_name=os.path.basename(sql_file), build_number=settings.BUILD_VERSION)
+            ExecutedSQLScript.objects.create(file_name=os.path.basename(sql_file), build_number=BUILD_VERSION)
             print("Executed SQL script: " + os.path.basename(sql_file))
 
 class Migration(migrations.Migration):
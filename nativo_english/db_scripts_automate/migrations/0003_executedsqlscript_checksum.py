@@ -0,0 +1,18 @@
+# Generated by Django 5.1.2 on 2026-10-18 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db_scripts_automate', '0002_auto_run_sql_scripts'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='executedsqlscript',
+            name='checksum',
+            field=models.CharField(blank=True, default='', max_length=64),
+        ),
+    ]
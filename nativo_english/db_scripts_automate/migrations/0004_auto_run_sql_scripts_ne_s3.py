@@ -0,0 +1,59 @@
+
+# Generated migration to run SQL scripts
+
+from django.db import migrations
+from django.utils import timezone
+import hashlib
+import os
+import glob
+
+# Build whose scripts this migration runs, pinned at generation time so a fresh
+# database replays every build in order instead of only the current one
+BUILD_VERSION = 'ne-s3'
+
+def run_sql_scripts(apps, schema_editor):
+    ExecutedSQLScript = apps.get_model('db_scripts_automate', 'ExecutedSQLScript')
+
+    project_root = os.path.dirname(os.path.dirname(
+            os.path.dirname(__file__)
+        ))
+    # Path to the db_scripts folder of the pinned build
+    db_scripts_folder = os.path.join(project_root, 'db_scripts', BUILD_VERSION, 'deploy')
+
+    print(db_scripts_folder)
+    # Get all SQL files of the deploy folder
+    sql_files = sorted(glob.glob(os.path.join(db_scripts_folder, '*.sql')))
+    
+    print(sql_files)
+    
+    for sql_file in sql_files:
+        file_name = os.path.basename(sql_file)
+
+        # Open the SQL file and read its content
+        with open(sql_file, 'rb') as file:
+            sql_script = file.read()
+        checksum = hashlib.sha256(sql_script).hexdigest()
+
+        # Skip the scripts already executed with this exact content, edited ones run again
+        executed = ExecutedSQLScript.objects.filter(file_name=file_name, build_number=BUILD_VERSION)
+        if executed.filter(checksum=checksum).exists():
+            continue
+
+        # Execute SQL script
+        with schema_editor.connection.cursor() as cursor:
+            cursor.execute(sql_script.decode('utf-8'))
+
+        # Mark the script as executed (with its content hash) in the database
+        if not executed.update(checksum=checksum, executed_at=timezone.now()):
+            ExecutedSQLScript.objects.create(file_name=file_name, build_number=BUILD_VERSION, checksum=checksum)
+        print("Executed SQL script: " + file_name)
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db_scripts_automate', '0003_executedsqlscript_checksum'),
+    ]
+
+    operations = [
+        migrations.RunPython(run_sql_scripts),
+    ]
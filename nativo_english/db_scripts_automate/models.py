@@ -4,4 +4,6 @@ from django.db import models
 class ExecutedSQLScript(models.Model):
     file_name = models.CharField(max_length=255)
     executed_at = models.DateTimeField(auto_now_add=True)
-    build_number = models.CharField()
\ No newline at end of file
+    build_number = models.CharField()
+    # sha256 of the script as it was run, an edited script runs again on the next migration
+    checksum = models.CharField(max_length=64, blank=True, default='')
\ No newline at end of file
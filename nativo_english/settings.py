@@ -47,6 +47,15 @@ SENDGRID_DEFAULT_FROM_EMAIL=env('SENDGRID_DEFAULT_FROM_EMAIL')
 SENDGRID_INFO_FROM_EMAIL=env('SENDGRID_INFO_FROM_EMAIL')
 SENDGRID_NOTIFY_FROM_EMAIL=env('SENDGRID_NOTIFY_FROM_EMAIL')
 SENDGRID_API_KEY=env('SENDGRID_API_KEY')
+# Point to a fake server (manage.py run_fake_sendgrid) to send nothing for real
+SENDGRID_API_URL=env('SENDGRID_API_URL', default='https://api.sendgrid.com')
+# Keep-alive connections per process, enough for the threads of a uWSGI worker or a threads/gevent pool
+SENDGRID_POOL_SIZE=env.int('SENDGRID_POOL_SIZE', default=20)
+SENDGRID_TIMEOUT=env.float('SENDGRID_TIMEOUT', default=10)
+# Users per chunk (one COPY and one email task each) of the notification fan-out (see api/shared/notifications/fanout.py)
+NOTIFICATION_FANOUT_CHUNK_SIZE = env.int('NOTIFICATION_FANOUT_CHUNK_SIZE', default=5000)
+# HTML email templates compiled by the workers at startup (see api/shared/notifications/email_templates.py)
+EMAIL_TEMPLATES_DIR = BASE_DIR / 'emails_templates'
 
 TIME_ZONE = 'UTC'  # Or your desired timezone
 USE_TZ = True
@@ -63,6 +72,88 @@ CELERY_ENABLE_UTC = True
 CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
 
+# Task routing: time sensitive emails (OTP, password reset) go through their own queue, served by a
+# dedicated worker (see Dockerfile), so campaigns piling up in the bulk queue never delay them
+CELERY_TASK_DEFAULT_QUEUE = 'default'
+CELERY_TASK_ROUTES = {
+    'nativo_english.api.shared.notifications.tasks.send_otp_email': {'queue': 'priority'},
+    'nativo_english.api.shared.notifications.tasks.flush_email_outbox_task': {'queue': 'priority'},
+    'nativo_english.api.shared.notifications.tasks.send_template_email_to_many': {'queue': 'bulk'},
+    'nativo_english.api.shared.notifications.tasks.fan_out_notification_task': {'queue': 'bulk'},
+    'nativo_english.api.shared.notifications.tasks.send_notification_emails': {'queue': 'bulk'},
+    'nativo_english.api.shared.user.tasks.import_users_task': {'queue': 'imports'},
+    'nativo_english.api.shared.tasks.export_dataset_task': {'queue': 'imports'},
+    'nativo_english.api.shared.tasks.purge_expired_exports_task': {'queue': 'imports'},
+}
+
+# Worker processes (prefork), one per CPU unless CELERY_WORKER_CONCURRENCY is set. The email tasks also
+# query the database, and psycopg2 is not patched for gevent (no psycogreen), so a green pool would
+# block on every query. One task reserved per slot so a busy worker does not hold messages another
+# could run
+CELERY_WORKER_POOL = env('CELERY_WORKER_POOL', default='prefork')
+CELERY_WORKER_CONCURRENCY = env.int('CELERY_WORKER_CONCURRENCY', default=0)
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1
+
+# Seconds from publish to completion a task of each queue should stay under (see api/shared/task_metrics.py)
+CELERY_QUEUE_LATENCY_TARGETS = {
+    'priority': env.float('CELERY_PRIORITY_LATENCY_TARGET', default=5.0),
+    'default': env.float('CELERY_DEFAULT_LATENCY_TARGET', default=60.0),
+    'bulk': env.float('CELERY_BULK_LATENCY_TARGET', default=600.0),
+}
+
+# Periodic tasks, synced into the django-celery-beat tables when beat starts
+CELERY_BEAT_SCHEDULER = 'django_celery_beat.schedulers:DatabaseScheduler'
+CELERY_BEAT_SCHEDULE = {
+    'purge-expired-auth-rows': {
+        'task': 'nativo_english.api.shared.auth.tasks.purge_expired_auth_rows_task',
+        'schedule': timedelta(hours=1),
+    },
+    'flush-email-outbox': {
+        'task': 'nativo_english.api.shared.notifications.tasks.flush_email_outbox_task',
+        'schedule': timedelta(seconds=30),
+    },
+    'purge-email-outbox': {
+        'task': 'nativo_english.api.shared.notifications.tasks.purge_email_outbox_task',
+        'schedule': timedelta(hours=1),
+    },
+    'purge-expired-exports': {
+        'task': 'nativo_english.api.shared.tasks.purge_expired_exports_task',
+        'schedule': timedelta(hours=1),
+    },
+}
+
+# Email outbox flusher (see api/shared/notifications/outbox.py): emails claimed per batch, batches per
+# run and seconds between two batches, i.e. the rate bursts are drained at
+EMAIL_OUTBOX_BATCH_SIZE = env.int('EMAIL_OUTBOX_BATCH_SIZE', default=100)
+EMAIL_OUTBOX_MAX_BATCHES = env.int('EMAIL_OUTBOX_MAX_BATCHES', default=50)
+EMAIL_OUTBOX_BATCH_PAUSE = env.float('EMAIL_OUTBOX_BATCH_PAUSE', default=0.0)
+# Days sent and failed emails stay in the outbox (stats, investigations) before the periodic purge
+EMAIL_OUTBOX_RETENTION_DAYS = env.int('EMAIL_OUTBOX_RETENTION_DAYS', default=7)
+
+# Bulk user imports (see api/shared/user/imports.py): where uploaded files wait for the worker, rows
+# validated and inserted per transaction, and processes hashing the passwords (0: one per core)
+USER_IMPORT_DIR = env('USER_IMPORT_DIR', default=str(BASE_DIR / 'user_imports'))
+USER_IMPORT_CHUNK_SIZE = env.int('USER_IMPORT_CHUNK_SIZE', default=1000)
+USER_IMPORT_HASH_WORKERS = env.int('USER_IMPORT_HASH_WORKERS', default=0)
+USER_IMPORT_MAX_FILE_SIZE = env.int('USER_IMPORT_MAX_FILE_SIZE', default=50 * 1024 * 1024)
+
+# Data exports (see api/shared/exports.py): where export jobs write their files and for how many hours
+# they are kept, and the estimated rows above which an export must run as a job instead of streaming
+# from a web worker. With EXPORT_ACCEL_REDIRECT_PREFIX set (an internal nginx location aliasing
+# EXPORT_DIR) downloads are handed to nginx through X-Accel-Redirect instead of read by uWSGI
+EXPORT_DIR = env('EXPORT_DIR', default=str(BASE_DIR / 'exports'))
+EXPORT_RETENTION_HOURS = env.int('EXPORT_RETENTION_HOURS', default=24)
+EXPORT_SYNC_MAX_ROWS = env.int('EXPORT_SYNC_MAX_ROWS', default=100000)
+EXPORT_ACCEL_REDIRECT_PREFIX = env('EXPORT_ACCEL_REDIRECT_PREFIX', default='')
+
+# Page of the frontend the password reset emails link to, with the uid and token as query parameters
+PASSWORD_RESET_URL = env('PASSWORD_RESET_URL', default='http://localhost:3000/reset-password')
+
+# Purge of expired OTP / token rows (see api/shared/auth/purge.py)
+AUTH_PURGE_BATCH_SIZE = env.int('AUTH_PURGE_BATCH_SIZE', default=1000)
+AUTH_PURGE_BATCH_PAUSE = env.float('AUTH_PURGE_BATCH_PAUSE', default=0.1)
+AUTH_PURGE_LOCK_TIMEOUT = env('AUTH_PURGE_LOCK_TIMEOUT', default='2s')
+
 # Application definition
 INSTALLED_APPS = [
     'django.contrib.admin',
@@ -71,10 +162,12 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'rest_framework',
     'rest_framework_simplejwt',
     'rest_framework_simplejwt.token_blacklist',
     'corsheaders',
+    'django_celery_beat',
 
     'parler',
     # 'drf_yasg',
@@ -113,15 +206,25 @@ PARLER_LANGUAGES = {
     },
 }
 
+# Build request.user from the access token claims instead of loading it from the database on every request,
+# suspensions and role changes are enforced through the cached revocation (see api/shared/auth/revocation.py)
+JWT_CLAIMS_USER = env.bool('JWT_CLAIMS_USER', default=False)
+
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'nativo_english.api.shared.auth.authentication.ClaimsUserJWTAuthentication'
+        if JWT_CLAIMS_USER else
+        'nativo_english.api.shared.auth.authentication.RequestCachedJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
     ),
     
     'EXCEPTION_HANDLER': 'nativo_english.api.shared.utils.api_exception_handler',
+    'DEFAULT_RENDERER_CLASSES': (
+        'nativo_english.api.shared.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
 }
 
@@ -161,6 +264,7 @@ SIMPLE_JWT = {
     'BLACKLIST_AFTER_ROTATION': True,
     'AUTH_TOKEN_CLASSES': ('rest_framework_simplejwt.tokens.AccessToken',),
     'TOKEN_TYPE_CLAIM': 'token_type',
+    'TOKEN_REFRESH_SERIALIZER': 'nativo_english.api.shared.auth.serializers.FilteredTokenRefreshSerializer',
 
     'ALGORITHM': 'HS256',  # Use HMAC SHA-256 algorithm
     'SIGNING_KEY': os.getenv('JWT_SECRET_KEY', 'your-secret-key'),
@@ -212,6 +316,38 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+
+# Shares the Redis instance of the Celery broker unless CACHE_REDIS_URL points elsewhere,
+# set CACHE_BACKEND=locmem (e.g. for tests) to use a per-process in-memory cache instead
+CACHE_BACKEND = env('CACHE_BACKEND', default='redis')
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': env('CACHE_REDIS_URL', default=CELERY_BROKER_URL),
+        'KEY_PREFIX': 'ne',
+        'TIMEOUT': 300,
+    } if CACHE_BACKEND == 'redis' else {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'nativo-english',
+    }
+}
+
+# Per worker Bloom filter in front of the refresh token blacklist (see api/shared/auth/blacklist.py),
+# sized for at least this many tokens (twice the blacklisted ones when more) and rebuilt once it holds more
+TOKEN_BLACKLIST_FILTER_CAPACITY = env.int('TOKEN_BLACKLIST_FILTER_CAPACITY', default=100000)
+TOKEN_BLACKLIST_FILTER_ERROR_RATE = env.float('TOKEN_BLACKLIST_FILTER_ERROR_RATE', default=0.001)
+
+# Where the 2FA one time passwords are kept: redis | orm (OTP table) | locmem (tests), see api/shared/auth/otp.py
+OTP_BACKEND = env('OTP_BACKEND', default='redis' if CACHE_BACKEND == 'redis' else 'locmem')
+OTP_REDIS_URL = env('OTP_REDIS_URL', default=CACHES['default'].get('LOCATION') if CACHE_BACKEND == 'redis' else CELERY_BROKER_URL)
+
+# Seconds a course detail stays cached, writes invalidate it before that (see api/shared/course/cache.py)
+COURSE_DETAIL_CACHE_TIMEOUT = env.int('COURSE_DETAIL_CACHE_TIMEOUT', default=300)
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -288,4 +424,4 @@ SECURE_SSL_REDIRECT = False
 
 SECURE_BROWSER_XSS_FILTER = True
 SECURE_CONTENT_TYPE_NOSNIFF = True
-BUILD_VERSION = 'ne-s2'
+BUILD_VERSION = 'ne-s3'